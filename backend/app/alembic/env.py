@@ -2,7 +2,8 @@ import os
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, engine_from_config, pool
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -33,6 +34,31 @@ def get_url():
     return str(settings.SQLALCHEMY_DATABASE_URI)
 
 
+def is_dry_run():
+    """`alembic -x dry_run=true upgrade head` prints the SQL instead of running
+    it, with the estimated lock impact of the app.core.migrations helpers."""
+    return context.get_x_argument(as_dictionary=True).get("dry_run") == "true"
+
+
+def current_revision():
+    """The revision the database is at, so a dry run only prints pending
+    migrations."""
+    connectable = create_engine(get_url(), poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        heads = MigrationContext.configure(connection).get_current_heads()
+    connectable.dispose()
+    return heads[0] if heads else None
+
+
+def set_timeouts():
+    """Fail fast instead of queueing behind long transactions, which would block
+    every query on the table while the migration waits for its lock."""
+    context.execute(f"SET lock_timeout = '{settings.MIGRATION_LOCK_TIMEOUT}'")
+    context.execute(
+        f"SET statement_timeout = '{settings.MIGRATION_STATEMENT_TIMEOUT}'"
+    )
+
+
 def run_migrations_offline():
     """Run migrations in 'offline' mode.
 
@@ -47,10 +73,16 @@ def run_migrations_offline():
     """
     url = get_url()
     context.configure(
-        url=url, target_metadata=target_metadata, literal_binds=True, compare_type=True
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        compare_type=True,
+        as_sql=True,
+        starting_rev=current_revision() if is_dry_run() else None,
     )
 
     with context.begin_transaction():
+        set_timeouts()
         context.run_migrations()
 
 
@@ -75,10 +107,11 @@ def run_migrations_online():
         )
 
         with context.begin_transaction():
+            set_timeouts()
             context.run_migrations()
 
 
-if context.is_offline_mode():
+if context.is_offline_mode() or is_dry_run():
     run_migrations_offline()
 else:
     run_migrations_online()
@@ -0,0 +1,67 @@
+"""Add full-text search vector and GIN index to items
+
+Revision ID: 5f2b8c7e4a91
+Revises: 1a31ce608336
+Create Date: 2026-10-18 23:55:12.204133
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core import migrations
+
+
+# revision identifiers, used by Alembic.
+revision = '5f2b8c7e4a91'
+down_revision = '1a31ce608336'
+branch_labels = None
+depends_on = None
+
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({row}description, '')), 'B')"
+)
+
+
+def upgrade():
+    # A plain nullable column is a catalog change, a generated column would
+    # rewrite the whole table under an ACCESS EXCLUSIVE lock
+    op.add_column(
+        'item', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True)
+    )
+    op.execute(
+        f"""
+        CREATE FUNCTION item_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER item_search_vector_update "
+        "BEFORE INSERT OR UPDATE OF title, description ON item "
+        "FOR EACH ROW EXECUTE FUNCTION item_search_vector_update()"
+    )
+    # Rows written from now on get their vector from the trigger
+    migrations.backfill(
+        'item',
+        f"search_vector = {SEARCH_VECTOR.format(row='')}",
+        'search_vector IS NULL',
+    )
+    migrations.create_index_concurrently(
+        'ix_item_search_vector',
+        'item',
+        ['search_vector'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    migrations.drop_index_concurrently('ix_item_search_vector', 'item')
+    op.execute('DROP TRIGGER IF EXISTS item_search_vector_update ON item')
+    op.execute('DROP FUNCTION IF EXISTS item_search_vector_update()')
+    op.drop_column('item', 'search_vector')
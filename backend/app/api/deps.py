@@ -4,10 +4,10 @@ from typing import Annotated
 import jwt
 from app.core import security
 from app.core.config import settings
-from app.core.db import engine
+from app.core.db import READ_PIN_COOKIE, engine, replica_router
 from app.core.logging import get_logger
 from app.models import TokenPayload, User
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
@@ -39,8 +39,8 @@ SessionDep = Annotated[Session, Depends(get_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
-    """Get the current user from the token."""
+def decode_token(token: str) -> TokenPayload:
+    """Validate the access token and return its payload."""
     logger.debug("Authenticating user from token")
     try:
         payload = jwt.decode(
@@ -54,14 +54,28 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
+    return token_data
 
-    user = session.get(User, token_data.sub)
+
+def check_active_user(user: User | None, token_data: TokenPayload) -> User:
+    """Reject tokens of users that are missing or inactive."""
     if not user:
         logger.warning(f"User not found for token subject: {token_data.sub}")
         raise HTTPException(status_code=404, detail="User not found")
     if not user.is_active:
         logger.warning(f"Inactive user attempted login: {user.id}")
         raise HTTPException(status_code=400, detail="Inactive user")
+    return user
+
+
+def get_current_user(session: SessionDep, token: TokenDep, response: Response) -> User:
+    """Get the current user from the token."""
+    token_data = decode_token(token)
+    user = check_active_user(session.get(User, token_data.sub), token_data)
+
+    # Lets commits on this session pin the user's reads to the primary
+    session.info["user_id"] = str(user.id)
+    session.info["response"] = response
 
     logger.info(f"User authenticated: {user.id}", extra={"user_id": str(user.id)})
     return user
@@ -70,8 +84,41 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
-def get_current_active_superuser(current_user: CurrentUser) -> User:
-    """Check if the current user is a superuser."""
+def get_read_db(token: TokenDep, request: Request) -> Generator[Session, None, None]:
+    """Get a read-only database session, served by a replica when available.
+
+    The replica is picked from the token and the read pin cookie alone, so no
+    primary connection is needed.
+    """
+    token_data = decode_token(token)
+    bind = replica_router.get_read_engine(
+        str(token_data.sub),
+        request.cookies.get(READ_PIN_COOKIE),
+    )
+    logger.debug(f"Creating read-only database session on {bind.url.host}")
+    with Session(bind) as session:
+        yield session
+
+
+ReadSessionDep = Annotated[Session, Depends(get_read_db)]
+
+
+def get_current_read_user(session: ReadSessionDep, token: TokenDep) -> User:
+    """Get the current user from the token through the read-only session."""
+    token_data = decode_token(token)
+    user = session.get(User, token_data.sub)
+    if user is None and session.get_bind() is not engine:
+        # A user who just signed up may not have reached the replica yet
+        with Session(engine) as primary_session:
+            user = primary_session.get(User, token_data.sub)
+    return check_active_user(user, token_data)
+
+
+ReadCurrentUser = Annotated[User, Depends(get_current_read_user)]
+
+
+def check_superuser(current_user: User) -> User:
+    """Check if the user is a superuser."""
     if not current_user.is_superuser:
         logger.warning(
             f"User {current_user.id} attempted to access superuser-only endpoint",
@@ -82,3 +129,13 @@ def get_current_active_superuser(current_user: CurrentUser) -> User:
         )
     logger.debug(f"Superuser access granted: {current_user.id}")
     return current_user
+
+
+def get_current_active_superuser(current_user: CurrentUser) -> User:
+    """Check if the current user is a superuser."""
+    return check_superuser(current_user)
+
+
+def get_current_active_read_superuser(current_user: ReadCurrentUser) -> User:
+    """Check if the current user, loaded for reading, is a superuser."""
+    return check_superuser(current_user)
@@ -1,18 +1,34 @@
+import base64
+import binascii
+import json
+import re
 import uuid
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy import Float, and_, cast, or_
+from sqlmodel import col, func, select
 
-from app.api.deps import CurrentUser, SessionDep
-from app.models import Item, ItemCreate, ItemPublic, ItemsPublic, ItemUpdate, Message
+from app.api.deps import CurrentUser, ReadCurrentUser, ReadSessionDep, SessionDep
+from app.models import (
+    Item,
+    ItemCreate,
+    ItemPublic,
+    ItemsPublic,
+    ItemsSearchPublic,
+    ItemUpdate,
+    Message,
+)
 
 router = APIRouter(prefix="/items", tags=["items"])
 
 
 @router.get("/", response_model=ItemsPublic)
 def read_items(
-    session: SessionDep, current_user: CurrentUser, skip: int = 0, limit: int = 100
+    session: ReadSessionDep,
+    current_user: ReadCurrentUser,
+    skip: int = 0,
+    limit: int = 100,
 ) -> Any:
     """
     Retrieve items.
@@ -41,8 +57,70 @@ def read_items(
     return ItemsPublic(data=items, count=count)
 
 
+def _to_prefix_tsquery(q: str) -> str | None:
+    """Turn free text into a tsquery matching all words, the last one as a prefix."""
+    terms = re.findall(r"\w+", q.lower())
+    if not terms:
+        return None
+    return " & ".join([*terms[:-1], f"{terms[-1]}:*"])
+
+
+def _encode_cursor(rank: float, id: uuid.UUID) -> str:
+    raw = json.dumps([rank, str(id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    try:
+        rank, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(rank), uuid.UUID(id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/search", response_model=ItemsSearchPublic)
+def search_items(
+    session: ReadSessionDep,
+    current_user: ReadCurrentUser,
+    q: Annotated[str, Query(min_length=1, max_length=255)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> Any:
+    """
+    Search items by title and description, best matches first.
+
+    Pass the returned `next_cursor` back as `cursor` to get the next page.
+    """
+    tsquery_text = _to_prefix_tsquery(q)
+    if tsquery_text is None:
+        return ItemsSearchPublic(data=[])
+
+    tsquery = func.to_tsquery("english", tsquery_text)
+    search_vector = col(Item.search_vector)
+    rank = cast(func.ts_rank(search_vector, tsquery), Float)
+    statement = select(Item, rank).where(search_vector.op("@@")(tsquery))
+    if not current_user.is_superuser:
+        statement = statement.where(Item.owner_id == current_user.id)
+    if cursor:
+        last_rank, last_id = _decode_cursor(cursor)
+        statement = statement.where(
+            or_(rank < last_rank, and_(rank == last_rank, col(Item.id) > last_id))
+        )
+    statement = statement.order_by(rank.desc(), col(Item.id)).limit(limit + 1)
+    rows = session.exec(statement).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_item, last_rank = rows[-1]
+        next_cursor = _encode_cursor(last_rank, last_item.id)
+    return ItemsSearchPublic(data=[item for item, _ in rows], next_cursor=next_cursor)
+
+
 @router.get("/{id}", response_model=ItemPublic)
-def read_item(session: SessionDep, current_user: CurrentUser, id: uuid.UUID) -> Any:
+def read_item(
+    session: ReadSessionDep, current_user: ReadCurrentUser, id: uuid.UUID
+) -> Any:
     """
     Get item by ID.
     """
@@ -2,39 +2,46 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import col, delete, func, select
+from sqlmodel import func, select
 
-from app import crud
+from app import crud, jobs
 from app.api.deps import (
     CurrentUser,
+    ReadCurrentUser,
+    ReadSessionDep,
     SessionDep,
+    get_current_active_read_superuser,
     get_current_active_superuser,
 )
 from app.core.config import settings
+from app.core.jobs import job_runner
 from app.core.security import get_password_hash, verify_password
 from app.models import (
-    Item,
+    JobPublic,
     Message,
     UpdatePassword,
     User,
     UserCreate,
     UserPublic,
     UserRegister,
+    UsersBulk,
+    UsersBulkResult,
+    UsersBulkRole,
     UsersPublic,
     UserUpdate,
     UserUpdateMe,
 )
-from app.utils import generate_new_account_email, send_email
+from app.utils import generate_new_account_email
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get(
     "/",
-    dependencies=[Depends(get_current_active_superuser)],
+    dependencies=[Depends(get_current_active_read_superuser)],
     response_model=UsersPublic,
 )
-def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
+def read_users(session: ReadSessionDep, skip: int = 0, limit: int = 100) -> Any:
     """
     Retrieve users.
     """
@@ -67,10 +74,14 @@ def create_user(*, session: SessionDep, user_in: UserCreate) -> Any:
         email_data = generate_new_account_email(
             email_to=user_in.email, username=user_in.email, password=user_in.password
         )
-        send_email(
-            email_to=user_in.email,
-            subject=email_data.subject,
-            html_content=email_data.html_content,
+        job_runner.submit(
+            session,
+            jobs.SEND_EMAIL,
+            {
+                "email_to": user_in.email,
+                "subject": email_data.subject,
+                "html_content": email_data.html_content,
+            },
         )
     return user
 
@@ -155,16 +166,101 @@ def register_user(session: SessionDep, user_in: UserRegister) -> Any:
     return user
 
 
+@router.post(
+    "/bulk/activate",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=UsersBulkResult,
+)
+def bulk_activate_users(*, session: SessionDep, body: UsersBulk) -> Any:
+    """
+    Activate many users at once.
+    """
+    count = crud.bulk_update_users(
+        session=session, user_ids=body.ids, values={"is_active": True}
+    )
+    return UsersBulkResult(count=count)
+
+
+@router.post(
+    "/bulk/deactivate",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=UsersBulkResult,
+)
+def bulk_deactivate_users(
+    *, session: SessionDep, current_user: CurrentUser, body: UsersBulk
+) -> Any:
+    """
+    Deactivate many users at once.
+    """
+    if current_user.id in body.ids:
+        raise HTTPException(
+            status_code=403,
+            detail="Super users are not allowed to deactivate themselves",
+        )
+    count = crud.bulk_update_users(
+        session=session, user_ids=body.ids, values={"is_active": False}
+    )
+    return UsersBulkResult(count=count)
+
+
+@router.post(
+    "/bulk/role",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=UsersBulkResult,
+)
+def bulk_set_users_role(
+    *, session: SessionDep, current_user: CurrentUser, body: UsersBulkRole
+) -> Any:
+    """
+    Grant or revoke superuser privileges for many users at once.
+    """
+    if not body.is_superuser and current_user.id in body.ids:
+        raise HTTPException(
+            status_code=403,
+            detail="Super users are not allowed to revoke their own privileges",
+        )
+    count = crud.bulk_update_users(
+        session=session, user_ids=body.ids, values={"is_superuser": body.is_superuser}
+    )
+    return UsersBulkResult(count=count)
+
+
+@router.post(
+    "/bulk/delete",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=JobPublic,
+    status_code=202,
+)
+def bulk_delete_users(
+    *, session: SessionDep, current_user: CurrentUser, body: UsersBulk
+) -> Any:
+    """
+    Delete many users and their items at once, in the background.
+
+    Poll `/utils/jobs/{job_id}` with the returned job id for completion.
+    """
+    if current_user.id in body.ids:
+        raise HTTPException(
+            status_code=403, detail="Super users are not allowed to delete themselves"
+        )
+    return job_runner.submit(
+        session,
+        jobs.DELETE_USERS,
+        {"user_ids": [str(user_id) for user_id in body.ids]},
+        created_by_id=current_user.id,
+    )
+
+
 @router.get("/{user_id}", response_model=UserPublic)
 def read_user_by_id(
-    user_id: uuid.UUID, session: SessionDep, current_user: CurrentUser
+    user_id: uuid.UUID, session: ReadSessionDep, current_user: ReadCurrentUser
 ) -> Any:
     """
     Get a specific user by id.
     """
+    if user_id == current_user.id:
+        return current_user
     user = session.get(User, user_id)
-    if user == current_user:
-        return user
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=403,
@@ -205,12 +301,19 @@ def update_user(
     return db_user
 
 
-@router.delete("/{user_id}", dependencies=[Depends(get_current_active_superuser)])
+@router.delete(
+    "/{user_id}",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=JobPublic,
+    status_code=202,
+)
 def delete_user(
     session: SessionDep, current_user: CurrentUser, user_id: uuid.UUID
-) -> Message:
+) -> Any:
     """
-    Delete a user.
+    Delete a user and their items in the background.
+
+    Poll `/utils/jobs/{job_id}` with the returned job id for completion.
     """
     user = session.get(User, user_id)
     if not user:
@@ -219,8 +322,9 @@ def delete_user(
         raise HTTPException(
             status_code=403, detail="Super users are not allowed to delete themselves"
         )
-    statement = delete(Item).where(col(Item.owner_id) == user_id)
-    session.exec(statement)  # type: ignore
-    session.delete(user)
-    session.commit()
-    return Message(message="User deleted successfully")
+    return job_runner.submit(
+        session,
+        jobs.DELETE_USER,
+        {"user_id": str(user_id)},
+        created_by_id=current_user.id,
+    )
@@ -1,9 +1,16 @@
-from fastapi import APIRouter, Depends
+import uuid
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic.networks import EmailStr
 
-from app.api.deps import get_current_active_superuser
-from app.models import Message
-from app.utils import generate_test_email, send_email
+from app import jobs
+from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
+from app.core.db import engine, get_pool_stats
+from app.core.health import db_health
+from app.core.jobs import job_runner
+from app.models import DBPoolStats, Job, JobPublic, Readiness
+from app.utils import generate_test_email
 
 router = APIRouter(prefix="/utils", tags=["utils"])
 
@@ -11,21 +18,79 @@ router = APIRouter(prefix="/utils", tags=["utils"])
 @router.post(
     "/test-email/",
     dependencies=[Depends(get_current_active_superuser)],
-    status_code=201,
+    response_model=JobPublic,
+    status_code=202,
 )
-def test_email(email_to: EmailStr) -> Message:
+def test_email(
+    session: SessionDep, current_user: CurrentUser, email_to: EmailStr
+) -> Any:
     """
-    Test emails.
+    Test emails, sent in the background.
     """
     email_data = generate_test_email(email_to=email_to)
-    send_email(
-        email_to=email_to,
-        subject=email_data.subject,
-        html_content=email_data.html_content,
+    return job_runner.submit(
+        session,
+        jobs.SEND_EMAIL,
+        {
+            "email_to": email_to,
+            "subject": email_data.subject,
+            "html_content": email_data.html_content,
+        },
+        created_by_id=current_user.id,
     )
-    return Message(message="Test email sent")
+
+
+@router.get(
+    "/jobs/{job_id}",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=JobPublic,
+)
+def read_job(session: SessionDep, job_id: uuid.UUID) -> Any:
+    """
+    Get the status of a background job.
+    """
+    job = session.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
 
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
+
+
+@router.get("/health/live/")
+async def liveness() -> bool:
+    """
+    Liveness probe, the process is up and serving requests.
+    """
+    return True
+
+
+@router.get("/health/ready/", response_model=Readiness)
+async def readiness(response: Response) -> Readiness:
+    """
+    Readiness probe, 503 when the last database ping failed or is outdated.
+    It never touches the database itself.
+    """
+    ready = db_health.ready
+    if not ready:
+        response.status_code = 503
+    return Readiness(
+        ready=ready,
+        database=db_health.healthy,
+        database_checked_at=db_health.checked_at,
+    )
+
+
+@router.get(
+    "/db-pool/",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=DBPoolStats,
+)
+def db_pool_stats() -> DBPoolStats:
+    """
+    Connection pool statistics for this worker.
+    """
+    return get_pool_stats(engine)
@@ -1,10 +1,11 @@
 import logging
 
-from sqlalchemy import Engine
+from sqlalchemy import Engine, text
 from sqlmodel import Session, select
 from tenacity import after_log, before_log, retry, stop_after_attempt, wait_fixed
 
-from app.core.db import engine
+from app.core.config import settings
+from app.core.db import engine, get_pool_stats, pool_warmup_size, warm_pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,9 +30,33 @@ def init(db_engine: Engine) -> None:
         raise e
 
 
+def check_pool(db_engine: Engine) -> None:
+    """Verify the configured pool can actually be opened against this server.
+
+    This process exits right after, so the connections are only opened to
+    check them. The app warms its own pool on startup.
+    """
+    with db_engine.connect() as connection:
+        max_connections = int(
+            connection.execute(text("SHOW max_connections")).scalar_one()
+        )
+    pool_limit = settings.POSTGRES_POOL_SIZE + settings.POSTGRES_MAX_OVERFLOW
+    if pool_limit > max_connections:
+        logger.warning(
+            f"Pool limit per worker ({pool_limit}) exceeds the server's "
+            f"max_connections ({max_connections})"
+        )
+    size = pool_warmup_size()
+    opened = warm_pool(db_engine)
+    if opened < size:
+        logger.warning(f"Only {opened} of {size} pool connections could be opened")
+    logger.info(f"Connection pool: {get_pool_stats(db_engine).model_dump()}")
+
+
 def main() -> None:
     logger.info("Initializing service")
     init(engine)
+    check_pool(engine)
     logger.info("Service finished initializing")
 
 
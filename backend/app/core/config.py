@@ -6,6 +6,7 @@ from pydantic import (
     AnyUrl,
     BeforeValidator,
     EmailStr,
+    Field,
     HttpUrl,
     computed_field,
     model_validator,
@@ -34,6 +35,8 @@ class Settings(BaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     # 60 minutes * 24 hours * 8 days = 8 days
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
+    # bcrypt work factor, the test suite lowers it to the minimum of 4
+    PASSWORD_BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
     FRONTEND_HOST: str = "http://localhost:5173"
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
 
@@ -49,7 +52,37 @@ class Settings(BaseSettings):
         ]
 
     PROJECT_NAME: str
+    # OpenAPI document written by app/export_openapi.py, served instead of
+    # building it at startup. It must be regenerated whenever the API changes,
+    # outside production a stale file is ignored with a warning.
+    OPENAPI_SCHEMA_FILE: str | None = None
     SENTRY_DSN: HttpUrl | None = None
+    # Fraction of requests traced, and of traced requests that are profiled
+    SENTRY_TRACES_SAMPLE_RATE: float = Field(default=0.1, ge=0, le=1)
+    SENTRY_PROFILES_SAMPLE_RATE: float = Field(default=0.0, ge=0, le=1)
+    # High traffic path prefixes are traced at a lower rate, defaults to the
+    # login, current user and items routes under API_V1_STR
+    SENTRY_HOT_ROUTES: Annotated[list[str] | str, BeforeValidator(parse_cors)] = []
+    SENTRY_HOT_ROUTES_SAMPLE_RATE: float = Field(default=0.01, ge=0, le=1)
+    # Paths that are never traced, defaults to the health checks under API_V1_STR
+    SENTRY_IGNORED_ROUTES: Annotated[list[str] | str, BeforeValidator(parse_cors)] = []
+
+    @model_validator(mode="after")
+    def _set_default_sentry_routes(self) -> Self:
+        if "SENTRY_HOT_ROUTES" not in self.model_fields_set:
+            self.SENTRY_HOT_ROUTES = [
+                f"{self.API_V1_STR}/login/access-token",
+                f"{self.API_V1_STR}/users/me",
+                f"{self.API_V1_STR}/items/",
+            ]
+        if "SENTRY_IGNORED_ROUTES" not in self.model_fields_set:
+            self.SENTRY_IGNORED_ROUTES = [
+                f"{self.API_V1_STR}/utils/health-check/",
+                f"{self.API_V1_STR}/utils/health/live/",
+                f"{self.API_V1_STR}/utils/health/ready/",
+            ]
+        return self
+
     POSTGRES_SERVER: str
     POSTGRES_PORT: int = 5432
     POSTGRES_USER: str
@@ -70,6 +103,34 @@ class Settings(BaseSettings):
             )
         )
 
+    # Connection pool configuration (per worker process)
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 30.0  # seconds
+    POSTGRES_POOL_RECYCLE: int = 1800  # seconds, -1 disables recycling
+    POSTGRES_POOL_PRE_PING: bool = True
+    # Number of connections opened at startup, defaults to POSTGRES_POOL_SIZE
+    POSTGRES_POOL_WARMUP: int | None = None
+
+    # Readiness reports the result of a database ping run this often
+    HEALTH_CHECK_INTERVAL: float = 5.0  # seconds
+    HEALTH_CHECK_TIMEOUT: int = 3  # seconds, for a database ping
+
+    # Guards applied to every migration, "0" disables a timeout
+    MIGRATION_LOCK_TIMEOUT: str = "5s"
+    MIGRATION_STATEMENT_TIMEOUT: str = "0"
+    # Defaults of app.core.migrations.backfill
+    MIGRATION_BACKFILL_CHUNK_SIZE: int = 1000
+    MIGRATION_BACKFILL_SLEEP: float = 0.1  # seconds between batches
+
+    # Optional read replicas as full DSNs, comma separated
+    POSTGRES_REPLICA_URIS: Annotated[list[str] | str, BeforeValidator(parse_cors)] = []
+    # Replicas are pinged in the background, with HEALTH_CHECK_TIMEOUT per ping
+    POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL: float = 10.0  # seconds
+    # Reads from a user are pinned to the primary this long after they write,
+    # through a signed cookie set on the response of the write
+    POSTGRES_REPLICA_PIN_SECONDS: float = 5.0
+
     SMTP_TLS: bool = True
     SMTP_SSL: bool = False
     SMTP_PORT: int = 587
@@ -96,6 +157,20 @@ class Settings(BaseSettings):
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
 
+    # Responses of requests sent with an Idempotency-Key are kept this long
+    IDEMPOTENCY_KEY_TTL: int = 60 * 60 * 24  # seconds
+    # A key whose request hasn't finished this long after it started, e.g.
+    # because the worker died, can be used again. Keep it above the longest
+    # request time
+    IDEMPOTENCY_KEY_LEASE: int = 60  # seconds
+
+    # Background jobs
+    # Per job type concurrency overrides, e.g. {"send_email": 8}
+    JOBS_CONCURRENCY: dict[str, int] = {}
+    JOBS_SHUTDOWN_TIMEOUT: float = 30.0  # seconds
+    # Unfinished jobs whose heartbeat is 3 intervals old are marked as failed
+    JOBS_HEARTBEAT_INTERVAL: float = 30.0  # seconds
+
     # Logging configuration
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "TEXT"  # TEXT or JSON
@@ -1,14 +1,260 @@
+import asyncio
+import hashlib
+import hmac
+import itertools
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 from app import crud
 from app.core.config import settings
 from app.core.logging import get_logger
-from app.models import User, UserCreate
+from app.models import DBPoolStats, User, UserCreate
+from sqlalchemy import Engine, event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
 from sqlmodel import Session, create_engine, select
 
 # Create a logger for this module
 logger = get_logger(__name__)
 
+
+class PoolWaitStats:
+    """Thread-safe counters for connection checkouts from the pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # QueuePool keeps it private
+        self.max_overflow: int = kwargs.get("max_overflow", 10)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return conn
+
+
+def create_db_engine(uri: str) -> Engine:
+    """Create an engine using the configured connection pool settings."""
+    return create_engine(
+        uri,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+    )
+
+
+class Replica:
+    """A read replica engine and its last known health."""
+
+    def __init__(self, db_engine: Engine) -> None:
+        self.engine = db_engine
+        self.healthy = True
+
+    def check(self) -> bool:
+        """Ping the replica and record whether it answered."""
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            self.record(str(e))
+        else:
+            self.record(None)
+        return self.healthy
+
+    def record(self, error: str | None) -> None:
+        if error is not None and self.healthy:
+            logger.warning(f"Replica {self.engine.url.host} is unhealthy: {error}")
+        elif error is None and not self.healthy:
+            logger.info(f"Replica {self.engine.url.host} is healthy again")
+        self.healthy = error is None
+
+
+class ReplicaRouter:
+    """Pick the engine for read-only sessions.
+
+    Replicas are used round-robin, skipping those that failed their last health
+    check. Reads from a user who wrote within the pin window go to the primary so
+    they always see their own writes despite replication lag. The pin is a signed
+    token that travels with the client, so any worker or instance can honor it.
+
+    Health checks run in the background, see `start`, so a hung replica never
+    holds up a request. Each replica is pinged on a thread of its own, and a
+    ping that takes longer than `health_check_timeout` counts as failed.
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: list[Engine],
+        *,
+        secret_key: str,
+        health_check_interval: float = 10.0,
+        health_check_timeout: float = 3.0,
+        pin_seconds: float = 5.0,
+    ) -> None:
+        self.primary = primary
+        self.replicas = [Replica(replica) for replica in replicas]
+        self.secret_key = secret_key
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.pin_seconds = pin_seconds
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._executors: list[ThreadPoolExecutor] = []
+
+    def check_replicas(self) -> None:
+        """Ping every replica now, in the calling thread."""
+        for replica in self.replicas:
+            replica.check()
+
+    async def start(self) -> None:
+        """Check the replicas once, then every `health_check_interval` seconds."""
+        if not self.replicas:
+            return
+        self._executors = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="replica-health")
+            for _ in self.replicas
+        ]
+        await self._check()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for executor in self._executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors = []
+
+    async def _check_replica(
+        self, replica: Replica, executor: ThreadPoolExecutor
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(
+                loop.run_in_executor(executor, replica.check),
+                self.health_check_timeout,
+            )
+        except asyncio.TimeoutError:
+            # A hung check keeps the thread, the next ones time out as well
+            replica.record(f"Timed out after {self.health_check_timeout:g}s")
+
+    async def _check(self) -> None:
+        await asyncio.gather(
+            *(
+                self._check_replica(replica, executor)
+                for replica, executor in zip(
+                    self.replicas, self._executors, strict=True
+                )
+            )
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self._check()
+
+    def _sign(self, key: str, expires: str) -> str:
+        message = f"read-pin:{key}:{expires}".encode()
+        return hmac.new(self.secret_key.encode(), message, hashlib.sha256).hexdigest()
+
+    def create_pin(self, key: str) -> str:
+        """Token pinning `key`'s reads to the primary for the pin window."""
+        # Expiry in milliseconds since the epoch
+        expires = str(int((time.time() + self.pin_seconds) * 1000))
+        return f"{expires}.{self._sign(key, expires)}"
+
+    def is_pinned(self, key: str | None, pin: str | None) -> bool:
+        if key is None or not pin:
+            return False
+        expires, _, signature = pin.rpartition(".")
+        try:
+            expired = int(expires) <= time.time() * 1000
+        except ValueError:
+            return False
+        return not expired and hmac.compare_digest(signature, self._sign(key, expires))
+
+    def get_read_engine(self, key: str | None = None, pin: str | None = None) -> Engine:
+        if not self.replicas or self.is_pinned(key, pin):
+            return self.primary
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                replica = self.replicas[next(self._counter) % len(self.replicas)]
+            if replica.healthy:
+                return replica.engine
+        logger.warning("No healthy replica available, reading from primary")
+        return self.primary
+
+
 logger.info("Initializing database engine")
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_db_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+
+if settings.POSTGRES_REPLICA_URIS:
+    logger.info(
+        f"Initializing {len(settings.POSTGRES_REPLICA_URIS)} read replica engines"
+    )
+replica_router = ReplicaRouter(
+    engine,
+    [create_db_engine(uri) for uri in settings.POSTGRES_REPLICA_URIS],
+    secret_key=settings.SECRET_KEY,
+    health_check_interval=settings.POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL,
+    health_check_timeout=settings.HEALTH_CHECK_TIMEOUT,
+    pin_seconds=settings.POSTGRES_REPLICA_PIN_SECONDS,
+)
+
+
+# Cookie carrying the read pin of a user who just wrote
+READ_PIN_COOKIE = "read_pin"
+
+
+@event.listens_for(Session, "after_commit")
+def _pin_writer_to_primary(session: Session) -> None:
+    # get_current_user tags sessions with the authenticated user's id and the
+    # response of the request
+    user_id = session.info.get("user_id")
+    response = session.info.get("response")
+    if user_id is None or response is None or not replica_router.replicas:
+        return
+    response.set_cookie(
+        READ_PIN_COOKIE,
+        replica_router.create_pin(user_id),
+        max_age=math.ceil(replica_router.pin_seconds),
+        httponly=True,
+        samesite="lax",
+    )
+
 
 # Redact password from URI for logging
 import re
@@ -21,6 +267,69 @@ safe_uri = re.sub(
 logger.debug(f"Database URI: {safe_uri}")
 
 
+def pool_warmup_size() -> int:
+    """Number of connections `warm_pool` opens by default."""
+    if settings.POSTGRES_POOL_WARMUP is not None:
+        return settings.POSTGRES_POOL_WARMUP
+    return settings.POSTGRES_POOL_SIZE
+
+
+def warm_pool(db_engine: Engine, size: int | None = None) -> int:
+    """Open up to `size` connections so the first requests don't pay for them.
+
+    Returns the number of connections that were opened. Failures are logged
+    and not raised, the service can still start and connect lazily.
+    """
+    if size is None:
+        size = pool_warmup_size()
+    connections = []
+    start = time.perf_counter()
+    try:
+        for _ in range(size):
+            connections.append(db_engine.connect())
+    except Exception as e:
+        logger.warning(f"Connection pool warmup stopped early: {e}")
+    finally:
+        for connection in connections:
+            connection.close()
+    logger.info(
+        f"Warmed connection pool with {len(connections)}/{size} connections "
+        f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+    )
+    return len(connections)
+
+
+def get_pool_stats(db_engine: Engine) -> DBPoolStats:
+    """Report the current state of the engine's connection pool."""
+    pool = db_engine.pool
+    checked_out = checked_in = overflow = 0
+    size = max_overflow = 0
+    if isinstance(pool, QueuePool):
+        size = pool.size()
+        max_overflow = (
+            pool.max_overflow
+            if isinstance(pool, InstrumentedQueuePool)
+            else settings.POSTGRES_MAX_OVERFLOW
+        )
+        checked_out = pool.checkedout()
+        checked_in = pool.checkedin()
+        overflow = max(pool.overflow(), 0)
+
+    stats = getattr(pool, "wait_stats", None) or PoolWaitStats()
+    avg_wait = stats.total_wait / stats.checkouts if stats.checkouts else 0.0
+    return DBPoolStats(
+        pool_size=size,
+        max_overflow=max_overflow,
+        checked_out=checked_out,
+        idle=checked_in,
+        overflow=overflow,
+        checkouts=stats.checkouts,
+        timeouts=stats.timeouts,
+        avg_wait_ms=avg_wait * 1000,
+        max_wait_ms=stats.max_wait * 1000,
+    )
+
+
 # make sure all SQLModel models are imported (app.models) before initializing DB
 # otherwise, SQLModel might fail to initialize relationships properly
 # for more details: https://github.com/fastapi/full-stack-fastapi-template/issues/28
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from sqlalchemy import Engine, create_engine, text
+
+# Create a logger for this module
+logger = get_logger(__name__)
+
+
+def create_health_check_engine() -> Engine:
+    """Engine with a single connection reserved for health checks, so they
+    neither open new connections nor wait for the request pool."""
+    return create_engine(
+        settings.SQLALCHEMY_DATABASE_URI,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+        connect_args={"connect_timeout": settings.HEALTH_CHECK_TIMEOUT},
+    )
+
+
+class DatabaseHealth:
+    """The result of the last database ping, refreshed in the background.
+
+    Probes read the cached result. It counts as failed once it's older than
+    three check intervals, e.g. when the check itself hangs. Checks run on a
+    thread of their own, so they don't queue behind request work in the shared
+    thread pool, and fail after `timeout` seconds.
+    """
+
+    def __init__(
+        self, db_engine: Engine, interval: float, timeout: float = 3.0
+    ) -> None:
+        self.engine = db_engine
+        self.interval = interval
+        self.timeout = timeout
+        self.healthy = False
+        self.error: str | None = None
+        self.checked_at: datetime | None = None
+        self._checked_monotonic = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def ready(self) -> bool:
+        age = time.monotonic() - self._checked_monotonic
+        return self.healthy and age <= 3 * self.interval
+
+    def check(self) -> bool:
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            self._record(str(e))
+        else:
+            self._record(None)
+        return self.healthy
+
+    def _record(self, error: str | None) -> None:
+        if error is not None:
+            if self.healthy or self.checked_at is None:
+                logger.warning(f"Database health check failed: {error}")
+        elif not self.healthy and self.checked_at is not None:
+            logger.info("Database health check succeeded again")
+        self.healthy = error is None
+        self.error = error
+        self.checked_at = datetime.now(timezone.utc)
+        self._checked_monotonic = time.monotonic()
+
+    async def start(self) -> None:
+        """Check once, then keep checking every `interval` seconds."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="db-health"
+        )
+        await self._check()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self.engine.dispose()
+
+    async def _check(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(
+                loop.run_in_executor(self._executor, self.check), self.timeout
+            )
+        except asyncio.TimeoutError:
+            # A hung check keeps the thread, the next ones time out as well
+            self._record(f"Timed out after {self.timeout:g}s")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self._check()
+
+
+db_health = DatabaseHealth(
+    create_health_check_engine(),
+    interval=settings.HEALTH_CHECK_INTERVAL,
+    timeout=settings.HEALTH_CHECK_TIMEOUT,
+)
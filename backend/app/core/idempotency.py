@@ -0,0 +1,237 @@
+import hashlib
+import time
+from collections.abc import Callable, Collection
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+import jwt
+from app.core import security
+from app.core.config import settings
+from app.core.db import engine
+from app.core.logging import get_logger
+from app.models import IdempotencyKey
+from fastapi import Request
+from sqlalchemy import CursorResult
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, delete
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp
+
+# Create a logger for this module
+logger = get_logger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyStore:
+    """Stores the responses of requests sent with an Idempotency-Key.
+
+    A key is claimed before the request is processed. Its response is saved
+    afterwards, or the claim is released if processing failed. A claim is
+    leased for `lease` seconds only, so that the key can be claimed again when
+    the process handling it died before saving a response. Saved responses are
+    kept for `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float, lease: float, purge_interval: float = 60.0) -> None:
+        self.ttl = ttl
+        self.lease = lease
+        self.purge_interval = purge_interval
+        self.session_factory: Callable[[], Session] = lambda: Session(engine)
+        self._last_purge = 0.0
+
+    def claim(self, key: str, scope: str, fingerprint: str) -> IdempotencyKey | None:
+        """Claim `key`, return None if it was free, otherwise the existing record."""
+        now = datetime.now(timezone.utc)
+        with self.session_factory() as session:
+            self._purge_expired(session, now)
+            session.execute(
+                delete(IdempotencyKey).where(
+                    col(IdempotencyKey.key) == key,
+                    col(IdempotencyKey.scope) == scope,
+                    col(IdempotencyKey.expires_at) <= now,
+                )
+            )
+            statement = (
+                insert(IdempotencyKey)
+                .values(
+                    key=key,
+                    scope=scope,
+                    fingerprint=fingerprint,
+                    created_at=now,
+                    expires_at=now + timedelta(seconds=self.lease),
+                )
+                .on_conflict_do_nothing(index_elements=["key", "scope"])
+                .returning(col(IdempotencyKey.key))
+            )
+            claimed = session.execute(statement).first()
+            session.commit()
+            if claimed:
+                return None
+            return session.get(IdempotencyKey, (key, scope))
+
+    def save(
+        self,
+        key: str,
+        scope: str,
+        status_code: int,
+        content_type: str | None,
+        body: bytes,
+    ) -> None:
+        with self.session_factory() as session:
+            record = session.get(IdempotencyKey, (key, scope))
+            if not record:
+                return
+            record.status_code = status_code
+            record.content_type = content_type
+            record.response_body = body
+            record.expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl)
+            session.add(record)
+            session.commit()
+
+    def release(self, key: str, scope: str) -> None:
+        with self.session_factory() as session:
+            session.execute(
+                delete(IdempotencyKey).where(
+                    col(IdempotencyKey.key) == key,
+                    col(IdempotencyKey.scope) == scope,
+                )
+            )
+            session.commit()
+
+    def _purge_expired(self, session: Session, now: datetime) -> None:
+        if time.monotonic() - self._last_purge < self.purge_interval:
+            return
+        self._last_purge = time.monotonic()
+        result = session.execute(
+            delete(IdempotencyKey).where(col(IdempotencyKey.expires_at) <= now)
+        )
+        purged = cast(CursorResult[Any], result).rowcount
+        if purged:
+            logger.info(f"Purged {purged} expired idempotency keys")
+
+
+idempotency_store = IdempotencyStore(
+    ttl=settings.IDEMPOTENCY_KEY_TTL, lease=settings.IDEMPOTENCY_KEY_LEASE
+)
+
+
+def request_scope(request: Request, fingerprint: str) -> str:
+    """The user a request is sent by.
+
+    Without a valid token, a hash of the credentials and of the request itself,
+    so a stored response only goes back to a request with the same content,
+    e.g. the same signup password, and not to any client reusing the key.
+    """
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = jwt.decode(
+                token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
+            )
+            return str(payload["sub"])
+        except (jwt.InvalidTokenError, KeyError):
+            pass
+    return hashlib.sha256(f"{authorization}\0{fingerprint}".encode()).hexdigest()
+
+
+def request_fingerprint(method: str, path: str, query: str, body: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in (method, path, query):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+class IdempotencyMiddleware(BaseHTTPMiddleware):
+    """Make POST requests to `paths` idempotent when they carry an Idempotency-Key.
+
+    The first request with a key is processed normally and its response is
+    stored for IDEMPOTENCY_KEY_TTL seconds. Retries with the same key get the
+    stored response back. They get 409 while the first request is still being
+    processed, up to IDEMPOTENCY_KEY_LEASE seconds, and 422 if they differ
+    from it. Server errors aren't stored, so the request can be retried.
+    """
+
+    def __init__(
+        self, app: ASGIApp, paths: Collection[str], store: IdempotencyStore
+    ) -> None:
+        super().__init__(app)
+        self.paths = set(paths)
+        self.store = store
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key or request.method != "POST" or request.url.path not in self.paths:
+            return await call_next(request)
+        if len(key) > 255:
+            return JSONResponse(
+                status_code=400,
+                content={"detail": "Idempotency-Key must be at most 255 characters"},
+            )
+
+        body = await request.body()
+        fingerprint = request_fingerprint(
+            request.method, request.url.path, request.url.query, body
+        )
+        scope = request_scope(request, fingerprint)
+        record = await run_in_threadpool(self.store.claim, key, scope, fingerprint)
+        if record is not None:
+            return self._replay(record, fingerprint)
+
+        try:
+            response = await call_next(request)
+            response_body = b"".join(
+                [chunk async for chunk in response.body_iterator]  # type: ignore[attr-defined]
+            )
+        except Exception:
+            await run_in_threadpool(self.store.release, key, scope)
+            raise
+        if response.status_code >= 500:
+            await run_in_threadpool(self.store.release, key, scope)
+        else:
+            await run_in_threadpool(
+                self.store.save,
+                key,
+                scope,
+                response.status_code,
+                response.headers.get("content-type"),
+                response_body,
+            )
+        return Response(
+            content=response_body,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+        )
+
+    def _replay(self, record: IdempotencyKey, fingerprint: str) -> Response:
+        if record.fingerprint != fingerprint:
+            return JSONResponse(
+                status_code=422,
+                content={
+                    "detail": "Idempotency-Key was already used for a different request"
+                },
+            )
+        if record.status_code is None:
+            return JSONResponse(
+                status_code=409,
+                content={
+                    "detail": "A request with this Idempotency-Key is being processed"
+                },
+            )
+        logger.info(f"Replaying stored response for idempotency key {record.key}")
+        headers = {REPLAYED_HEADER: "true"}
+        if record.content_type:
+            headers["content-type"] = record.content_type
+        return Response(
+            content=record.response_body,
+            status_code=record.status_code,
+            headers=headers,
+        )
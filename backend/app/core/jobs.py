@@ -0,0 +1,224 @@
+import asyncio
+import contextlib
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.logging import get_logger
+from app.models import Job, JobStatus
+from sqlalchemy import CursorResult, func, update
+from sqlmodel import Session, col
+from starlette.concurrency import run_in_threadpool
+
+# Create a logger for this module
+logger = get_logger(__name__)
+
+
+@dataclass
+class JobHandler:
+    func: Callable[..., Any]
+    concurrency: int
+
+
+class JobRunner:
+    """In-process background job queue running on the application's event loop.
+
+    Job records are persisted in the `job` table so their status can be polled.
+    Handler arguments are kept in memory only, they may contain secrets such as
+    email bodies, so jobs that haven't finished when the process exits can't be
+    resumed. Each runner refreshes a heartbeat on its unfinished jobs, and marks
+    the unfinished jobs of any runner whose heartbeat went stale as failed, at
+    startup and on every heartbeat. Handlers run in the thread pool.
+
+    With `eager` set, jobs run synchronously inside `submit`, which the test
+    suite uses together with its own `session_factory`.
+    """
+
+    def __init__(self) -> None:
+        self.session_factory: Callable[[], Session] = lambda: Session(engine)
+        self.eager = False
+        self._handlers: dict[str, JobHandler] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._heartbeat: asyncio.Task[None] | None = None
+        # Identifies the jobs of this runner among those of other workers
+        self.runner_id = uuid.uuid4().hex
+
+    def register(
+        self, job_type: str, *, concurrency: int = 1
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Register a handler for `job_type`, used as a decorator."""
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            self._handlers[job_type] = JobHandler(
+                func=func,
+                concurrency=settings.JOBS_CONCURRENCY.get(job_type, concurrency),
+            )
+            return func
+
+        return decorator
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._semaphores = {
+            job_type: asyncio.Semaphore(handler.concurrency)
+            for job_type, handler in self._handlers.items()
+        }
+        try:
+            await run_in_threadpool(self.fail_stale_jobs)
+        except Exception as e:
+            logger.exception("Failed to clean up interrupted jobs", exc_info=e)
+        self._heartbeat = asyncio.create_task(self._beat())
+        logger.info(f"Job runner started with handlers: {sorted(self._handlers)}")
+
+    async def shutdown(self, timeout: float) -> None:
+        """Wait up to `timeout` seconds for running jobs, then stop."""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._heartbeat
+            self._heartbeat = None
+        if self._tasks:
+            logger.info(f"Waiting for {len(self._tasks)} background jobs to finish")
+            _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+        self._loop = None
+
+    async def _beat(self) -> None:
+        while True:
+            await asyncio.sleep(settings.JOBS_HEARTBEAT_INTERVAL)
+            try:
+                await run_in_threadpool(self.touch_jobs)
+                await run_in_threadpool(self.fail_stale_jobs)
+            except Exception as e:
+                logger.exception("Job heartbeat failed", exc_info=e)
+
+    def touch_jobs(self) -> None:
+        """Refresh the heartbeat of this runner's unfinished jobs."""
+        with self.session_factory() as session:
+            session.execute(
+                update(Job)
+                .where(col(Job.runner_id) == self.runner_id)
+                .where(col(Job.status).in_([JobStatus.QUEUED, JobStatus.RUNNING]))
+                .values(heartbeat_at=datetime.now(timezone.utc))
+            )
+            session.commit()
+
+    def fail_stale_jobs(self) -> int:
+        """Mark unfinished jobs whose runner stopped beating as failed.
+
+        Returns the number of jobs marked as failed.
+        """
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=3 * settings.JOBS_HEARTBEAT_INTERVAL)
+        with self.session_factory() as session:
+            result = session.execute(
+                update(Job)
+                .where(col(Job.status).in_([JobStatus.QUEUED, JobStatus.RUNNING]))
+                .where(func.coalesce(Job.heartbeat_at, Job.created_at) < cutoff)
+                .values(
+                    status=JobStatus.FAILED,
+                    error="Interrupted, the process running the job stopped",
+                    finished_at=now,
+                )
+            )
+            session.commit()
+        count = cast(CursorResult[Any], result).rowcount
+        if count:
+            logger.warning(f"Marked {count} interrupted jobs as failed")
+        return count
+
+    def submit(
+        self,
+        session: Session,
+        job_type: str,
+        kwargs: dict[str, Any] | None = None,
+        created_by_id: uuid.UUID | None = None,
+    ) -> Job:
+        """Persist a queued job and schedule it. Safe to call from any thread.
+
+        `kwargs` are passed to the handler.
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+        if self._loop is None and not self.eager:
+            raise RuntimeError("Job runner is not started")
+
+        job = Job(
+            job_type=job_type,
+            created_by_id=created_by_id,
+            runner_id=self.runner_id,
+            heartbeat_at=datetime.now(timezone.utc),
+        )
+        job_id = job.id
+        session.add(job)
+        session.commit()
+        logger.info(f"Queued {job_type} job {job_id}")
+        # Eager jobs run before `session` starts a new transaction, so their
+        # updates aren't nested in it
+        if self.eager:
+            self._run_eager(job_id, job_type, kwargs or {})
+        elif self._loop is not None:
+            self._loop.call_soon_threadsafe(self._spawn, job_id, job_type, kwargs or {})
+        session.refresh(job)
+        return job
+
+    def _run_eager(
+        self, job_id: uuid.UUID, job_type: str, kwargs: dict[str, Any]
+    ) -> None:
+        self._update_job(job_id, JobStatus.RUNNING)
+        try:
+            self._handlers[job_type].func(**kwargs)
+        except Exception as e:
+            logger.exception(f"{job_type} job {job_id} failed", exc_info=e)
+            self._update_job(job_id, JobStatus.FAILED, str(e))
+        else:
+            self._update_job(job_id, JobStatus.SUCCEEDED)
+
+    def _spawn(self, job_id: uuid.UUID, job_type: str, kwargs: dict[str, Any]) -> None:
+        task = asyncio.create_task(self._run(job_id, job_type, kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, job_id: uuid.UUID, job_type: str, kwargs: dict[str, Any]
+    ) -> None:
+        handler = self._handlers[job_type]
+        async with self._semaphores[job_type]:
+            await run_in_threadpool(self._update_job, job_id, JobStatus.RUNNING)
+            try:
+                await run_in_threadpool(handler.func, **kwargs)
+            except Exception as e:
+                logger.exception(f"{job_type} job {job_id} failed", exc_info=e)
+                await run_in_threadpool(
+                    self._update_job, job_id, JobStatus.FAILED, str(e)
+                )
+            else:
+                logger.info(f"{job_type} job {job_id} succeeded")
+                await run_in_threadpool(self._update_job, job_id, JobStatus.SUCCEEDED)
+
+    def _update_job(
+        self, job_id: uuid.UUID, status: JobStatus, error: str | None = None
+    ) -> None:
+        with self.session_factory() as session:
+            job = session.get(Job, job_id)
+            if not job:
+                return
+            now = datetime.now(timezone.utc)
+            job.status = status
+            if status == JobStatus.RUNNING:
+                job.started_at = now
+            else:
+                job.finished_at = now
+                job.error = error
+            session.add(job)
+            session.commit()
+
+
+job_runner = JobRunner()
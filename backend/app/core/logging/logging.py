@@ -283,38 +283,6 @@ def setup_logging(
                 file_handler.setFormatter(formatter)
                 root_logger.addHandler(file_handler)
 
-    # Configure Sentry integration if available and configured
-    try:
-        if (
-            hasattr(settings, "SENTRY_DSN")
-            and settings.SENTRY_DSN
-            and settings.ENVIRONMENT != "local"
-        ):
-            try:
-                import sentry_sdk
-                from sentry_sdk.integrations.logging import LoggingIntegration
-
-                # Configure Sentry to capture errors and above
-                sentry_logging = LoggingIntegration(
-                    level=logging.ERROR, event_level=logging.ERROR
-                )
-
-                sentry_sdk.init(
-                    dsn=str(settings.SENTRY_DSN),
-                    integrations=[sentry_logging],
-                    environment=settings.ENVIRONMENT,
-                    traces_sample_rate=1.0,
-                )
-
-                logging.getLogger("app").info("Sentry integration enabled")
-            except ImportError:
-                logging.getLogger("app").warning(
-                    "Sentry SDK not installed, skipping integration"
-                )
-    except (AttributeError, TypeError):
-        # Sentry is not configured, skip integration
-        pass
-
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name."""
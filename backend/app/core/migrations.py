@@ -0,0 +1,223 @@
+"""Helpers for Alembic migrations that must not block traffic on large tables.
+
+Use them in migration scripts instead of the plain `op` calls:
+
+    from app.core import migrations
+
+    def upgrade():
+        migrations.create_index_concurrently("ix_item_title", "item", ["title"])
+
+`alembic -x dry_run=true upgrade head` prints the SQL together with the
+estimated lock impact of each helper, without changing the database.
+"""
+
+import math
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from alembic import op
+from app.core.config import settings
+from app.core.logging import get_logger
+from sqlalchemy import TextClause, create_engine, text
+from sqlalchemy.pool import NullPool
+
+# Create a logger for this module
+logger = get_logger(__name__)
+
+
+def is_dry_run() -> bool:
+    """Whether the migrations only print SQL (dry run or `--sql`)."""
+    return bool(op.get_context().as_sql)
+
+
+def _report(message: str) -> None:
+    op.get_context().impl.static_output(f"-- {message}")
+
+
+def _table_stats(table: str) -> tuple[int, str] | None:
+    """Estimated row count and total size of `table`, from the planner statistics."""
+    stats_engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, poolclass=NullPool)
+    try:
+        with stats_engine.connect() as connection:
+            row = connection.execute(
+                text(
+                    "SELECT greatest(c.reltuples, 0)::bigint, "
+                    "pg_size_pretty(pg_total_relation_size(c.oid)) "
+                    "FROM pg_class c WHERE c.oid = to_regclass(:table)"
+                ),
+                {"table": table},
+            ).first()
+    except Exception as e:
+        logger.warning(f"Could not read statistics of {table}: {e}")
+        return None
+    finally:
+        stats_engine.dispose()
+    return (int(row[0]), str(row[1])) if row else None
+
+
+def _describe_table(table: str, stats: tuple[int, str] | None) -> str:
+    if stats is None:
+        return f"{table}: statistics unavailable"
+    rows, size = stats
+    return f"{table}: ~{rows} rows, {size}"
+
+
+@contextmanager
+def lock_timeout(
+    lock_timeout: str | None = None, statement_timeout: str | None = None
+) -> Iterator[None]:
+    """Use other timeouts for the statements run inside the block.
+
+    Values are PostgreSQL durations such as "2s" or "500ms", "0" disables the
+    timeout. The migration defaults are MIGRATION_LOCK_TIMEOUT and
+    MIGRATION_STATEMENT_TIMEOUT.
+    """
+    values = {"lock_timeout": lock_timeout, "statement_timeout": statement_timeout}
+    defaults = {
+        "lock_timeout": settings.MIGRATION_LOCK_TIMEOUT,
+        "statement_timeout": settings.MIGRATION_STATEMENT_TIMEOUT,
+    }
+    previous: dict[str, str] = {}
+    for name, value in values.items():
+        if value is None:
+            continue
+        if is_dry_run():
+            previous[name] = defaults[name]
+        else:
+            previous[name] = str(
+                op.get_bind().execute(text(f"SHOW {name}")).scalar_one()
+            )
+        op.execute(f"SET {name} = '{value}'")
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            op.execute(f"SET {name} = '{value}'")
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    *,
+    unique: bool = False,
+    **kw: Any,
+) -> None:
+    """Build an index without blocking writes to the table.
+
+    It runs outside the migration transaction. An invalid index left behind by
+    an interrupted build is dropped first. The statement timeout is lifted,
+    large builds take a while.
+    """
+    if is_dry_run():
+        _report(
+            f"{_describe_table(table_name, _table_stats(table_name))}. "
+            "CREATE INDEX CONCURRENTLY takes a SHARE UPDATE EXCLUSIVE lock: "
+            "reads and writes continue, other schema changes wait. The table is "
+            "scanned twice."
+        )
+    with op.get_context().autocommit_block(), lock_timeout(statement_timeout="0"):
+        if not is_dry_run():
+            _drop_invalid_index(index_name)
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            unique=unique,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **kw,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index without blocking reads and writes to the table."""
+    if is_dry_run():
+        _report(
+            f"{_describe_table(table_name, _table_stats(table_name))}. "
+            "DROP INDEX CONCURRENTLY waits for running transactions on the table "
+            "without blocking new ones."
+        )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def _drop_invalid_index(index_name: str) -> None:
+    invalid = op.get_bind().execute(
+        text(
+            "SELECT 1 FROM pg_index "
+            "WHERE indexrelid = to_regclass(:name) AND NOT indisvalid"
+        ),
+        {"name": index_name},
+    )
+    if invalid.first():
+        logger.warning(f"Dropping invalid index {index_name} before rebuilding it")
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"')
+
+
+def backfill(
+    table: str,
+    set_clause: str,
+    where: str = "TRUE",
+    *,
+    key: str = "id",
+    chunk_size: int | None = None,
+    sleep: float | None = None,
+) -> int:
+    """Run `UPDATE table SET set_clause WHERE where` in batches.
+
+    Rows are walked in `key` order, `chunk_size` rows per transaction with a
+    pause of `sleep` seconds between batches, so row locks are held briefly and
+    replicas can keep up. Defaults are MIGRATION_BACKFILL_CHUNK_SIZE and
+    MIGRATION_BACKFILL_SLEEP. Returns the number of updated rows.
+    """
+    chunk_size = chunk_size or settings.MIGRATION_BACKFILL_CHUNK_SIZE
+    sleep = settings.MIGRATION_BACKFILL_SLEEP if sleep is None else sleep
+    if is_dry_run():
+        stats = _table_stats(table)
+        batches = "unknown" if stats is None else math.ceil(stats[0] / chunk_size)
+        _report(
+            f"{_describe_table(table, stats)}. "
+            f"Backfill in batches of {chunk_size} rows: "
+            f"~{batches} batches, each holding ROW EXCLUSIVE and row locks on at "
+            f"most {chunk_size} rows, {sleep}s pause between batches."
+        )
+        _report(f"UPDATE {table} SET {set_clause} WHERE {where}")
+        return 0
+
+    def batch_statement(condition: str) -> TextClause:
+        return text(
+            f"WITH batch AS (SELECT {key} FROM {table} WHERE {condition} "
+            f"ORDER BY {key} LIMIT :chunk_size) "
+            f"UPDATE {table} SET {set_clause} FROM batch "
+            f"WHERE {table}.{key} = batch.{key} RETURNING {table}.{key}"
+        )
+
+    first_batch = batch_statement(f"({where})")
+    next_batch = batch_statement(f"({where}) AND {key} > :last_key")
+    total = 0
+    last_key = None
+    with op.get_context().autocommit_block():
+        while True:
+            if last_key is None:
+                result = op.get_bind().execute(first_batch, {"chunk_size": chunk_size})
+            else:
+                result = op.get_bind().execute(
+                    next_batch, {"chunk_size": chunk_size, "last_key": last_key}
+                )
+            keys = result.scalars().all()
+            total += len(keys)
+            if len(keys) < chunk_size:
+                break
+            last_key = max(keys)
+            logger.info(f"Backfilled {total} rows of {table}")
+            time.sleep(sleep)
+    logger.info(f"Backfill of {table} done, {total} rows updated")
+    return total
@@ -0,0 +1,82 @@
+import hashlib
+import json
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from fastapi import FastAPI, Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+# Create a logger for this module
+logger = get_logger(__name__)
+
+
+def render_openapi(app: FastAPI, indent: int | None = None) -> bytes:
+    """Serialize the OpenAPI document of `app` the way FastAPI's JSONResponse does."""
+    return json.dumps(
+        app.openapi(),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=indent,
+        separators=(",", ": ") if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+class OpenAPIDocument:
+    """The OpenAPI document, serialized once per process.
+
+    It is read from OPENAPI_SCHEMA_FILE when that file exists, otherwise built
+    from the app. Outside production the file is checked against the app and
+    ignored when the routes changed since it was written. Responses carry an
+    ETag so clients can revalidate cheaply.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self.app = app
+        self.content: bytes | None = None
+        self.etag = ""
+
+    def load(self) -> None:
+        schema_file = settings.OPENAPI_SCHEMA_FILE
+        content = None
+        if schema_file and Path(schema_file).is_file():
+            content = Path(schema_file).read_bytes()
+            if settings.ENVIRONMENT != "production" and (
+                json.loads(content) != self.app.openapi()
+            ):
+                logger.warning(
+                    f"{schema_file} is out of date, serving the OpenAPI document "
+                    "built from the app. Regenerate it with app/export_openapi.py"
+                )
+                content = None
+            else:
+                logger.info(f"Loaded OpenAPI document from {schema_file}")
+        if content is None:
+            content = render_openapi(self.app)
+        self.content = content
+        self.etag = f'"{hashlib.sha256(content).hexdigest()}"'
+
+    # Sync, so Starlette runs it in the threadpool in case it has to load
+    def endpoint(self, request: Request) -> Response:
+        if self.content is None:
+            self.load()
+        assert self.content is not None
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if self.etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+        return Response(self.content, media_type="application/json", headers=headers)
+
+
+def install_openapi_document(app: FastAPI) -> OpenAPIDocument:
+    """Replace FastAPI's `openapi_url` route, which serializes the document on
+    every request, with one serving the pre-serialized document."""
+    document = OpenAPIDocument(app)
+    for i, route in enumerate(app.router.routes):
+        if isinstance(route, Route) and route.path == app.openapi_url:
+            app.router.routes[i] = Route(
+                route.path, document.endpoint, include_in_schema=False
+            )
+            break
+    return document
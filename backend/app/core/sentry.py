@@ -0,0 +1,45 @@
+import logging
+from typing import Any
+
+import sentry_sdk
+from app.core.config import settings
+from sentry_sdk.integrations.logging import LoggingIntegration
+
+
+def traces_sampler(sampling_context: dict[str, Any]) -> float:
+    """Decide the sample rate of each transaction.
+
+    Health checks are never traced, routes in SENTRY_HOT_ROUTES are sampled at
+    SENTRY_HOT_ROUTES_SAMPLE_RATE and everything else at
+    SENTRY_TRACES_SAMPLE_RATE. Traces started upstream keep their decision.
+    """
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return float(parent_sampled)
+
+    scope = sampling_context.get("asgi_scope") or {}
+    path = scope.get("path", "")
+    if path in settings.SENTRY_IGNORED_ROUTES:
+        return 0.0
+    if any(path.startswith(route) for route in settings.SENTRY_HOT_ROUTES):
+        return settings.SENTRY_HOT_ROUTES_SAMPLE_RATE
+    return settings.SENTRY_TRACES_SAMPLE_RATE
+
+
+def init_sentry(**overrides: Any) -> None:
+    """Initialize the Sentry SDK once for the whole application.
+
+    Errors logged with level ERROR and above are reported as events.
+    `overrides` replace SDK options, e.g. the transport in benchmarks.
+    """
+    options: dict[str, Any] = {
+        "dsn": str(settings.SENTRY_DSN),
+        "environment": settings.ENVIRONMENT,
+        "integrations": [
+            LoggingIntegration(level=logging.ERROR, event_level=logging.ERROR)
+        ],
+        "traces_sampler": traces_sampler,
+        "profiles_sample_rate": settings.SENTRY_PROFILES_SAMPLE_RATE,
+    }
+    options.update(overrides)
+    sentry_sdk.init(**options)
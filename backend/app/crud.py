@@ -1,7 +1,7 @@
 import uuid
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, delete, select, update
 
 from app.core.security import get_password_hash, verify_password
 from app.models import Item, ItemCreate, User, UserCreate, UserUpdate
@@ -31,6 +31,22 @@ def update_user(*, session: Session, db_user: User, user_in: UserUpdate) -> Any:
     return db_user
 
 
+def bulk_update_users(
+    *, session: Session, user_ids: list[uuid.UUID], values: dict[str, Any]
+) -> int:
+    statement = update(User).where(col(User.id).in_(user_ids)).values(**values)
+    result = session.exec(statement)  # type: ignore
+    session.commit()
+    return int(result.rowcount)
+
+
+def bulk_delete_users(*, session: Session, user_ids: list[uuid.UUID]) -> int:
+    session.exec(delete(Item).where(col(Item.owner_id).in_(user_ids)))  # type: ignore
+    result = session.exec(delete(User).where(col(User.id).in_(user_ids)))  # type: ignore
+    session.commit()
+    return int(result.rowcount)
+
+
 def get_user_by_email(*, session: Session, email: str) -> User | None:
     statement = select(User).where(User.email == email)
     session_user = session.exec(statement).first()
@@ -0,0 +1,23 @@
+import logging
+import sys
+from pathlib import Path
+
+from app.core.openapi import render_openapi
+from app.main import app
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Write the OpenAPI document to the path given as argument, or openapi.json.
+
+    The database isn't needed, only the settings.
+    """
+    path = Path(sys.argv[1] if len(sys.argv) > 1 else "openapi.json")
+    path.write_bytes(render_openapi(app, indent=2) + b"\n")
+    logger.info(f"OpenAPI document written to {path}")
+
+
+if __name__ == "__main__":
+    main()
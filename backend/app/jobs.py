@@ -0,0 +1,37 @@
+import uuid
+
+from sqlmodel import col, delete
+
+from app import crud
+from app.core.jobs import job_runner
+from app.models import Item, User
+from app.utils import send_email
+
+SEND_EMAIL = "send_email"
+DELETE_USER = "delete_user"
+DELETE_USERS = "delete_users"
+
+
+@job_runner.register(SEND_EMAIL, concurrency=4)
+def send_email_job(*, email_to: str, subject: str, html_content: str) -> None:
+    send_email(email_to=email_to, subject=subject, html_content=html_content)
+
+
+@job_runner.register(DELETE_USER, concurrency=2)
+def delete_user_job(*, user_id: str) -> None:
+    with job_runner.session_factory() as session:
+        user = session.get(User, uuid.UUID(user_id))
+        if not user:
+            return
+        statement = delete(Item).where(col(Item.owner_id) == user.id)
+        session.exec(statement)  # type: ignore
+        session.delete(user)
+        session.commit()
+
+
+@job_runner.register(DELETE_USERS, concurrency=1)
+def delete_users_job(*, user_ids: list[str]) -> None:
+    with job_runner.session_factory() as session:
+        crud.bulk_delete_users(
+            session=session, user_ids=[uuid.UUID(user_id) for user_id in user_ids]
+        )
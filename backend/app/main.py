@@ -1,9 +1,18 @@
-import sentry_sdk
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 from app.api.main import api_router
 from app.core.config import settings
+from app.core.db import engine, replica_router, warm_pool
+from app.core.health import db_health
+from app.core.idempotency import IdempotencyMiddleware, idempotency_store
+from app.core.jobs import job_runner
 from app.core.logging import LoggingMiddleware
+from app.core.openapi import install_openapi_document
+from app.core.sentry import init_sentry
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 
 
@@ -12,14 +21,38 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 
 
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
-    sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
+    init_sentry()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+    await run_in_threadpool(warm_pool, engine)
+    # Build the OpenAPI document now instead of on the first docs request
+    await run_in_threadpool(openapi_document.load)
+    await job_runner.start()
+    await db_health.start()
+    await replica_router.start()
+    yield
+    await replica_router.stop()
+    await db_health.stop()
+    await job_runner.shutdown(settings.JOBS_SHUTDOWN_TIMEOUT)
+    engine.dispose()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
 )
 
+# Retried POST requests with the same Idempotency-Key get the stored response
+app.add_middleware(
+    IdempotencyMiddleware,
+    paths=[f"{settings.API_V1_STR}/items/", f"{settings.API_V1_STR}/users/signup"],
+    store=idempotency_store,
+)
+
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
@@ -34,3 +67,5 @@ if settings.all_cors_origins:
 app.add_middleware(LoggingMiddleware)
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
+
+openapi_document = install_openapi_document(app)
@@ -1,6 +1,10 @@
 import uuid
+from datetime import datetime, timezone
+from enum import Enum
 
 from pydantic import EmailStr
+from sqlalchemy import Column, DateTime, FetchedValue, Index, LargeBinary
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field, Relationship, SQLModel  # type: ignore
 
 
@@ -56,6 +60,19 @@ class UsersPublic(SQLModel):
     count: int
 
 
+# Properties to receive via API for bulk operations on users
+class UsersBulk(SQLModel):
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=10_000)
+
+
+class UsersBulkRole(UsersBulk):
+    is_superuser: bool
+
+
+class UsersBulkResult(SQLModel):
+    count: int
+
+
 # Shared properties
 class ItemBase(SQLModel):
     title: str = Field(min_length=1, max_length=255)
@@ -74,12 +91,23 @@ class ItemUpdate(ItemBase):
 
 # Database model, database table inferred from class name
 class Item(ItemBase, table=True):  # type: ignore[call-arg]
+    __table_args__ = (
+        Index("ix_item_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     title: str = Field(max_length=255)
     owner_id: uuid.UUID = Field(
         foreign_key="user.id", nullable=False, ondelete="CASCADE"
     )
     owner: User | None = Relationship(back_populates="items")
+    # Full-text search document of the title and description, kept up to date
+    # by a trigger on the table (migration 5f2b8c7e4a91)
+    search_vector: str | None = Field(
+        default=None,
+        sa_column=Column(TSVECTOR, FetchedValue(), server_onupdate=FetchedValue()),
+        exclude=True,
+    )
 
 
 # Properties to return via API, id is always required
@@ -93,6 +121,11 @@ class ItemsPublic(SQLModel):
     count: int
 
 
+class ItemsSearchPublic(SQLModel):
+    data: list[ItemPublic]
+    next_cursor: str | None = None
+
+
 # Generic message
 class Message(SQLModel):
     message: str
@@ -112,3 +145,87 @@ class TokenPayload(SQLModel):
 class NewPassword(SQLModel):
     token: str
     new_password: str = Field(min_length=8, max_length=40)
+
+
+# Connection pool statistics for the current worker process
+class DBPoolStats(SQLModel):
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+# Readiness of the current worker process
+class Readiness(SQLModel):
+    ready: bool
+    database: bool
+    database_checked_at: datetime | None = None
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+# Shared properties
+class JobBase(SQLModel):
+    job_type: str = Field(max_length=64, index=True)
+    status: JobStatus = Field(default=JobStatus.QUEUED)
+    error: str | None = Field(default=None)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
+    )
+    started_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
+    )
+    finished_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
+    )
+
+
+# Database model for work run by the background job runner
+class Job(JobBase, table=True):  # type: ignore[call-arg]
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    created_by_id: uuid.UUID | None = Field(default=None)
+    # The runner that queued the job, and the last time it reported being alive
+    runner_id: str | None = Field(default=None, max_length=32)
+    heartbeat_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
+    )
+
+
+# Properties to return via API, id is always required
+class JobPublic(JobBase):
+    id: uuid.UUID
+
+
+# Database model for stored responses of requests sent with an Idempotency-Key
+class IdempotencyKey(SQLModel, table=True):  # type: ignore[call-arg]
+    key: str = Field(max_length=255, primary_key=True)
+    # The user the key belongs to, keys of different users don't collide
+    scope: str = Field(max_length=64, primary_key=True)
+    # Hash of the request, a key can't be reused for a different request
+    fingerprint: str = Field(max_length=64)
+    # Unset while the request is being processed
+    status_code: int | None = Field(default=None)
+    content_type: str | None = Field(default=None, max_length=255)
+    response_body: bytes | None = Field(default=None, sa_type=LargeBinary)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
+    )
+    expires_at: datetime = Field(
+        sa_type=DateTime(timezone=True),  # type: ignore[call-overload]
+        index=True,
+    )
@@ -0,0 +1,216 @@
+"""Fill the database with synthetic users and items for performance work.
+
+    python -m app.seed_data --users 1000000 --items-per-user 9 --distribution pareto
+
+Rows are streamed with COPY, one transaction per batch of users and their
+items. All users share one password, so bcrypt only runs once. Each run tags
+its emails, e.g. user-42-3f9a1c@seed.example.com, so runs can be repeated.
+"""
+
+import argparse
+import logging
+import random
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine
+
+from app.core.db import engine
+from app.core.security import get_password_hash
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+EMAIL_DOMAIN = "seed.example.com"
+PASSWORD = "seed-password"
+BATCH_SIZE = 10_000
+DISTRIBUTIONS = ("fixed", "uniform", "exponential", "pareto")
+# Shape of the pareto distribution, lower values give a heavier tail
+PARETO_ALPHA = 1.5
+
+USER_COPY = (
+    'COPY "user" (id, email, hashed_password, full_name, is_active, is_superuser) '
+    "FROM STDIN"
+)
+ITEM_COPY = "COPY item (id, title, description, owner_id) FROM STDIN"
+
+WORDS = [
+    "alpha", "amber", "apple", "arctic", "autumn", "basic", "bright", "bronze",
+    "cable", "canvas", "cedar", "classic", "copper", "coral", "crystal", "daily",
+    "delta", "desert", "digital", "eagle", "echo", "ember", "falcon", "forest",
+    "frozen", "garden", "global", "golden", "granite", "harbor", "hidden",
+    "island", "jade", "lunar", "maple", "marble", "meadow", "metro", "mint",
+    "modern", "nova", "ocean", "orbit", "pacific", "pearl", "pine", "pixel",
+    "prairie", "quartz", "rapid", "river", "robust", "silver", "solar", "spark",
+    "stone", "storm", "summit", "timber", "urban", "velvet", "vintage", "violet",
+    "willow", "winter", "zen",
+]  # fmt: skip
+
+
+class UnknownDistributionError(ValueError):
+    def __init__(self, distribution: str) -> None:
+        super().__init__(f"Unknown distribution: {distribution}")
+
+
+def items_per_user(distribution: str, mean: float, rng: random.Random) -> int:
+    """Draw the number of items of one user, `mean` items on average."""
+    if mean <= 0:
+        return 0
+    if distribution == "fixed":
+        return round(mean)
+    if distribution == "uniform":
+        return rng.randint(0, round(2 * mean))
+    if distribution == "exponential":
+        return round(rng.expovariate(1 / mean))
+    if distribution == "pareto":
+        scale = mean * (PARETO_ALPHA - 1) / PARETO_ALPHA
+        return round(scale * rng.paretovariate(PARETO_ALPHA))
+    raise UnknownDistributionError(distribution)
+
+
+@dataclass
+class SeedStats:
+    # Tag of the run in the seeded emails, see `seed_email`
+    run: str = ""
+    users: int = 0
+    items: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return (self.users + self.items) / self.seconds if self.seconds else 0.0
+
+
+def seed_email(index: int, run: str, domain: str = EMAIL_DOMAIN) -> str:
+    """Email of the `index`-th user seeded by `run`."""
+    return f"user-{index}-{run}@{domain}"
+
+
+def _log_progress(stats: SeedStats, total_users: int) -> None:
+    logger.info(
+        f"{stats.users}/{total_users} users, {stats.items} items, "
+        f"{stats.rows_per_second:,.0f} rows/s"
+    )
+
+
+def seed(
+    db_engine: Engine,
+    users: int,
+    items_per_user_mean: float,
+    distribution: str = "fixed",
+    *,
+    batch_size: int = BATCH_SIZE,
+    random_seed: int | None = None,
+    password: str = PASSWORD,
+    email_domain: str = EMAIL_DOMAIN,
+    progress: Callable[[SeedStats], None] | None = None,
+) -> SeedStats:
+    """COPY `users` users and their items into the database.
+
+    `random_seed` makes the item counts and texts reproducible, ids and emails
+    are unique on every run. `progress` is called after each committed batch.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise UnknownDistributionError(distribution)
+    rng = random.Random(random_seed)
+    id_rng = random.Random()
+    run = f"{id_rng.getrandbits(24):06x}"
+    hashed_password = get_password_hash(password)
+    stats = SeedStats(run=run)
+    start = time.perf_counter()
+    connection = db_engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        for batch_start in range(0, users, batch_size):
+            user_rows: list[tuple[Any, ...]] = []
+            item_rows: list[tuple[Any, ...]] = []
+            for i in range(batch_start, min(batch_start + batch_size, users)):
+                user_id = uuid.UUID(int=id_rng.getrandbits(128), version=4)
+                user_rows.append(
+                    (
+                        user_id,
+                        seed_email(i, run, email_domain),
+                        hashed_password,
+                        f"Seed User {i}",
+                        True,
+                        False,
+                    )
+                )
+                for _ in range(items_per_user(distribution, items_per_user_mean, rng)):
+                    item_rows.append(
+                        (
+                            uuid.UUID(int=id_rng.getrandbits(128), version=4),
+                            " ".join(rng.choices(WORDS, k=3)).capitalize(),
+                            " ".join(rng.choices(WORDS, k=12)),
+                            user_id,
+                        )
+                    )
+            with cursor.copy(USER_COPY) as copy:
+                for row in user_rows:
+                    copy.write_row(row)
+            with cursor.copy(ITEM_COPY) as copy:
+                for row in item_rows:
+                    copy.write_row(row)
+            connection.commit()
+            stats.users += len(user_rows)
+            stats.items += len(item_rows)
+            stats.seconds = time.perf_counter() - start
+            if progress:
+                progress(stats)
+        # Fresh planner statistics, the tables may have grown by orders of magnitude
+        cursor.execute('ANALYZE "user"')
+        cursor.execute("ANALYZE item")
+        connection.commit()
+    finally:
+        connection.close()
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fill the database with synthetic users and items."
+    )
+    parser.add_argument("--users", type=int, required=True)
+    parser.add_argument(
+        "--items-per-user",
+        type=float,
+        default=10,
+        help="average number of items of each user",
+    )
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="fixed")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="users per COPY and transaction, with their items",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--password", default=PASSWORD)
+    args = parser.parse_args()
+
+    logger.info(
+        f"Seeding {args.users} users with {args.items_per_user} items each on "
+        f"average ({args.distribution})"
+    )
+    stats = seed(
+        engine,
+        args.users,
+        args.items_per_user,
+        args.distribution,
+        batch_size=args.batch_size,
+        random_seed=args.seed,
+        password=args.password,
+        progress=lambda stats: _log_progress(stats, args.users),
+    )
+    logger.info(
+        f"Seeded {stats.users} users and {stats.items} items in "
+        f"{stats.seconds:.1f}s ({stats.rows_per_second:,.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 import uuid
 
+import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, col, func, select
 
+from app import crud
 from app.core.config import settings
+from app.core.idempotency import idempotency_store, request_fingerprint
+from app.models import Item, ItemCreate
 from app.tests.utils.item import create_random_item
+from app.tests.utils.user import create_random_user
+from app.tests.utils.utils import random_lower_string
 
 
 def test_create_item(
@@ -162,3 +168,183 @@ def test_delete_item_not_enough_permissions(
     assert response.status_code == 400
     content = response.json()
     assert content["detail"] == "Not enough permissions"
+
+
+def test_search_items(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    # Fixed words the English stemmer leaves as they are
+    word = "quartz"
+    owner = create_random_user(db)
+    in_title = crud.create_item(
+        session=db, item_in=ItemCreate(title=f"{word} pump"), owner_id=owner.id
+    )
+    in_description = crud.create_item(
+        session=db,
+        item_in=ItemCreate(title="Valve", description=f"spare {word}"),
+        owner_id=owner.id,
+    )
+    crud.create_item(session=db, item_in=ItemCreate(title="Other"), owner_id=owner.id)
+    response = client.get(
+        f"{settings.API_V1_STR}/items/search",
+        headers=superuser_token_headers,
+        params={"q": word[:4]},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    # Title matches rank above description matches
+    assert [item["id"] for item in content["data"]] == [
+        str(in_title.id),
+        str(in_description.id),
+    ]
+    assert content["next_cursor"] is None
+
+
+def test_search_items_keyset_pagination(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    word = "basalt"
+    owner = create_random_user(db)
+    created = {
+        str(
+            crud.create_item(
+                session=db, item_in=ItemCreate(title=f"{word} {i}"), owner_id=owner.id
+            ).id
+        )
+        for i in range(5)
+    }
+    seen: list[str] = []
+    cursor = None
+    for _ in range(3):
+        params: dict[str, str | int] = {"q": word, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(
+            f"{settings.API_V1_STR}/items/search",
+            headers=superuser_token_headers,
+            params=params,
+        )
+        assert response.status_code == 200
+        content = response.json()
+        seen += [item["id"] for item in content["data"]]
+        cursor = content["next_cursor"]
+    assert cursor is None
+    assert len(seen) == 5
+    assert set(seen) == created
+
+
+def test_search_items_only_own_items(
+    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+) -> None:
+    word = "cobalt"
+    owner = create_random_user(db)
+    crud.create_item(session=db, item_in=ItemCreate(title=word), owner_id=owner.id)
+    response = client.get(
+        f"{settings.API_V1_STR}/items/search",
+        headers=normal_user_token_headers,
+        params={"q": word},
+    )
+    assert response.status_code == 200
+    assert response.json()["data"] == []
+
+
+def test_search_items_invalid_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/items/search",
+        headers=superuser_token_headers,
+        params={"q": "pump", "cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_create_item_idempotency_key_replays_response(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    title = random_lower_string()
+    headers = {**superuser_token_headers, "Idempotency-Key": random_lower_string()}
+    data = {"title": title, "description": "Fighters"}
+    r1 = client.post(f"{settings.API_V1_STR}/items/", headers=headers, json=data)
+    r2 = client.post(f"{settings.API_V1_STR}/items/", headers=headers, json=data)
+    assert r1.status_code == r2.status_code == 200
+    assert "idempotent-replayed" not in r1.headers
+    assert r2.headers["idempotent-replayed"] == "true"
+    assert r2.json() == r1.json()
+    count = db.exec(
+        select(func.count()).select_from(Item).where(col(Item.title) == title)
+    ).one()
+    assert count == 1
+
+
+def test_create_item_idempotency_key_different_request(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    headers = {**superuser_token_headers, "Idempotency-Key": random_lower_string()}
+    r = client.post(
+        f"{settings.API_V1_STR}/items/", headers=headers, json={"title": "Foo"}
+    )
+    assert r.status_code == 200
+    r = client.post(
+        f"{settings.API_V1_STR}/items/", headers=headers, json={"title": "Bar"}
+    )
+    assert r.status_code == 422
+    assert (
+        r.json()["detail"] == "Idempotency-Key was already used for a different request"
+    )
+
+
+def test_create_item_idempotency_key_in_flight(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    key = random_lower_string()
+    user = client.get(
+        f"{settings.API_V1_STR}/users/me", headers=superuser_token_headers
+    ).json()
+    url = f"{settings.API_V1_STR}/items/"
+    body = b'{"title": "Foo"}'
+    fingerprint = request_fingerprint("POST", url, "", body)
+    # Another request with the key is still being processed
+    assert idempotency_store.claim(key, user["id"], fingerprint) is None
+    r = client.post(
+        url,
+        headers={
+            **superuser_token_headers,
+            "Idempotency-Key": key,
+            "Content-Type": "application/json",
+        },
+        content=body,
+    )
+    assert r.status_code == 409
+    assert (
+        r.json()["detail"] == "A request with this Idempotency-Key is being processed"
+    )
+
+
+def test_create_item_idempotency_key_stale_claim(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    key = random_lower_string()
+    user = client.get(
+        f"{settings.API_V1_STR}/users/me", headers=superuser_token_headers
+    ).json()
+    url = f"{settings.API_V1_STR}/items/"
+    body = b'{"title": "Foo"}'
+    headers = {
+        **superuser_token_headers,
+        "Idempotency-Key": key,
+        "Content-Type": "application/json",
+    }
+    # The worker handling the first request died, its lease has run out
+    monkeypatch.setattr(idempotency_store, "lease", 0)
+    fingerprint = request_fingerprint("POST", url, "", body)
+    assert idempotency_store.claim(key, user["id"], fingerprint) is None
+    r1 = client.post(url, headers=headers, content=body)
+    assert r1.status_code == 200
+    # The saved response is kept for the full TTL
+    r2 = client.post(url, headers=headers, content=body)
+    assert r2.headers["idempotent-replayed"] == "true"
+    assert r2.json() == r1.json()
@@ -2,13 +2,15 @@ import uuid
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app import crud
 from app.core.config import settings
 from app.core.security import verify_password
-from app.models import User, UserCreate
-from app.tests.utils.utils import random_email, random_lower_string
+from app.models import Item, User, UserCreate
+from app.tests.utils.item import create_random_item
+from app.tests.utils.user import create_random_user
+from app.tests.utils.utils import random_email, random_lower_string, wait_for_job
 
 
 def test_get_users_superuser_me(
@@ -304,6 +306,36 @@ def test_register_user(client: TestClient, db: Session) -> None:
     assert verify_password(password, user_db.hashed_password)
 
 
+def test_register_user_idempotency_key(client: TestClient, db: Session) -> None:
+    username = random_email()
+    data = {"email": username, "password": random_lower_string()}
+    headers = {"Idempotency-Key": random_lower_string()}
+    r1 = client.post(f"{settings.API_V1_STR}/users/signup", headers=headers, json=data)
+    # Without the key the retry would fail, the user already exists
+    r2 = client.post(f"{settings.API_V1_STR}/users/signup", headers=headers, json=data)
+    assert r1.status_code == r2.status_code == 200
+    assert r2.headers["idempotent-replayed"] == "true"
+    assert r2.json() == r1.json()
+    users = db.exec(select(User).where(User.email == username)).all()
+    assert len(users) == 1
+
+
+def test_register_user_idempotency_key_other_client(client: TestClient) -> None:
+    headers = {"Idempotency-Key": random_lower_string()}
+    responses = [
+        client.post(
+            f"{settings.API_V1_STR}/users/signup",
+            headers=headers,
+            json={"email": random_email(), "password": random_lower_string()},
+        )
+        for _ in range(2)
+    ]
+    # Another anonymous client reusing the key gets its own response
+    assert [r.status_code for r in responses] == [200, 200]
+    assert "idempotent-replayed" not in responses[1].headers
+    assert responses[1].json()["id"] != responses[0].json()["id"]
+
+
 def test_register_user_already_exists_error(client: TestClient) -> None:
     password = random_lower_string()
     full_name = random_lower_string()
@@ -437,9 +469,11 @@ def test_delete_user_super_user(
         f"{settings.API_V1_STR}/users/{user_id}",
         headers=superuser_token_headers,
     )
-    assert r.status_code == 200
-    deleted_user = r.json()
-    assert deleted_user["message"] == "User deleted successfully"
+    assert r.status_code == 202
+    job = wait_for_job(client, superuser_token_headers, r.json()["id"])
+    assert job["job_type"] == "delete_user"
+    assert job["status"] == "succeeded"
+    db.expire_all()
     result = db.exec(select(User).where(User.id == user_id)).first()
     assert result is None
 
@@ -484,3 +518,92 @@ def test_delete_user_without_privileges(
     )
     assert r.status_code == 403
     assert r.json()["detail"] == "The user doesn't have enough privileges"
+
+
+def test_bulk_deactivate_and_activate_users(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    users = [create_random_user(db) for _ in range(3)]
+    ids = [str(user.id) for user in users]
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk/deactivate",
+        headers=superuser_token_headers,
+        json={"ids": ids},
+    )
+    assert r.status_code == 200
+    assert r.json()["count"] == 3
+    db.expire_all()
+    assert all(not db.get(User, user.id).is_active for user in users)  # type: ignore
+
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk/activate",
+        headers=superuser_token_headers,
+        json={"ids": [*ids, str(uuid.uuid4())]},
+    )
+    assert r.status_code == 200
+    assert r.json()["count"] == 3
+    db.expire_all()
+    assert all(db.get(User, user.id).is_active for user in users)  # type: ignore
+
+
+def test_bulk_deactivate_users_self(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    super_user = crud.get_user_by_email(session=db, email=settings.FIRST_SUPERUSER)
+    assert super_user
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk/deactivate",
+        headers=superuser_token_headers,
+        json={"ids": [str(super_user.id)]},
+    )
+    assert r.status_code == 403
+    assert r.json()["detail"] == "Super users are not allowed to deactivate themselves"
+
+
+def test_bulk_set_users_role(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    users = [create_random_user(db) for _ in range(2)]
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk/role",
+        headers=superuser_token_headers,
+        json={"ids": [str(user.id) for user in users], "is_superuser": True},
+    )
+    assert r.status_code == 200
+    assert r.json()["count"] == 2
+    db.expire_all()
+    assert all(db.get(User, user.id).is_superuser for user in users)  # type: ignore
+
+
+def test_bulk_delete_users(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    item = create_random_item(db)
+    item_id = item.id
+    user = create_random_user(db)
+    ids = [str(item.owner_id), str(user.id)]
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk/delete",
+        headers=superuser_token_headers,
+        json={"ids": ids},
+    )
+    assert r.status_code == 202
+    job = wait_for_job(client, superuser_token_headers, r.json()["id"])
+    assert job["job_type"] == "delete_users"
+    assert job["status"] == "succeeded"
+    db.expire_all()
+    assert db.exec(select(User).where(col(User.id).in_(ids))).first() is None
+    assert db.get(Item, item_id) is None
+
+
+def test_bulk_delete_users_without_privileges(
+    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+) -> None:
+    user = create_random_user(db)
+    r = client.post(
+        f"{settings.API_V1_STR}/users/bulk/delete",
+        headers=normal_user_token_headers,
+        json={"ids": [str(user.id)]},
+    )
+    assert r.status_code == 403
+    assert r.json()["detail"] == "The user doesn't have enough privileges"
@@ -0,0 +1,116 @@
+import uuid
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.health import db_health
+from app.tests.utils.utils import wait_for_job
+
+
+def test_db_pool_stats(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/db-pool/",
+        headers=superuser_token_headers,
+    )
+    assert r.status_code == 200
+    stats = r.json()
+    assert stats["pool_size"] == settings.POSTGRES_POOL_SIZE
+    assert stats["max_overflow"] == settings.POSTGRES_MAX_OVERFLOW
+    assert stats["checkouts"] > 0
+    assert stats["checked_out"] + stats["idle"] >= 1
+
+
+def test_db_pool_stats_normal_user(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/db-pool/",
+        headers=normal_user_token_headers,
+    )
+    assert r.status_code == 403
+
+
+def test_test_email_runs_in_background(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    with patch("app.jobs.send_email", return_value=None) as send_email:
+        r = client.post(
+            f"{settings.API_V1_STR}/utils/test-email/",
+            headers=superuser_token_headers,
+            params={"email_to": "test@example.com"},
+        )
+        assert r.status_code == 202
+        job = r.json()
+        assert job["job_type"] == "send_email"
+        assert job["status"] in ("queued", "running", "succeeded")
+        job = wait_for_job(client, superuser_token_headers, job["id"])
+    assert job["status"] == "succeeded"
+    assert job["started_at"] is not None
+    assert job["finished_at"] is not None
+    send_email.assert_called_once()
+    assert send_email.call_args.kwargs["email_to"] == "test@example.com"
+
+
+def test_failed_job_records_error(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    with patch("app.jobs.send_email", side_effect=RuntimeError("SMTP is down")):
+        r = client.post(
+            f"{settings.API_V1_STR}/utils/test-email/",
+            headers=superuser_token_headers,
+            params={"email_to": "test@example.com"},
+        )
+        job = wait_for_job(client, superuser_token_headers, r.json()["id"])
+    assert job["status"] == "failed"
+    assert job["error"] == "SMTP is down"
+
+
+def test_read_job_not_found(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/jobs/{uuid.uuid4()}",
+        headers=superuser_token_headers,
+    )
+    assert r.status_code == 404
+    assert r.json()["detail"] == "Job not found"
+
+
+def test_liveness(client: TestClient) -> None:
+    r = client.get(f"{settings.API_V1_STR}/utils/health/live/")
+    assert r.status_code == 200
+    assert r.json() is True
+
+
+def test_readiness(client: TestClient) -> None:
+    r = client.get(f"{settings.API_V1_STR}/utils/health/ready/")
+    assert r.status_code == 200
+    readiness = r.json()
+    assert readiness["ready"] is True
+    assert readiness["database"] is True
+    assert readiness["database_checked_at"] is not None
+
+
+def test_readiness_database_down(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(db_health, "healthy", False)
+    r = client.get(f"{settings.API_V1_STR}/utils/health/ready/")
+    assert r.status_code == 503
+    assert r.json()["ready"] is False
+    assert r.json()["database"] is False
+
+
+def test_readiness_outdated_check(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The background check stopped refreshing the result
+    monkeypatch.setattr(db_health, "_checked_monotonic", 0.0)
+    r = client.get(f"{settings.API_V1_STR}/utils/health/ready/")
+    assert r.status_code == 503
+    assert r.json()["ready"] is False
+    assert r.json()["database"] is True
@@ -1,32 +1,117 @@
+import os
 from collections.abc import Generator
+from pathlib import Path
 
 import pytest
-from app.core.config import settings
-from app.core.db import engine, init_db
-from app.main import app
-from app.models import Item, User
-from app.tests.utils.user import authentication_token_from_email
-from app.tests.utils.utils import get_superuser_token_headers
+from alembic import command
+from alembic.config import Config
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
 from sqlmodel import Session, delete
 
+from app.core.config import settings
+
+# Settings read when the engine and password context are created, so they must
+# be changed before the rest of the app is imported.
+# Fast bcrypt hashing, the minimum work factor is plenty for tests
+settings.PASSWORD_BCRYPT_ROUNDS = 4
+# Every pytest-xdist worker gets its own database, e.g. app_gw0
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if XDIST_WORKER:
+    settings.POSTGRES_DB = f"{settings.POSTGRES_DB}_{XDIST_WORKER}"
+
+from app.api.deps import SessionDep, get_db, get_read_db  # noqa: E402
+from app.core.db import engine, init_db  # noqa: E402
+from app.core.idempotency import idempotency_store  # noqa: E402
+from app.core.jobs import job_runner  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Item, Job, User  # noqa: E402
+from app.tests.utils.user import authentication_token_from_email  # noqa: E402
+from app.tests.utils.utils import get_superuser_token_headers  # noqa: E402
+
+BACKEND_DIR = Path(__file__).parents[2]
+
+
+def _execute_on_server(statement: str) -> None:
+    """Run a statement outside of any transaction on the maintenance database."""
+    server_engine = create_engine(
+        str(engine.url.set(database="postgres")), isolation_level="AUTOCOMMIT"
+    )
+    with server_engine.connect() as connection:
+        connection.execute(text(statement))
+    server_engine.dispose()
+
+
+def _create_worker_database() -> None:
+    _execute_on_server(f'DROP DATABASE IF EXISTS "{settings.POSTGRES_DB}"')
+    _execute_on_server(f'CREATE DATABASE "{settings.POSTGRES_DB}"')
+    alembic_cfg = Config(str(BACKEND_DIR / "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", str(BACKEND_DIR / "app/alembic"))
+    command.upgrade(alembic_cfg, "head")
+
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope="session", autouse=True)
+def database() -> Generator[None, None, None]:
+    """Prepare the database once per test session (or xdist worker).
+
+    Only the data created here, and by the module scoped token fixtures, is
+    committed. Everything a test does is rolled back by the `db` fixture.
+    """
+    if XDIST_WORKER:
+        _create_worker_database()
+    with Session(engine) as session:
+        init_db(session)
+    yield
+    if XDIST_WORKER:
+        engine.dispose()
+        _execute_on_server(f'DROP DATABASE IF EXISTS "{settings.POSTGRES_DB}"')
+        return
+    with Session(engine) as session:
+        session.execute(delete(Job))
+        session.execute(delete(Item))
+        session.execute(delete(User))
+        session.commit()
+
+
+@pytest.fixture(autouse=True)
 def db() -> Generator[Session, None, None]:
-    try:
-        with Session(engine) as session:
-            init_db(session)
+    """Run each test inside a transaction that is rolled back afterwards.
+
+    The test, the API, background jobs and the idempotency store share one
+    connection. Their sessions turn commits into SAVEPOINT releases so the outer
+    transaction never commits.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    def session_factory() -> Session:
+        return Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    def get_test_db() -> Generator[Session, None, None]:
+        with session_factory() as session:
             yield session
-            statement = delete(Item)
-            session.execute(statement)
-            statement = delete(User)
-            session.execute(statement)
-            session.commit()
-    except Exception as e:
-        import logging
 
-        logging.getLogger("test").warning(f"Database connection failed: {e}")
-        yield None
+    # Reads share the request's session, two sessions on one connection could
+    # release their savepoints out of order
+    def get_test_read_db(session: SessionDep) -> Session:
+        return session
+
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_read_db] = get_test_read_db
+    job_runner.session_factory = session_factory
+    job_runner.eager = True
+    idempotency_store.session_factory = session_factory
+    try:
+        with session_factory() as session:
+            yield session
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_read_db, None)
+        job_runner.session_factory = lambda: Session(engine)
+        job_runner.eager = False
+        idempotency_store.session_factory = lambda: Session(engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="module")
@@ -41,7 +126,8 @@ def superuser_token_headers(client: TestClient) -> dict[str, str]:
 
 
 @pytest.fixture(scope="module")
-def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]:
-    return authentication_token_from_email(
-        client=client, email=settings.EMAIL_TEST_USER, db=db
-    )
+def normal_user_token_headers(client: TestClient) -> dict[str, str]:
+    with Session(engine) as session:
+        return authentication_token_from_email(
+            client=client, email=settings.EMAIL_TEST_USER, db=session
+        )
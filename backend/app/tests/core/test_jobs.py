@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.jobs import job_runner
+from app.models import Job, JobStatus
+
+
+def make_job(db: Session, status: JobStatus, heartbeat_age: float) -> Job:
+    heartbeat_at = datetime.now(timezone.utc) - timedelta(seconds=heartbeat_age)
+    job = Job(
+        job_type="send_email",
+        status=status,
+        runner_id="other",
+        created_at=heartbeat_at,
+        heartbeat_at=heartbeat_at,
+    )
+    db.add(job)
+    db.commit()
+    return job
+
+
+def test_fail_stale_jobs(db: Session) -> None:
+    stale_age = 4 * settings.JOBS_HEARTBEAT_INTERVAL
+    queued = make_job(db, JobStatus.QUEUED, stale_age)
+    running = make_job(db, JobStatus.RUNNING, stale_age)
+    finished = make_job(db, JobStatus.SUCCEEDED, stale_age)
+    # Still beating, its runner is alive
+    alive = make_job(db, JobStatus.RUNNING, 1)
+
+    assert job_runner.fail_stale_jobs() == 2
+
+    for job in (queued, running, finished, alive):
+        db.refresh(job)
+    assert queued.status == JobStatus.FAILED
+    assert running.status == JobStatus.FAILED
+    assert running.error
+    assert running.finished_at is not None
+    assert finished.status == JobStatus.SUCCEEDED
+    assert alive.status == JobStatus.RUNNING
+
+
+def test_touch_jobs(db: Session) -> None:
+    job = make_job(db, JobStatus.RUNNING, 4 * settings.JOBS_HEARTBEAT_INTERVAL)
+    job.runner_id = job_runner.runner_id
+    db.add(job)
+    db.commit()
+
+    job_runner.touch_jobs()
+
+    assert job_runner.fail_stale_jobs() == 0
+    db.refresh(job)
+    assert job.status == JobStatus.RUNNING
@@ -0,0 +1,100 @@
+import io
+from collections.abc import Generator
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Connection, text
+
+from app.core import migrations
+from app.core.db import engine
+
+
+@pytest.fixture
+def connection() -> Generator[Connection, None, None]:
+    """A connection outside of the rolled back test transaction, the helpers
+    commit on their own."""
+    with engine.connect() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE migration_test "
+                "(id serial PRIMARY KEY, value int, doubled int)"
+            )
+        )
+        connection.execute(
+            text("INSERT INTO migration_test (value) SELECT generate_series(1, 25)")
+        )
+        connection.commit()
+        yield connection
+        connection.rollback()
+        connection.execute(text("DROP TABLE migration_test"))
+        connection.commit()
+
+
+def test_backfill_in_batches(connection: Connection) -> None:
+    context = MigrationContext.configure(connection)
+    with Operations.context(context):
+        updated = migrations.backfill(
+            "migration_test",
+            "doubled = value * 2",
+            "doubled IS NULL",
+            chunk_size=10,
+            sleep=0,
+        )
+    assert updated == 25
+    remaining = connection.execute(
+        text("SELECT count(*) FROM migration_test WHERE doubled <> value * 2")
+    ).scalar()
+    assert remaining == 0
+
+
+def test_create_and_drop_index_concurrently(connection: Connection) -> None:
+    context = MigrationContext.configure(connection)
+    with Operations.context(context):
+        migrations.create_index_concurrently(
+            "ix_migration_test_value", "migration_test", ["value"]
+        )
+        # Running it again is a no-op
+        migrations.create_index_concurrently(
+            "ix_migration_test_value", "migration_test", ["value"]
+        )
+    assert connection.execute(
+        text("SELECT to_regclass('ix_migration_test_value')")
+    ).scalar()
+    connection.commit()
+    with Operations.context(context):
+        migrations.drop_index_concurrently("ix_migration_test_value", "migration_test")
+    assert not connection.execute(
+        text("SELECT to_regclass('ix_migration_test_value')")
+    ).scalar()
+
+
+def test_lock_timeout_is_restored(connection: Connection) -> None:
+    context = MigrationContext.configure(connection)
+    before = connection.execute(text("SHOW lock_timeout")).scalar()
+    with Operations.context(context), migrations.lock_timeout("250ms"):
+        inside = connection.execute(text("SHOW lock_timeout")).scalar()
+    assert inside == "250ms"
+    assert connection.execute(text("SHOW lock_timeout")).scalar() == before
+
+
+def test_dry_run_reports_lock_impact(connection: Connection) -> None:
+    output = io.StringIO()
+    context = MigrationContext.configure(
+        dialect_name="postgresql",
+        opts={"as_sql": True, "output_buffer": output},
+    )
+    with Operations.context(context):
+        assert migrations.is_dry_run()
+        migrations.create_index_concurrently(
+            "ix_migration_test_value", "migration_test", ["value"]
+        )
+        assert migrations.backfill("migration_test", "doubled = value * 2") == 0
+    sql = output.getvalue()
+    assert "SHARE UPDATE EXCLUSIVE" in sql
+    assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_migration_test_value" in sql
+    assert "Backfill in batches of" in sql
+    count = connection.execute(
+        text("SELECT count(*) FROM migration_test WHERE doubled IS NOT NULL")
+    ).scalar()
+    assert count == 0
@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.openapi import OpenAPIDocument, render_openapi
+from app.main import app, openapi_document
+
+OPENAPI_URL = f"{settings.API_V1_STR}/openapi.json"
+
+
+def test_openapi_document_is_served(client: TestClient) -> None:
+    r = client.get(OPENAPI_URL)
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert r.headers["etag"] == openapi_document.etag
+    assert r.json() == app.openapi()
+
+
+def test_openapi_document_not_modified(client: TestClient) -> None:
+    etag = client.get(OPENAPI_URL).headers["etag"]
+    r = client.get(OPENAPI_URL, headers={"If-None-Match": f'"other", {etag}'})
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["etag"] == etag
+
+
+def test_openapi_document_stale_etag(client: TestClient) -> None:
+    r = client.get(OPENAPI_URL, headers={"If-None-Match": '"stale"'})
+    assert r.status_code == 200
+
+
+def test_openapi_document_from_file(tmp_path: Path) -> None:
+    schema_file = tmp_path / "openapi.json"
+    schema_file.write_bytes(render_openapi(app, indent=2))
+    document = OpenAPIDocument(app)
+    with patch.object(settings, "OPENAPI_SCHEMA_FILE", str(schema_file)):
+        document.load()
+    assert document.content == schema_file.read_bytes()
+    assert json.loads(document.content) == app.openapi()
+
+
+def test_openapi_document_stale_file(tmp_path: Path) -> None:
+    schema_file = tmp_path / "openapi.json"
+    schema_file.write_text(json.dumps({**app.openapi(), "paths": {}}))
+    document = OpenAPIDocument(app)
+    with patch.object(settings, "OPENAPI_SCHEMA_FILE", str(schema_file)):
+        document.load()
+    assert document.content == render_openapi(app)
+    with (
+        patch.object(settings, "OPENAPI_SCHEMA_FILE", str(schema_file)),
+        patch.object(settings, "ENVIRONMENT", "production"),
+    ):
+        document.load()
+    assert document.content == schema_file.read_bytes()
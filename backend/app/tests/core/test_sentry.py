@@ -0,0 +1,39 @@
+from app.core.config import Settings, settings
+from app.core.sentry import traces_sampler
+
+
+def _context(path: str, parent_sampled: bool | None = None) -> dict[str, object]:
+    return {
+        "parent_sampled": parent_sampled,
+        "asgi_scope": {"type": "http", "path": path},
+    }
+
+
+def test_health_check_is_never_traced() -> None:
+    assert traces_sampler(_context(f"{settings.API_V1_STR}/utils/health-check/")) == 0
+
+
+def test_hot_routes_use_lower_rate() -> None:
+    rate = traces_sampler(_context(f"{settings.API_V1_STR}/users/me"))
+    assert rate == settings.SENTRY_HOT_ROUTES_SAMPLE_RATE
+    rate = traces_sampler(_context(f"{settings.API_V1_STR}/items/some-id"))
+    assert rate == settings.SENTRY_HOT_ROUTES_SAMPLE_RATE
+
+
+def test_other_routes_use_default_rate() -> None:
+    rate = traces_sampler(_context(f"{settings.API_V1_STR}/users/signup"))
+    assert rate == settings.SENTRY_TRACES_SAMPLE_RATE
+    assert traces_sampler({}) == settings.SENTRY_TRACES_SAMPLE_RATE
+
+
+def test_parent_decision_is_kept() -> None:
+    path = f"{settings.API_V1_STR}/utils/health-check/"
+    assert traces_sampler(_context(path, parent_sampled=True)) == 1.0
+    path = f"{settings.API_V1_STR}/users/signup"
+    assert traces_sampler(_context(path, parent_sampled=False)) == 0.0
+
+
+def test_default_routes_follow_api_prefix() -> None:
+    custom = Settings(API_V1_STR="/api/v2")  # type: ignore[call-arg]
+    assert "/api/v2/users/me" in custom.SENTRY_HOT_ROUTES
+    assert "/api/v2/utils/health-check/" in custom.SENTRY_IGNORED_ROUTES
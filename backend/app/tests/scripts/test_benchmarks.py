@@ -0,0 +1,50 @@
+from typing import Any
+
+from benchmarks.report import ScenarioResult, compare, percentile
+
+
+def _results(rps: float, p95_ms: float, errors: int = 0) -> dict[str, Any]:
+    return {
+        "scenarios": {
+            "users_me": {
+                "rps": rps,
+                "p95_ms": p95_ms,
+                "p99_ms": p95_ms,
+                "errors": errors,
+            }
+        }
+    }
+
+
+def test_percentile() -> None:
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 95) == 0.0
+
+
+def test_scenario_summary() -> None:
+    result = ScenarioResult(
+        name="users_me", concurrency=2, duration=2.0, latencies=[0.01, 0.02, 0.03]
+    )
+    result.errors = 1
+    summary = result.summary()
+    assert summary["requests"] == 4
+    assert summary["rps"] == 2.0
+    assert summary["p50_ms"] == 20.0
+    assert summary["p99_ms"] == 30.0
+
+
+def test_compare_within_tolerance() -> None:
+    assert compare(_results(100, 50), _results(95, 54), tolerance=0.1) == []
+
+
+def test_compare_detects_regressions() -> None:
+    regressions = compare(_results(100, 50), _results(80, 60, errors=3), 0.1)
+    assert regressions == [
+        "users_me: rps dropped from 100 to 80",
+        "users_me: p95_ms grew from 50 to 60",
+        "users_me: p99_ms grew from 50 to 60",
+        "users_me: 3 failed requests",
+    ]
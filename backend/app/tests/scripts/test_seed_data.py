@@ -0,0 +1,56 @@
+import random
+
+import pytest
+from sqlmodel import Session, col, delete, func, select
+
+from app.core.db import engine
+from app.models import Item, User
+from app.seed_data import (
+    EMAIL_DOMAIN,
+    SeedStats,
+    UnknownDistributionError,
+    items_per_user,
+    seed,
+)
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "exponential", "pareto"])
+def test_items_per_user_mean(distribution: str) -> None:
+    rng = random.Random(0)
+    counts = [items_per_user(distribution, 10, rng) for _ in range(20_000)]
+    assert min(counts) >= 0
+    assert 8 < sum(counts) / len(counts) < 12
+
+
+def test_items_per_user_fixed() -> None:
+    rng = random.Random(0)
+    assert items_per_user("fixed", 3, rng) == 3
+    assert items_per_user("pareto", 0, rng) == 0
+    with pytest.raises(UnknownDistributionError, match="normal"):
+        items_per_user("normal", 3, rng)
+
+
+def test_seed() -> None:
+    progress: list[SeedStats] = []
+    stats = seed(engine, 25, 3, "fixed", batch_size=10, progress=progress.append)
+    try:
+        assert stats.users == 25
+        assert stats.items == 75
+        assert len(progress) == 3
+        with Session(engine) as session:
+            users = session.exec(
+                select(User).where(col(User.email).endswith(f"@{EMAIL_DOMAIN}"))
+            ).all()
+            assert len(users) == 25
+            item_count = session.exec(
+                select(func.count())
+                .select_from(Item)
+                .where(col(Item.owner_id).in_([user.id for user in users]))
+            ).one()
+            assert item_count == 75
+    finally:
+        with Session(engine) as session:
+            session.execute(
+                delete(User).where(col(User.email).endswith(f"@{EMAIL_DOMAIN}"))
+            )
+            session.commit()
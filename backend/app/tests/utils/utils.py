@@ -1,5 +1,7 @@
 import random
 import string
+import time
+from typing import Any
 
 from fastapi.testclient import TestClient
 
@@ -24,3 +26,16 @@ def get_superuser_token_headers(client: TestClient) -> dict[str, str]:
     a_token = tokens["access_token"]
     headers = {"Authorization": f"Bearer {a_token}"}
     return headers
+
+
+def wait_for_job(
+    client: TestClient, headers: dict[str, str], job_id: str, timeout: float = 10
+) -> dict[str, Any]:
+    """Poll a background job until it finished and return its final state."""
+    deadline = time.monotonic() + timeout
+    while True:
+        r = client.get(f"{settings.API_V1_STR}/utils/jobs/{job_id}", headers=headers)
+        job: dict[str, Any] = r.json()
+        if job["status"] in ("succeeded", "failed") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
@@ -0,0 +1,4 @@
+"""HTTP load and latency benchmarks for the backend API.
+
+Run with `python -m benchmarks --help` from the backend directory.
+"""
@@ -0,0 +1,212 @@
+"""Benchmark the API under load.
+
+Seeds benchmark users and items, starts the app with uvicorn (unless
+--base-url points at a running server), runs each scenario for --duration
+seconds and writes RPS and latency percentiles as JSON. With --baseline the
+results are compared against a previous run and the exit code is 1 on a
+regression.
+
+    python -m benchmarks --users 100 --items 10000 --output baseline.json
+    python -m benchmarks --users 100 --items 10000 --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+from app.core.db import engine
+from benchmarks.report import compare
+from benchmarks.scenarios import SCENARIOS, BenchmarkContext, login, run_scenario
+from benchmarks.seed import cleanup, seed
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+)
+logger = logging.getLogger("benchmarks")
+# One line per request would slow the client down
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+@contextmanager
+def serve(workers: int, startup_timeout: float = 30.0) -> Iterator[str]:
+    """Run the app with uvicorn on a free local port and yield its base URL."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        cwd=BACKEND_DIR,
+    )
+    base_url = f"http://127.0.0.1:{port}{settings.API_V1_STR}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                httpx.get(f"{base_url}/utils/health-check/").raise_for_status()
+                break
+            except httpx.HTTPError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("The API server did not start") from None
+                time.sleep(0.2)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def run(
+    base_url: str, emails: list[str], items: int, args: argparse.Namespace
+) -> dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        auth_headers = await login(client, emails[: args.concurrency])
+        ctx = BenchmarkContext(
+            client=client,
+            emails=emails,
+            auth_headers=auth_headers,
+            items_per_user=items // len(emails),
+            page_size=args.page_size,
+        )
+        scenarios = {}
+        for name in args.scenarios:
+            logger.info(f"Running {name} for {args.duration}s")
+            result = await run_scenario(name, ctx, args.concurrency, args.duration)
+            scenarios[name] = result.summary()
+            logger.info(f"{name}: {scenarios[name]}")
+    return {
+        "config": {
+            "users": len(emails),
+            "items": items,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "page_size": args.page_size,
+            "server_workers": args.workers,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Load and latency benchmarks for the API.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--users", type=int, default=100, help="Users to seed")
+    parser.add_argument("--items", type=int, default=10_000, help="Items to seed")
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        help="Scenarios to run",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="Concurrent clients"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="Seconds per scenario"
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=100, help="Page size for item_paging"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="Request timeout in seconds"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="uvicorn worker processes"
+    )
+    parser.add_argument(
+        "--base-url",
+        help="API base URL of an already running server, e.g. "
+        "http://localhost:8000/api/v1. It must use the same database.",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results to this file")
+    parser.add_argument(
+        "--baseline", type=Path, help="Compare the results against this file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed relative regression against the baseline",
+    )
+    parser.add_argument(
+        "--keep-data", action="store_true", help="Don't delete the seeded data"
+    )
+    args = parser.parse_args(argv)
+    if args.users < 1 or args.concurrency < 1:
+        parser.error("--users and --concurrency must be at least 1")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    # Remove the leftovers of an interrupted run
+    cleanup(engine)
+    seeded = seed(engine, args.users, args.items)
+    try:
+        if args.base_url:
+            results = asyncio.run(run(args.base_url, seeded.emails, args.items, args))
+        else:
+            with serve(args.workers) as base_url:
+                results = asyncio.run(run(base_url, seeded.emails, args.items, args))
+    finally:
+        if not args.keep_data:
+            cleanup(engine)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+        logger.info(f"Results written to {args.output}")
+    else:
+        sys.stdout.write(output + "\n")
+
+    if args.baseline:
+        regressions = compare(
+            json.loads(args.baseline.read_text()), results, args.tolerance
+        )
+        for regression in regressions:
+            logger.error(f"Regression: {regression}")
+        if regressions:
+            return 1
+        logger.info("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `values`, 0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    concurrency: int
+    duration: float = 0.0  # seconds
+    latencies: list[float] = field(default_factory=list)  # seconds
+    errors: int = 0
+
+    def summary(self) -> dict[str, Any]:
+        requests = len(self.latencies) + self.errors
+        return {
+            "concurrency": self.concurrency,
+            "requests": requests,
+            "errors": self.errors,
+            "duration_s": round(self.duration, 3),
+            "rps": round(requests / self.duration, 2) if self.duration else 0.0,
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 2),
+        }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Return the regressions of `current` against `baseline`.
+
+    A scenario regresses when its RPS drops, or its p95 or p99 latency grows,
+    by more than `tolerance` (0.1 is 10%), or when it starts failing requests.
+    """
+    regressions = []
+    for name, base in baseline["scenarios"].items():
+        result = current["scenarios"].get(name)
+        if result is None:
+            continue
+        if result["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: rps dropped from {base['rps']} to {result['rps']}"
+            )
+        for metric in ("p95_ms", "p99_ms"):
+            if result[metric] > base[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} grew from {base[metric]} to {result[metric]}"
+                )
+        if result["errors"] and not base["errors"]:
+            regressions.append(f"{name}: {result['errors']} failed requests")
+    return regressions
@@ -0,0 +1,143 @@
+import asyncio
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from benchmarks.report import ScenarioResult
+from benchmarks.seed import PASSWORD
+
+
+@dataclass
+class BenchmarkContext:
+    client: httpx.AsyncClient
+    emails: list[str]
+    # Authorization headers of the users the authenticated scenarios run as
+    auth_headers: list[dict[str, str]]
+    items_per_user: int
+    page_size: int
+
+
+Scenario = Callable[[BenchmarkContext, ScenarioResult, random.Random], Awaitable[None]]
+
+
+async def _request(
+    ctx: BenchmarkContext,
+    result: ScenarioResult,
+    method: str,
+    url: str,
+    **kwargs: Any,
+) -> httpx.Response | None:
+    """Send a timed request, failed requests are counted but not timed."""
+    start = time.perf_counter()
+    try:
+        response = await ctx.client.request(method, url, **kwargs)
+    except httpx.HTTPError:
+        result.errors += 1
+        return None
+    elapsed = time.perf_counter() - start
+    if response.is_error:
+        result.errors += 1
+        return None
+    result.latencies.append(elapsed)
+    return response
+
+
+async def login_storm(
+    ctx: BenchmarkContext, result: ScenarioResult, rng: random.Random
+) -> None:
+    await _request(
+        ctx,
+        result,
+        "POST",
+        "/login/access-token",
+        data={"username": rng.choice(ctx.emails), "password": PASSWORD},
+    )
+
+
+async def item_paging(
+    ctx: BenchmarkContext, result: ScenarioResult, rng: random.Random
+) -> None:
+    pages = max(math.ceil(ctx.items_per_user / ctx.page_size), 1)
+    await _request(
+        ctx,
+        result,
+        "GET",
+        "/items/",
+        params={"skip": rng.randrange(pages) * ctx.page_size, "limit": ctx.page_size},
+        headers=rng.choice(ctx.auth_headers),
+    )
+
+
+async def item_crud(
+    ctx: BenchmarkContext, result: ScenarioResult, rng: random.Random
+) -> None:
+    """Create an item, then read, update and delete it."""
+    headers = rng.choice(ctx.auth_headers)
+    response = await _request(
+        ctx,
+        result,
+        "POST",
+        "/items/",
+        json={"title": "Benchmark item", "description": "Created by item_crud"},
+        headers=headers,
+    )
+    if response is None:
+        return
+    url = f"/items/{response.json()['id']}"
+    await _request(ctx, result, "GET", url, headers=headers)
+    await _request(
+        ctx, result, "PUT", url, json={"title": "Updated item"}, headers=headers
+    )
+    await _request(ctx, result, "DELETE", url, headers=headers)
+
+
+async def users_me(
+    ctx: BenchmarkContext, result: ScenarioResult, rng: random.Random
+) -> None:
+    await _request(
+        ctx, result, "GET", "/users/me", headers=rng.choice(ctx.auth_headers)
+    )
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "login_storm": login_storm,
+    "item_paging": item_paging,
+    "item_crud": item_crud,
+    "users_me": users_me,
+}
+
+
+async def login(client: httpx.AsyncClient, emails: list[str]) -> list[dict[str, str]]:
+    """Log in as each of `emails` and return their authorization headers."""
+    headers = []
+    for email in emails:
+        r = await client.post(
+            "/login/access-token", data={"username": email, "password": PASSWORD}
+        )
+        r.raise_for_status()
+        headers.append({"Authorization": f"Bearer {r.json()['access_token']}"})
+    return headers
+
+
+async def run_scenario(
+    name: str, ctx: BenchmarkContext, concurrency: int, duration: float
+) -> ScenarioResult:
+    """Run scenario `name` with `concurrency` workers for `duration` seconds."""
+    scenario = SCENARIOS[name]
+    result = ScenarioResult(name=name, concurrency=concurrency)
+    start = time.perf_counter()
+    deadline = start + duration
+
+    async def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            await scenario(ctx, result, rng)
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    result.duration = time.perf_counter() - start
+    return result
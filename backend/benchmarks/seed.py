@@ -0,0 +1,55 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Engine
+from sqlmodel import Session, col, delete
+
+from app.models import User
+from app.seed_data import seed as seed_data
+from app.seed_data import seed_email
+
+logger = logging.getLogger(__name__)
+
+# Every benchmark user gets an address in this domain so they can be removed
+EMAIL_DOMAIN = "benchmark.example.com"
+PASSWORD = "benchmark-password"
+
+
+@dataclass
+class SeedResult:
+    emails: list[str]
+    items: int
+
+
+def seed(db_engine: Engine, users: int, items: int) -> SeedResult:
+    """Seed `users` users and `items` items spread evenly between them.
+
+    Uses the generator of `app.seed_data`, every user owns `items // users`
+    items and all of them share `PASSWORD`.
+    """
+    stats = seed_data(
+        db_engine,
+        users,
+        items // users if users else 0,
+        "fixed",
+        password=PASSWORD,
+        email_domain=EMAIL_DOMAIN,
+    )
+    logger.info(f"Seeded {stats.users} users and {stats.items} items")
+    return SeedResult(
+        emails=[seed_email(i, stats.run, EMAIL_DOMAIN) for i in range(users)],
+        items=stats.items,
+    )
+
+
+def cleanup(db_engine: Engine) -> int:
+    """Delete all benchmark users, their items are removed by the cascade."""
+    with Session(db_engine) as session:
+        result = session.execute(
+            delete(User).where(col(User.email).endswith(f"@{EMAIL_DOMAIN}"))
+        )
+        session.commit()
+    removed = cast(CursorResult[Any], result).rowcount
+    logger.info(f"Removed {removed} benchmark users")
+    return removed
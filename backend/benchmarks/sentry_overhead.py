@@ -0,0 +1,141 @@
+"""Measure the per-request overhead of Sentry tracing at different sample rates.
+
+Requests are sent one at a time to `GET /users/me`, as a seeded benchmark user,
+through the ASGI app in process. The first run is without Sentry, then the SDK
+is initialized at each traces sample rate. Events go to a null transport.
+
+    python -m benchmarks.sentry_overhead --requests 2000 --rates 0 0.01 0.1 1
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from typing import Any
+
+import httpx
+from sentry_sdk.envelope import Envelope
+from sentry_sdk.transport import Transport
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.sentry import init_sentry
+from app.main import app
+from benchmarks.report import percentile
+from benchmarks.seed import PASSWORD, cleanup, seed
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+)
+logger = logging.getLogger("benchmarks.sentry_overhead")
+
+# Never contacted, the null transport drops every envelope
+FAKE_DSN = "https://public@sentry.invalid/1"
+
+
+class NullTransport(Transport):
+    def capture_envelope(self, envelope: Envelope) -> None:
+        pass
+
+
+async def measure(client: httpx.AsyncClient, requests: int) -> dict[str, float]:
+    """Time `requests` sequential requests after a short warmup."""
+    for _ in range(max(requests // 10, 1)):
+        (await client.get("/users/me")).raise_for_status()
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get("/users/me")
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return {
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+    }
+
+
+def _quiet_logs() -> None:
+    """Only log warnings, request and SQL logs would dominate the measurement."""
+    logging.getLogger().setLevel(logging.WARNING)
+    for name in logging.root.manager.loggerDict:
+        logging.getLogger(name).setLevel(logging.WARNING)
+    logger.setLevel(logging.INFO)
+
+
+async def run(email: str, args: argparse.Namespace) -> dict[str, Any]:
+    transport = httpx.ASGITransport(app=app)
+    base_url = f"http://benchmark{settings.API_V1_STR}"
+    async with httpx.AsyncClient(transport=transport, base_url=base_url) as client:
+        r = await client.post(
+            "/login/access-token",
+            data={"username": email, "password": PASSWORD},
+        )
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+
+        # The SDK can't be uninstalled, so the baseline has to run first
+        results = {"disabled": await measure(client, args.requests)}
+        logger.info(f"disabled: {results['disabled']}")
+        for rate in args.rates:
+            init_sentry(
+                dsn=FAKE_DSN,
+                transport=NullTransport,
+                traces_sampler=None,
+                traces_sample_rate=rate,
+                profiles_sample_rate=args.profiles_sample_rate,
+            )
+            result = await measure(client, args.requests)
+            result["overhead_ms"] = round(
+                result["mean_ms"] - results["disabled"]["mean_ms"], 3
+            )
+            results[f"traces_sample_rate={rate}"] = result
+            logger.info(f"traces_sample_rate={rate}: {result}")
+    return {
+        "config": {
+            "requests": args.requests,
+            "profiles_sample_rate": args.profiles_sample_rate,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.sentry_overhead",
+        description="Per-request overhead of Sentry tracing.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--requests", type=int, default=1000, help="Requests per sample rate"
+    )
+    parser.add_argument(
+        "--rates",
+        type=float,
+        nargs="+",
+        default=[0.0, 0.01, 0.1, 1.0],
+        help="Traces sample rates to measure",
+    )
+    parser.add_argument(
+        "--profiles-sample-rate",
+        type=float,
+        default=0.0,
+        help="Profiles sample rate used for every run",
+    )
+    args = parser.parse_args(argv)
+    _quiet_logs()
+    cleanup(engine)
+    seeded = seed(engine, users=1, items=0)
+    try:
+        results = asyncio.run(run(seeded.emails[0], args))
+    finally:
+        cleanup(engine)
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
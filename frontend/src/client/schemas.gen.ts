@@ -55,6 +55,60 @@ export const Body_login_login_access_tokenSchema = {
   title: "Body_login-login_access_token",
 } as const
 
+export const DBPoolStatsSchema = {
+  properties: {
+    pool_size: {
+      type: "integer",
+      title: "Pool Size",
+    },
+    max_overflow: {
+      type: "integer",
+      title: "Max Overflow",
+    },
+    checked_out: {
+      type: "integer",
+      title: "Checked Out",
+    },
+    idle: {
+      type: "integer",
+      title: "Idle",
+    },
+    overflow: {
+      type: "integer",
+      title: "Overflow",
+    },
+    checkouts: {
+      type: "integer",
+      title: "Checkouts",
+    },
+    timeouts: {
+      type: "integer",
+      title: "Timeouts",
+    },
+    avg_wait_ms: {
+      type: "number",
+      title: "Avg Wait Ms",
+    },
+    max_wait_ms: {
+      type: "number",
+      title: "Max Wait Ms",
+    },
+  },
+  type: "object",
+  required: [
+    "pool_size",
+    "max_overflow",
+    "checked_out",
+    "idle",
+    "overflow",
+    "checkouts",
+    "timeouts",
+    "avg_wait_ms",
+    "max_wait_ms",
+  ],
+  title: "DBPoolStats",
+} as const
+
 export const HTTPValidationErrorSchema = {
   properties: {
     detail: {
@@ -182,6 +236,100 @@ export const ItemsPublicSchema = {
   title: "ItemsPublic",
 } as const
 
+export const ItemsSearchPublicSchema = {
+  properties: {
+    data: {
+      items: {
+        $ref: "#/components/schemas/ItemPublic",
+      },
+      type: "array",
+      title: "Data",
+    },
+    next_cursor: {
+      anyOf: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Next Cursor",
+    },
+  },
+  type: "object",
+  required: ["data"],
+  title: "ItemsSearchPublic",
+} as const
+
+export const JobPublicSchema = {
+  properties: {
+    job_type: {
+      type: "string",
+      maxLength: 64,
+      title: "Job Type",
+    },
+    status: {
+      $ref: "#/components/schemas/JobStatus",
+      default: "queued",
+    },
+    error: {
+      anyOf: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Error",
+    },
+    created_at: {
+      type: "string",
+      format: "date-time",
+      title: "Created At",
+    },
+    started_at: {
+      anyOf: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Started At",
+    },
+    finished_at: {
+      anyOf: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Finished At",
+    },
+    id: {
+      type: "string",
+      format: "uuid",
+      title: "Id",
+    },
+  },
+  type: "object",
+  required: ["job_type", "id"],
+  title: "JobPublic",
+} as const
+
+export const JobStatusSchema = {
+  type: "string",
+  enum: ["queued", "running", "succeeded", "failed"],
+  title: "JobStatus",
+} as const
+
 export const MessageSchema = {
   properties: {
     message: {
@@ -212,6 +360,34 @@ export const NewPasswordSchema = {
   title: "NewPassword",
 } as const
 
+export const ReadinessSchema = {
+  properties: {
+    ready: {
+      type: "boolean",
+      title: "Ready",
+    },
+    database: {
+      type: "boolean",
+      title: "Database",
+    },
+    database_checked_at: {
+      anyOf: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      title: "Database Checked At",
+    },
+  },
+  type: "object",
+  required: ["ready", "database"],
+  title: "Readiness",
+} as const
+
 export const TokenSchema = {
   properties: {
     access_token: {
@@ -451,6 +627,58 @@ export const UserUpdateMeSchema = {
   title: "UserUpdateMe",
 } as const
 
+export const UsersBulkSchema = {
+  properties: {
+    ids: {
+      items: {
+        type: "string",
+        format: "uuid",
+      },
+      type: "array",
+      maxItems: 10000,
+      minItems: 1,
+      title: "Ids",
+    },
+  },
+  type: "object",
+  required: ["ids"],
+  title: "UsersBulk",
+} as const
+
+export const UsersBulkResultSchema = {
+  properties: {
+    count: {
+      type: "integer",
+      title: "Count",
+    },
+  },
+  type: "object",
+  required: ["count"],
+  title: "UsersBulkResult",
+} as const
+
+export const UsersBulkRoleSchema = {
+  properties: {
+    ids: {
+      items: {
+        type: "string",
+        format: "uuid",
+      },
+      type: "array",
+      maxItems: 10000,
+      minItems: 1,
+      title: "Ids",
+    },
+    is_superuser: {
+      type: "boolean",
+      title: "Is Superuser",
+    },
+  },
+  type: "object",
+  required: ["ids", "is_superuser"],
+  title: "UsersBulkRole",
+} as const
+
 export const UsersPublicSchema = {
   properties: {
     data: {
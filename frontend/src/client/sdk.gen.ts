@@ -8,6 +8,8 @@ import type {
   ItemsReadItemsResponse,
   ItemsCreateItemData,
   ItemsCreateItemResponse,
+  ItemsSearchItemsData,
+  ItemsSearchItemsResponse,
   ItemsReadItemData,
   ItemsReadItemResponse,
   ItemsUpdateItemData,
@@ -35,6 +37,14 @@ import type {
   UsersUpdatePasswordMeResponse,
   UsersRegisterUserData,
   UsersRegisterUserResponse,
+  UsersBulkActivateUsersData,
+  UsersBulkActivateUsersResponse,
+  UsersBulkDeactivateUsersData,
+  UsersBulkDeactivateUsersResponse,
+  UsersBulkSetUsersRoleData,
+  UsersBulkSetUsersRoleResponse,
+  UsersBulkDeleteUsersData,
+  UsersBulkDeleteUsersResponse,
   UsersReadUserByIdData,
   UsersReadUserByIdResponse,
   UsersUpdateUserData,
@@ -43,7 +53,12 @@ import type {
   UsersDeleteUserResponse,
   UtilsTestEmailData,
   UtilsTestEmailResponse,
+  UtilsReadJobData,
+  UtilsReadJobResponse,
   UtilsHealthCheckResponse,
+  UtilsLivenessResponse,
+  UtilsReadinessResponse,
+  UtilsDbPoolStatsResponse,
 } from "./types.gen"
 
 export class ItemsService {
@@ -94,6 +109,35 @@ export class ItemsService {
     })
   }
 
+  /**
+   * Search Items
+   * Search items by title and description, best matches first.
+   *
+   * Pass the returned `next_cursor` back as `cursor` to get the next page.
+   * @param data The data for the request.
+   * @param data.q
+   * @param data.cursor
+   * @param data.limit
+   * @returns ItemsSearchPublic Successful Response
+   * @throws ApiError
+   */
+  public static searchItems(
+    data: ItemsSearchItemsData,
+  ): CancelablePromise<ItemsSearchItemsResponse> {
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/items/search",
+      query: {
+        q: data.q,
+        cursor: data.cursor,
+        limit: data.limit,
+      },
+      errors: {
+        422: "Validation Error",
+      },
+    })
+  }
+
   /**
    * Read Item
    * Get item by ID.
@@ -412,6 +456,96 @@ export class UsersService {
     })
   }
 
+  /**
+   * Bulk Activate Users
+   * Activate many users at once.
+   * @param data The data for the request.
+   * @param data.requestBody
+   * @returns UsersBulkResult Successful Response
+   * @throws ApiError
+   */
+  public static bulkActivateUsers(
+    data: UsersBulkActivateUsersData,
+  ): CancelablePromise<UsersBulkActivateUsersResponse> {
+    return __request(OpenAPI, {
+      method: "POST",
+      url: "/api/v1/users/bulk/activate",
+      body: data.requestBody,
+      mediaType: "application/json",
+      errors: {
+        422: "Validation Error",
+      },
+    })
+  }
+
+  /**
+   * Bulk Deactivate Users
+   * Deactivate many users at once.
+   * @param data The data for the request.
+   * @param data.requestBody
+   * @returns UsersBulkResult Successful Response
+   * @throws ApiError
+   */
+  public static bulkDeactivateUsers(
+    data: UsersBulkDeactivateUsersData,
+  ): CancelablePromise<UsersBulkDeactivateUsersResponse> {
+    return __request(OpenAPI, {
+      method: "POST",
+      url: "/api/v1/users/bulk/deactivate",
+      body: data.requestBody,
+      mediaType: "application/json",
+      errors: {
+        422: "Validation Error",
+      },
+    })
+  }
+
+  /**
+   * Bulk Set Users Role
+   * Grant or revoke superuser privileges for many users at once.
+   * @param data The data for the request.
+   * @param data.requestBody
+   * @returns UsersBulkResult Successful Response
+   * @throws ApiError
+   */
+  public static bulkSetUsersRole(
+    data: UsersBulkSetUsersRoleData,
+  ): CancelablePromise<UsersBulkSetUsersRoleResponse> {
+    return __request(OpenAPI, {
+      method: "POST",
+      url: "/api/v1/users/bulk/role",
+      body: data.requestBody,
+      mediaType: "application/json",
+      errors: {
+        422: "Validation Error",
+      },
+    })
+  }
+
+  /**
+   * Bulk Delete Users
+   * Delete many users and their items at once, in the background.
+   *
+   * Poll `/utils/jobs/{job_id}` with the returned job id for completion.
+   * @param data The data for the request.
+   * @param data.requestBody
+   * @returns JobPublic Successful Response
+   * @throws ApiError
+   */
+  public static bulkDeleteUsers(
+    data: UsersBulkDeleteUsersData,
+  ): CancelablePromise<UsersBulkDeleteUsersResponse> {
+    return __request(OpenAPI, {
+      method: "POST",
+      url: "/api/v1/users/bulk/delete",
+      body: data.requestBody,
+      mediaType: "application/json",
+      errors: {
+        422: "Validation Error",
+      },
+    })
+  }
+
   /**
    * Read User By Id
    * Get a specific user by id.
@@ -463,10 +597,12 @@ export class UsersService {
 
   /**
    * Delete User
-   * Delete a user.
+   * Delete a user and their items in the background.
+   *
+   * Poll `/utils/jobs/{job_id}` with the returned job id for completion.
    * @param data The data for the request.
    * @param data.userId
-   * @returns Message Successful Response
+   * @returns JobPublic Successful Response
    * @throws ApiError
    */
   public static deleteUser(
@@ -488,10 +624,10 @@ export class UsersService {
 export class UtilsService {
   /**
    * Test Email
-   * Test emails.
+   * Test emails, sent in the background.
    * @param data The data for the request.
    * @param data.emailTo
-   * @returns Message Successful Response
+   * @returns JobPublic Successful Response
    * @throws ApiError
    */
   public static testEmail(
@@ -509,6 +645,29 @@ export class UtilsService {
     })
   }
 
+  /**
+   * Read Job
+   * Get the status of a background job.
+   * @param data The data for the request.
+   * @param data.jobId
+   * @returns JobPublic Successful Response
+   * @throws ApiError
+   */
+  public static readJob(
+    data: UtilsReadJobData,
+  ): CancelablePromise<UtilsReadJobResponse> {
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/utils/jobs/{job_id}",
+      path: {
+        job_id: data.jobId,
+      },
+      errors: {
+        422: "Validation Error",
+      },
+    })
+  }
+
   /**
    * Health Check
    * @returns boolean Successful Response
@@ -520,4 +679,44 @@ export class UtilsService {
       url: "/api/v1/utils/health-check/",
     })
   }
+
+  /**
+   * Liveness
+   * Liveness probe, the process is up and serving requests.
+   * @returns boolean Successful Response
+   * @throws ApiError
+   */
+  public static liveness(): CancelablePromise<UtilsLivenessResponse> {
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/utils/health/live/",
+    })
+  }
+
+  /**
+   * Readiness
+   * Readiness probe, 503 when the last database ping failed or is outdated.
+   * It never touches the database itself.
+   * @returns Readiness Successful Response
+   * @throws ApiError
+   */
+  public static readiness(): CancelablePromise<UtilsReadinessResponse> {
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/utils/health/ready/",
+    })
+  }
+
+  /**
+   * Db Pool Stats
+   * Connection pool statistics for this worker.
+   * @returns DBPoolStats Successful Response
+   * @throws ApiError
+   */
+  public static dbPoolStats(): CancelablePromise<UtilsDbPoolStatsResponse> {
+    return __request(OpenAPI, {
+      method: "GET",
+      url: "/api/v1/utils/db-pool/",
+    })
+  }
 }
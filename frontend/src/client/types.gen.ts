@@ -9,6 +9,18 @@ export type Body_login_login_access_token = {
   client_secret?: string | null
 }
 
+export type DBPoolStats = {
+  pool_size: number
+  max_overflow: number
+  checked_out: number
+  idle: number
+  overflow: number
+  checkouts: number
+  timeouts: number
+  avg_wait_ms: number
+  max_wait_ms: number
+}
+
 export type HTTPValidationError = {
   detail?: Array<ValidationError>
 }
@@ -30,11 +42,28 @@ export type ItemsPublic = {
   count: number
 }
 
+export type ItemsSearchPublic = {
+  data: Array<ItemPublic>
+  next_cursor?: string | null
+}
+
 export type ItemUpdate = {
   title?: string | null
   description?: string | null
 }
 
+export type JobPublic = {
+  job_type: string
+  status?: JobStatus
+  error?: string | null
+  created_at?: string
+  started_at?: string | null
+  finished_at?: string | null
+  id: string
+}
+
+export type JobStatus = "queued" | "running" | "succeeded" | "failed"
+
 export type Message = {
   message: string
 }
@@ -44,6 +73,12 @@ export type NewPassword = {
   new_password: string
 }
 
+export type Readiness = {
+  ready: boolean
+  database: boolean
+  database_checked_at?: string | null
+}
+
 export type Token = {
   access_token: string
   token_type?: string
@@ -76,6 +111,19 @@ export type UserRegister = {
   full_name?: string | null
 }
 
+export type UsersBulk = {
+  ids: Array<string>
+}
+
+export type UsersBulkResult = {
+  count: number
+}
+
+export type UsersBulkRole = {
+  ids: Array<string>
+  is_superuser: boolean
+}
+
 export type UsersPublic = {
   data: Array<UserPublic>
   count: number
@@ -113,6 +161,14 @@ export type ItemsCreateItemData = {
 
 export type ItemsCreateItemResponse = ItemPublic
 
+export type ItemsSearchItemsData = {
+  cursor?: string | null
+  limit?: number
+  q: string
+}
+
+export type ItemsSearchItemsResponse = ItemsSearchPublic
+
 export type ItemsReadItemData = {
   id: string
 }
@@ -193,6 +249,30 @@ export type UsersRegisterUserData = {
 
 export type UsersRegisterUserResponse = UserPublic
 
+export type UsersBulkActivateUsersData = {
+  requestBody: UsersBulk
+}
+
+export type UsersBulkActivateUsersResponse = UsersBulkResult
+
+export type UsersBulkDeactivateUsersData = {
+  requestBody: UsersBulk
+}
+
+export type UsersBulkDeactivateUsersResponse = UsersBulkResult
+
+export type UsersBulkSetUsersRoleData = {
+  requestBody: UsersBulkRole
+}
+
+export type UsersBulkSetUsersRoleResponse = UsersBulkResult
+
+export type UsersBulkDeleteUsersData = {
+  requestBody: UsersBulk
+}
+
+export type UsersBulkDeleteUsersResponse = JobPublic
+
 export type UsersReadUserByIdData = {
   userId: string
 }
@@ -210,12 +290,24 @@ export type UsersDeleteUserData = {
   userId: string
 }
 
-export type UsersDeleteUserResponse = Message
+export type UsersDeleteUserResponse = JobPublic
 
 export type UtilsTestEmailData = {
   emailTo: string
 }
 
-export type UtilsTestEmailResponse = Message
+export type UtilsTestEmailResponse = JobPublic
+
+export type UtilsReadJobData = {
+  jobId: string
+}
+
+export type UtilsReadJobResponse = JobPublic
 
 export type UtilsHealthCheckResponse = boolean
+
+export type UtilsLivenessResponse = boolean
+
+export type UtilsReadinessResponse = Readiness
+
+export type UtilsDbPoolStatsResponse = DBPoolStats
@@ -16,6 +16,7 @@ import {
   DialogTrigger,
 } from "@/components/ui/dialog"
 import useCustomToast from "@/hooks/useCustomToast"
+import { waitForJob } from "@/utils"
 
 const DeleteUser = ({ id }: { id: string }) => {
   const [isOpen, setIsOpen] = useState(false)
@@ -26,8 +27,11 @@ const DeleteUser = ({ id }: { id: string }) => {
     formState: { isSubmitting },
   } = useForm()
 
+  // The user is deleted in the background, wait for the job before
+  // refreshing the list so it doesn't still show the user
   const deleteUser = async (id: string) => {
-    await UsersService.deleteUser({ userId: id })
+    const job = await UsersService.deleteUser({ userId: id })
+    await waitForJob(job)
   }
 
   const mutation = useMutation({
@@ -89,7 +93,7 @@ const DeleteUser = ({ id }: { id: string }) => {
               variant="solid"
               colorPalette="red"
               type="submit"
-              loading={isSubmitting}
+              loading={isSubmitting || mutation.isPending}
             >
               Delete
             </Button>
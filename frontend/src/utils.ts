@@ -1,4 +1,4 @@
-import type { ApiError } from "./client"
+import { type ApiError, type JobPublic, UtilsService } from "./client"
 import useCustomToast from "./hooks/useCustomToast"
 
 export const emailPattern = {
@@ -53,3 +53,17 @@ export const handleError = (err: ApiError) => {
   }
   showErrorToast(errorMessage)
 }
+
+const JOB_POLL_INTERVAL_MS = 500
+
+export const waitForJob = async (submitted: JobPublic): Promise<JobPublic> => {
+  let job = submitted
+  while (job.status !== "succeeded" && job.status !== "failed") {
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS))
+    job = await UtilsService.readJob({ jobId: job.id })
+  }
+  if (job.status === "failed") {
+    throw new Error(job.error ?? "Job failed")
+  }
+  return job
+}
@@ -3,25 +3,27 @@ setlocal enabledelayedexpansion
 
 :: Script to generate the frontend client from the OpenAPI schema
 
-:: Check if the backend is running
-curl -s http://localhost:8000/api/v1/openapi.json > nul 2>&1
-if %errorlevel% neq 0 (
-    echo Error: Backend is not running or not accessible at http://localhost:8000
-    echo Please start the backend first with 'docker compose up backend' or 'make up'
+:: Write the OpenAPI schema, the backend doesn't need to be running
+echo Writing OpenAPI schema...
+pushd backend
+python -m app.export_openapi ..\frontend\openapi.json
+if errorlevel 1 (
+    popd
+    echo Error: Failed to write OpenAPI schema
+    echo Please activate the backend virtual environment first
     exit /b 1
 )
+popd
 
-:: Create frontend directory if it doesn't exist
-if not exist frontend mkdir frontend
-
-:: Download the OpenAPI schema
-echo Downloading OpenAPI schema from backend...
-curl -s http://localhost:8000/api/v1/openapi.json > frontend\openapi.json
-
-:: Check if the download was successful
+:: Check if the export was successful
+if not exist frontend\openapi.json (
+    echo Error: Failed to write OpenAPI schema
+    echo Please activate the backend virtual environment first
+    exit /b 1
+)
 for %%F in (frontend\openapi.json) do (
     if %%~zF equ 0 (
-        echo Error: Failed to download OpenAPI schema or schema is empty
+        echo Error: Failed to write OpenAPI schema or schema is empty
         exit /b 1
     )
 )
@@ -39,6 +41,7 @@ if %errorlevel% neq 0 (
 :: Generate the client
 echo Generating frontend client...
 call npm run generate-client
+if errorlevel 1 exit /b 1
 
 echo Frontend client generated successfully!
 exit /b 0
\ No newline at end of file
@@ -4,23 +4,14 @@
 
 set -e
 
-# Check if the backend is running
-if ! curl -s http://localhost:8000/api/v1/openapi.json > /dev/null; then
-    echo "Error: Backend is not running or not accessible at http://localhost:8000"
-    echo "Please start the backend first with 'docker compose up backend' or 'make up'"
-    exit 1
-fi
-
-# Create frontend directory if it doesn't exist
-mkdir -p frontend
-
-# Download the OpenAPI schema
-echo "Downloading OpenAPI schema from backend..."
-curl -s http://localhost:8000/api/v1/openapi.json > frontend/openapi.json
+# Write the OpenAPI schema, the backend doesn't need to be running
+echo "Writing OpenAPI schema..."
+(cd backend && python -m app.export_openapi ../frontend/openapi.json)
 
-# Check if the download was successful
+# Check if the export was successful
 if [ ! -s frontend/openapi.json ]; then
-    echo "Error: Failed to download OpenAPI schema or schema is empty"
+    echo "Error: Failed to write OpenAPI schema or schema is empty"
+    echo "Please activate the backend virtual environment first"
     exit 1
 fi
 
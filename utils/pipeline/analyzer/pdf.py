@@ -6,8 +6,11 @@ This module provides functionality for analyzing PDF document structure.
 
 from typing import Any, Dict
 
-import pypdf
-
+from utils.pipeline.core.pdf_document import (
+    DOCUMENT_KEY,
+    PDFDocument,
+    share_document,
+)
 from utils.pipeline.strategies.base import AnalyzerStrategy
 from utils.pipeline.utils.logging import get_logger
 
@@ -31,79 +34,79 @@ class PDFAnalyzer(AnalyzerStrategy):
         self.logger.info("Analyzing PDF: %s", input_path)
 
         try:
-            with open(input_path, "rb") as f:
-                pdf = pypdf.PdfReader(f)
-
+            # Opened once here, the later stages can reuse the parsed document
+            document = PDFDocument(input_path)
+            try:
                 # Extract basic metadata
-                metadata = {}
-                if pdf.metadata:
-                    metadata = {
-                        "title": pdf.metadata.get("/Title", ""),
-                        "author": pdf.metadata.get("/Author", ""),
-                        "subject": pdf.metadata.get("/Subject", ""),
-                        "creator": pdf.metadata.get("/Creator", ""),
-                        "producer": pdf.metadata.get("/Producer", ""),
-                        "creation_date": pdf.metadata.get("/CreationDate", ""),
-                        "modification_date": pdf.metadata.get("/ModDate", ""),
-                    }
+                metadata = document.metadata
 
                 # Extract page information
                 pages = []
-                for i, page in enumerate(pdf.pages):
+                for i, (page, text) in enumerate(
+                    zip(document.doc, document.page_texts())
+                ):
                     page_info = {
                         "number": i + 1,
-                        "size": page.mediabox,
-                        "rotation": page.get("/Rotate", 0),
-                        "content": page.extract_text(),
+                        "size": list(page.mediabox),
+                        "rotation": page.rotation,
+                        "content": text,
                     }
                     pages.append(page_info)
-
-                # Build sections from content
-                sections = []
-                current_section = None
-
-                for page in pages:
-                    content = page["content"]
-                    lines = content.split("\n")
-
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        # Simple heuristic for section detection
-                        if line.isupper() or line.startswith(
-                            ("#", "Chapter", "Section")
-                        ):
-                            # New section
-                            if current_section:
-                                sections.append(current_section)
-                            current_section = {
-                                "title": line,
-                                "content": "",
-                                "level": 0 if line.isupper() else 1,
-                            }
-                        elif current_section:
-                            current_section["content"] += line + "\n"
-                        else:
-                            # Text before first section
-                            current_section = {
-                                "title": "Introduction",
-                                "content": line + "\n",
-                                "level": 0,
-                            }
-
-                # Add last section
-                if current_section:
-                    sections.append(current_section)
-
-                return {
-                    "path": input_path,
-                    "type": "pdf",
-                    "metadata": metadata,
-                    "pages": pages,
-                    "sections": sections,
-                }
+            except Exception:
+                document.close()
+                raise
+
+            # Build sections from content
+            sections = []
+            current_section = None
+
+            for page in pages:
+                content = page["content"]
+                lines = content.split("\n")
+
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    # Simple heuristic for section detection
+                    if line.isupper() or line.startswith(("#", "Chapter", "Section")):
+                        # New section
+                        if current_section:
+                            sections.append(current_section)
+                        current_section = {
+                            "title": line,
+                            "content": "",
+                            "level": 0 if line.isupper() else 1,
+                        }
+                    elif current_section:
+                        current_section["content"] += line + "\n"
+                    else:
+                        # Text before first section
+                        current_section = {
+                            "title": "Introduction",
+                            "content": line + "\n",
+                            "level": 0,
+                        }
+
+            # Add last section
+            if current_section:
+                sections.append(current_section)
+
+            result = {
+                "path": input_path,
+                "type": "pdf",
+                "metadata": metadata,
+                "pages": pages,
+                "sections": sections,
+            }
+            # Passed on to the later stages inside a document scope, such as a
+            # pipeline run, and closed here otherwise
+            if share_document(document):
+                result[DOCUMENT_KEY] = document
+            else:
+                document.close()
+            return result
 
         except Exception as e:
             self.logger.error("Failed to analyze PDF: %s", str(e), exc_info=True)
@@ -7,6 +7,7 @@ This module provides functionality for cleaning and normalizing PDF content.
 import re
 from typing import Any, Dict
 
+from utils.pipeline.core.pdf_document import DOCUMENT_KEY
 from utils.pipeline.strategies.base import CleanerStrategy
 from utils.pipeline.utils.logging import get_logger
 
@@ -46,7 +47,7 @@ class PDFCleaner(CleanerStrategy):
                 cleaned_page = self._clean_page(page)
                 cleaned_pages.append(cleaned_page)
 
-            return {
+            cleaned_data = {
                 "path": analysis_result.get("path"),
                 "type": analysis_result.get("type"),
                 "metadata": cleaned_metadata,
@@ -54,6 +55,12 @@ class PDFCleaner(CleanerStrategy):
                 "sections": cleaned_sections,
             }
 
+            # Pass the open document on to the extractor
+            if DOCUMENT_KEY in analysis_result:
+                cleaned_data[DOCUMENT_KEY] = analysis_result[DOCUMENT_KEY]
+
+            return cleaned_data
+
         except Exception as e:
             self.logger.error("Failed to clean PDF content: %s", str(e), exc_info=True)
             return analysis_result  # Return original data on error
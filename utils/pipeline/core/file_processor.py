@@ -5,13 +5,22 @@ This module provides functionality for discovering input files, processing them
 through the pipeline, and generating output files in various formats.
 """
 
+import copy
 import csv
+import itertools
 import json
+import multiprocessing
 import os
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+from utils.pipeline.core.manifest import ProcessingManifest
+from utils.pipeline.core.result_cache import DEFAULT_CACHE_CONFIG, file_digest
+from utils.pipeline.core.supervisor import SupervisedWorker
 from utils.pipeline.pipeline import Pipeline
 from utils.pipeline.utils.logging import get_logger
 from utils.pipeline.utils.progress import PipelineProgress
@@ -39,11 +48,18 @@ DEFAULT_CONFIG = {
         "processing": {
             "batch_size": 10,
             "parallel": False,
+            "workers": 0,  # Worker processes when parallel, 0 uses all CPUs
             "continue_on_error": True,
+            # Skip files the manifest records as completed with the same content
+            "resume": False,
+            # Limits per file, 0 disables them. With a limit set, files are
+            # processed in a supervised child process that is killed on breach
+            "timeout": 0,  # seconds
+            "max_memory_mb": 0,  # resident memory
             "error_handling": {
                 "log_level": "error",
-                "retry_count": 0,
-                "retry_delay": 1,
+                "retry_count": 0,  # Attempts after the first failure
+                "retry_delay": 1,  # Seconds, doubled after each attempt
             },
         },
         "reporting": {
@@ -51,6 +67,8 @@ DEFAULT_CONFIG = {
             "detailed": True,
             "format": "json",
             "save_path": "processing_report.json",
+            # JSONL log written after each file, relative to the output directory
+            "manifest": "processing_manifest.jsonl",
         },
     }
 }
@@ -98,6 +116,19 @@ class FileProcessor:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Log of the processed files, written as each one completes
+        manifest_path = Path(
+            self.config["file_processing"]["reporting"].get(
+                "manifest", "processing_manifest.jsonl"
+            )
+        )
+        if not manifest_path.is_absolute():
+            manifest_path = self.output_dir / manifest_path
+        self.manifest = ProcessingManifest(manifest_path)
+
+        # Child process running the files when per-file limits are configured
+        self._supervisor: Optional[SupervisedWorker] = None
+
         self.logger.info(
             f"FileProcessor initialized with input_dir={self.input_dir}, "
             f"output_dir={self.output_dir}"
@@ -105,8 +136,8 @@ class FileProcessor:
 
     def _load_config(self, config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Load and validate configuration."""
-        # Start with defaults
-        merged_config = DEFAULT_CONFIG.copy()
+        # Start with defaults (deep copy, merging must not change the defaults)
+        merged_config = copy.deepcopy(DEFAULT_CONFIG)
 
         # Merge with provided config
         if config:
@@ -166,10 +197,19 @@ class FileProcessor:
             "markdown_options",
             "record_schemas",
             "enable_classification",
+            "cache",
         ]:
             if key in self.config:
                 pipeline_config[key] = self.config[key]
 
+        # A relative result cache directory is relative to output_dir
+        if "cache" in pipeline_config:
+            cache_config = dict(pipeline_config["cache"])
+            directory = cache_config.get("directory", DEFAULT_CACHE_CONFIG["directory"])
+            if not os.path.isabs(directory):
+                cache_config["directory"] = str(self.output_dir / directory)
+            pipeline_config["cache"] = cache_config
+
         return pipeline_config
 
     def _get_output_dir(self) -> Path:
@@ -398,12 +438,20 @@ class FileProcessor:
         """
         Process all discovered files according to configuration.
 
+        With `parallel` enabled, files are processed in `batch_size` chunks by a
+        pool of worker processes, each with its own pipeline. Results are
+        returned in discovery order either way.
+
+        Each result is appended to the manifest as soon as the file is done.
+        With `resume` enabled, files the manifest records as completed with
+        the same content are skipped and the manifest is extended, otherwise
+        it starts empty.
+
         Returns:
-            List of result dictionaries with processing status and outputs
+            List of result dictionaries of the files processed in this run
         """
         # Get processing configuration
         proc_config = self.config.get("file_processing", {}).get("processing", {})
-        continue_on_error = proc_config.get("continue_on_error", True)
 
         # Discover files
         files = self.discover_files()
@@ -411,69 +459,312 @@ class FileProcessor:
             self.logger.warning("No matching files found")
             return []
 
-        # Initialize progress tracking
-        progress = PipelineProgress()
-        results = []
+        if proc_config.get("resume", False):
+            files = self._pending_files(files)
+        else:
+            self.manifest.reset()
+
+        results: List[Dict[str, Any]] = []
+        if files:
+            # Initialize progress tracking
+            progress = PipelineProgress()
+
+            with progress:
+                # Add overall progress tracking
+                overall_task = progress.add_task(
+                    f"Processing {len(files)} files", total=len(files)
+                )
+
+                if proc_config.get("parallel", False) and len(files) > 1:
+                    results = self._process_files_parallel(
+                        files, progress, overall_task
+                    )
+                else:
+                    try:
+                        results = self._process_files_sequential(
+                            files, progress, overall_task
+                        )
+                    finally:
+                        self.close()
+
+        # Generate report if configured
+        if (
+            self.config.get("file_processing", {})
+            .get("reporting", {})
+            .get("summary", True)
+        ):
+            self.generate_report(results)
+
+        return results
 
-        with progress:
-            # Add overall progress tracking
-            overall_task = progress.add_task(
-                f"Processing {len(files)} files", total=len(files)
+    def _pending_files(self, files: List[Path]) -> List[Path]:
+        """Files not completed by an earlier run, or changed since."""
+        completed = self.manifest.completed()
+        pending = []
+        for file in files:
+            input_hash = completed.get(str(file))
+            try:
+                if input_hash and file_digest(file) == input_hash:
+                    continue
+            except OSError:
+                pass
+            pending.append(file)
+
+        if len(pending) < len(files):
+            self.logger.info(
+                f"Resuming, skipping {len(files) - len(pending)} files completed "
+                f"by an earlier run"
             )
+        return pending
 
-            # Process each file
-            for file in files:
-                try:
-                    progress.display_success(f"Processing {file.name}")
+    def process_file(self, file: Path) -> Dict[str, Any]:
+        """
+        Process one file and generate its outputs, without raising.
 
-                    # Process the file without progress display
-                    output_data = self.pipeline.run(str(file), show_progress=False)
+        With a `timeout` or `max_memory_mb` configured, the file runs in a
+        supervised child process. A failed file is retried `retry_count`
+        times, waiting `retry_delay` seconds, doubled after each attempt.
 
-                    # Generate outputs in all configured formats
-                    output_paths = self.generate_outputs(file, output_data)
+        Args:
+            file: Input file path
 
-                    # Record result
-                    results.append(
-                        {
-                            "file": str(file),
-                            "status": "success",
-                            "outputs": output_paths,
-                        }
-                    )
+        Returns:
+            Result dictionary with processing status, outputs or error, the
+            SHA-256 of the input, the number of attempts and the duration in
+            seconds
+        """
+        proc_config = self.config["file_processing"]["processing"]
+        error_handling = proc_config.get("error_handling", {})
+        attempts = 1 + max(0, error_handling.get("retry_count", 0))
+        delay = error_handling.get("retry_delay", 1)
+
+        start = time.perf_counter()
+        for attempt in range(1, attempts + 1):
+            if proc_config.get("timeout") or proc_config.get("max_memory_mb"):
+                result = self._supervised_worker().process(file)
+            else:
+                result = self._process_file_once(file)
+            if result["status"] == "success" or attempt == attempts:
+                break
+            self.logger.warning(
+                f"Retrying {file.name} in {delay:g}s (attempt {attempt + 1} of "
+                f"{attempts})"
+            )
+            time.sleep(delay)
+            delay *= 2
+
+        result.setdefault("input_hash", None)
+        result["attempts"] = attempt
+        result["duration"] = round(time.perf_counter() - start, 3)
+        return result
+
+    def _supervised_worker(self) -> SupervisedWorker:
+        if self._supervisor is None:
+            proc_config = self.config["file_processing"]["processing"]
+            self._supervisor = SupervisedWorker(
+                str(self.input_dir),
+                str(self.output_dir),
+                self.config,
+                timeout=proc_config.get("timeout", 0),
+                max_memory_mb=proc_config.get("max_memory_mb", 0),
+            )
+        return self._supervisor
 
-                    progress.display_success(f"Successfully processed {file.name}")
+    def close(self) -> None:
+        """Stop the supervised child process, if one was started."""
+        if self._supervisor is not None:
+            self._supervisor.close()
+            self._supervisor = None
 
-                except Exception as e:
-                    error_msg = f"Error processing {file.name}: {str(e)}"
-                    self.logger.error(error_msg, exc_info=True)
-                    progress.display_error(error_msg)
+    def _process_file_once(self, file: Path) -> Dict[str, Any]:
+        """Process one file in this process."""
+        input_hash = None
+        try:
+            input_hash = file_digest(file)
 
-                    # Record failure
-                    results.append(
-                        {"file": str(file), "status": "error", "error": str(e)}
-                    )
+            # Process the file without progress display
+            output_data = self.pipeline.run(str(file), show_progress=False)
 
-                    # Stop processing if configured to do so
-                    if not continue_on_error:
-                        progress.display_error(
-                            "Stopping due to error (continue_on_error=False)"
-                        )
-                        break
+            # Generate outputs in all configured formats
+            output_paths = self.generate_outputs(file, output_data)
 
-                finally:
-                    # Update overall progress
-                    progress.update(overall_task, advance=1)
+            result = {
+                "file": str(file),
+                "status": "success",
+                "outputs": output_paths,
+                "cached": self.pipeline.last_cache_hit,
+            }
 
-        # Generate report if configured
-        if (
-            self.config.get("file_processing", {})
-            .get("reporting", {})
-            .get("summary", True)
-        ):
-            self.generate_report(results)
+        except Exception as e:
+            self.logger.error(f"Error processing {file.name}: {str(e)}", exc_info=True)
+            result = {"file": str(file), "status": "error", "error": str(e)}
 
+        result["input_hash"] = input_hash
+        return result
+
+    def _report_result(
+        self, result: Dict[str, Any], progress: PipelineProgress
+    ) -> bool:
+        """Display a file result, return False if processing should stop."""
+        name = Path(result["file"]).name
+        if result["status"] == "success":
+            progress.display_success(f"Successfully processed {name}")
+            return True
+
+        progress.display_error(f"Error processing {name}: {result['error']}")
+
+        # Stop processing if configured to do so
+        proc_config = self.config.get("file_processing", {}).get("processing", {})
+        if not proc_config.get("continue_on_error", True):
+            progress.display_error("Stopping due to error (continue_on_error=False)")
+            return False
+        return True
+
+    def _process_files_sequential(
+        self, files: List[Path], progress: PipelineProgress, task_id: Any
+    ) -> List[Dict[str, Any]]:
+        """Process files one at a time in this process."""
+        results = []
+        for file in files:
+            progress.display_success(f"Processing {file.name}")
+            result = self.process_file(file)
+            self.manifest.append(result)
+            results.append(result)
+            progress.update(task_id, advance=1)
+            if not self._report_result(result, progress):
+                break
         return results
 
+    def _worker_count(self, batch_count: int) -> int:
+        """Number of worker processes for parallel processing."""
+        proc_config = self.config.get("file_processing", {}).get("processing", {})
+        workers = proc_config.get("workers", 0) or os.cpu_count() or 1
+        return max(1, min(workers, batch_count))
+
+    def _process_files_parallel(
+        self, files: List[Path], progress: PipelineProgress, task_id: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Process files with a pool of worker processes.
+
+        Workers report the result of each file as soon as it is done, so
+        progress and the manifest are updated per file, and return the results
+        of a batch when it completes. When a file fails with continue_on_error
+        disabled, no further batches are started and the results of the
+        batches already running are returned.
+        """
+        proc_config = self.config.get("file_processing", {}).get("processing", {})
+        batch_size = max(1, proc_config.get("batch_size", 10))
+        continue_on_error = proc_config.get("continue_on_error", True)
+        indexed_files = [(index, str(file)) for index, file in enumerate(files)]
+        batches = [
+            indexed_files[start : start + batch_size]
+            for start in range(0, len(indexed_files), batch_size)
+        ]
+        workers = self._worker_count(len(batches))
+        self.logger.info(
+            f"Processing {len(files)} files in {len(batches)} batches "
+            f"with {workers} worker processes"
+        )
+
+        # Spawned workers don't inherit the parent's threads (e.g. the progress
+        # display), and behave the same on every platform
+        context = multiprocessing.get_context("spawn")
+        status_queue = context.Queue()
+        results: Dict[int, Dict[str, Any]] = {}
+        # Results reported by the workers so far, already in the manifest
+        reported: Dict[int, Dict[str, Any]] = {}
+        stop = False
+        broken = False
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(
+                str(self.input_dir),
+                str(self.output_dir),
+                self.config,
+                status_queue,
+            ),
+        ) as executor:
+            # Batches are submitted as workers free up, so nothing new starts
+            # once processing has to stop
+            remaining = iter(batches)
+            batch_futures = {
+                executor.submit(_process_batch, batch): batch
+                for batch in itertools.islice(remaining, workers)
+            }
+            pending = set(batch_futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                if self._drain_statuses(status_queue, progress, task_id, reported):
+                    stop = True
+                for future in done:
+                    try:
+                        batch_results = future.result()
+                    except Exception as e:
+                        # A worker process died, e.g. killed for lack of memory,
+                        # which breaks the whole pool
+                        message = f"Worker process failed: {str(e)}"
+                        self.logger.error(message)
+                        progress.display_error(message)
+                        batch_results = [
+                            (
+                                index,
+                                reported.get(index)
+                                or {"file": file, "status": "error", "error": message},
+                            )
+                            for index, file in batch_futures[future]
+                        ]
+                        broken = True
+                    for index, result in batch_results:
+                        results[index] = result
+                        if result["status"] == "error" and not continue_on_error:
+                            stop = True
+                if not stop and not broken:
+                    for batch in itertools.islice(remaining, len(done)):
+                        future = executor.submit(_process_batch, batch)
+                        batch_futures[future] = batch
+                        pending.add(future)
+            self._drain_statuses(status_queue, progress, task_id, reported)
+
+        if broken and not stop:
+            for batch in remaining:
+                for index, file in batch:
+                    results[index] = {
+                        "file": file,
+                        "status": "error",
+                        "error": "Not processed, a worker process failed",
+                    }
+
+        # Results the workers could not report, e.g. of a crashed batch
+        for index in sorted(results):
+            if index not in reported:
+                self.manifest.append(results[index])
+
+        return [results[index] for index in sorted(results)]
+
+    def _drain_statuses(
+        self,
+        status_queue: Any,
+        progress: PipelineProgress,
+        task_id: Any,
+        reported: Dict[int, Dict[str, Any]],
+    ) -> bool:
+        """Record the files finished by the workers, return True to stop."""
+        stop = False
+        while True:
+            try:
+                index, result = status_queue.get_nowait()
+            except queue.Empty:
+                return stop
+            self.manifest.append(result)
+            reported[index] = result
+            progress.update(task_id, advance=1)
+            if not self._report_result(result, progress):
+                stop = True
+
     def process_single_file(
         self, input_file: Union[str, Path], output_format: Optional[str] = None
     ) -> Tuple[Dict[str, Any], str]:
@@ -514,12 +805,16 @@ class FileProcessor:
             if output_format:
                 self.pipeline.config["output_format"] = original_format
 
-    def generate_report(self, results: List[Dict[str, Any]]) -> str:
+    def generate_report(self, results: Optional[List[Dict[str, Any]]] = None) -> str:
         """
         Generate processing report based on configuration.
 
+        The report is built by streaming the manifest, so it also covers files
+        completed by the earlier runs of a resumed batch. The details list
+        every attempt, the summary counts the latest one of each file.
+
         Args:
-            results: List of processing results
+            results: List of processing results, used when there's no manifest
 
         Returns:
             Path to the generated report
@@ -532,20 +827,33 @@ class FileProcessor:
         ):
             return ""
 
+        def entries() -> Iterator[Dict[str, Any]]:
+            if self.manifest.exists():
+                return self.manifest.entries()
+            return iter(results or [])
+
+        # Latest status, cache use and failure reason of each file
+        latest: Dict[str, Tuple[str, bool, Optional[str]]] = {}
+        for entry in entries():
+            latest[entry["file"]] = (
+                entry["status"],
+                bool(entry.get("cached")),
+                entry.get("reason"),
+            )
+
         # Prepare report data
+        statuses = latest.values()
         report = {
             "timestamp": datetime.now().isoformat(),
             "summary": {
-                "total_files": len(results),
-                "successful": sum(1 for r in results if r["status"] == "success"),
-                "failed": sum(1 for r in results if r["status"] == "error"),
+                "total_files": len(latest),
+                "successful": sum(1 for s, _, _ in statuses if s == "success"),
+                "failed": sum(1 for s, _, _ in statuses if s == "error"),
+                "cached": sum(1 for _, cached, _ in statuses if cached),
+                "timed_out": sum(1 for _, _, r in statuses if r == "timeout"),
             },
         }
 
-        # Add detailed information if configured
-        if report_config.get("detailed", False):
-            report["details"] = results
-
         # Determine report format and path
         format_name = report_config.get("format", "json")
         save_path = report_config.get("save_path", "processing_report.json")
@@ -559,13 +867,15 @@ class FileProcessor:
 
         # Save report
         with open(save_path, "w") as f:
-            if format_name == "json":
+            if format_name == "json" and report_config.get("detailed", False):
+                self._write_json_report(f, report, entries())
+            elif format_name == "json":
                 json.dump(report, f, indent=2)
             elif format_name == "csv" and report_config.get("detailed", False):
                 # Simple CSV export for detailed reports
                 writer = csv.writer(f)
                 writer.writerow(["file", "status", "outputs", "error"])
-                for item in results:
+                for item in entries():
                     writer.writerow(
                         [
                             item["file"],
@@ -584,3 +894,46 @@ class FileProcessor:
 
         self.logger.info(f"Report saved to {save_path}")
         return save_path
+
+    def _write_json_report(
+        self, f: Any, report: Dict[str, Any], details: Iterator[Dict[str, Any]]
+    ) -> None:
+        """Write the report as JSON, with details streamed one entry at a time."""
+        header = json.dumps(report, indent=2)
+        f.write(header[: header.rindex("}")].rstrip() + ',\n  "details": [')
+        for i, entry in enumerate(details):
+            f.write(("," if i else "") + "\n    " + json.dumps(entry))
+        f.write("\n  ]\n}\n")
+
+
+# Per-process state of the parallel workers
+_worker_processor: Optional[FileProcessor] = None
+_worker_queue: Any = None
+
+
+def _init_worker(
+    input_dir: str, output_dir: str, config: Dict[str, Any], status_queue: Any
+) -> None:
+    """Set up the file processor, and its pipeline, reused by a worker process."""
+    global _worker_processor, _worker_queue
+    worker_config = copy.deepcopy(config)
+    worker_config["file_processing"]["processing"]["parallel"] = False
+    _worker_processor = FileProcessor(input_dir, output_dir, worker_config)
+    _worker_queue = status_queue
+
+
+def _process_batch(batch: List[Tuple[int, str]]) -> List[Tuple[int, Dict[str, Any]]]:
+    """Process a batch of (index, path) in a worker process."""
+    assert _worker_processor is not None
+    proc_config = _worker_processor.config["file_processing"]["processing"]
+    results = []
+    for index, file in batch:
+        result = _worker_processor.process_file(Path(file))
+        results.append((index, result))
+        # Reported right away for the progress display and the manifest
+        _worker_queue.put((index, result))
+        if result["status"] == "error" and not proc_config.get(
+            "continue_on_error", True
+        ):
+            break
+    return results
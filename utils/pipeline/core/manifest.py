@@ -0,0 +1,106 @@
+"""
+Processing manifest for batch runs.
+
+This module provides an append-only JSONL log of processed files, written as
+each file completes so that an interrupted batch run can be resumed.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Union
+
+from utils.pipeline.utils.logging import get_logger
+
+
+class ProcessingManifest:
+    """
+    One JSON line per processed file, with its status, duration, outputs and
+    input hash.
+
+    Each line is flushed to disk before the next file is reported, so a crash
+    loses at most the files in flight. A line torn by a crash is skipped when
+    reading.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the manifest, nothing is written until the first entry.
+
+        Args:
+            path: Path to the JSONL file
+        """
+        self.path = Path(path)
+        self.logger = get_logger(__name__)
+        self._terminated = False
+
+    def exists(self) -> bool:
+        """Whether the manifest file exists."""
+        return self.path.exists()
+
+    def reset(self) -> None:
+        """Start an empty manifest, dropping the entries of earlier runs."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf-8")
+        self._terminated = True
+
+    def append(self, result: Dict[str, Any]) -> None:
+        """
+        Add the result of a file and flush it to disk.
+
+        Args:
+            result: Result dictionary of the file
+        """
+        entry = {**result, "timestamp": datetime.now().isoformat()}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            if not self._terminated:
+                # Don't continue a line torn by a crash
+                if f.tell() > 0 and not self._ends_with_newline():
+                    line = "\n" + line
+                self._terminated = True
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the entries in the order they were written.
+
+        Returns:
+            Iterator over the entries, unreadable lines are skipped
+        """
+        if not self.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    self.logger.warning(
+                        f"Skipping unreadable line {number} of manifest {self.path}"
+                    )
+
+    def completed(self) -> Dict[str, str]:
+        """
+        Files whose latest entry is a success.
+
+        Returns:
+            Input hash of each completed file by path
+        """
+        completed = {}
+        for entry in self.entries():
+            if entry.get("status") == "success" and entry.get("input_hash"):
+                completed[entry["file"]] = entry["input_hash"]
+            else:
+                completed.pop(entry.get("file"), None)
+        return completed
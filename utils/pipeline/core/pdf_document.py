@@ -0,0 +1,200 @@
+"""
+Shared PDF document handle.
+
+This module provides a PDF document that is opened and parsed once, then
+shared by the analyze, clean and extract stages of the pipeline.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import fitz  # PyMuPDF
+
+# Key of the document handle in the stage results. It's only set inside a
+# document_scope, which owns the handle and closes it when the block ends, so
+# results returned outside one hold no open document.
+DOCUMENT_KEY = "document"
+
+# Documents handed over to the innermost document_scope, None outside one
+_scope_documents: ContextVar[Optional[List["PDFDocument"]]] = ContextVar(
+    "scope_documents", default=None
+)
+
+
+class PageLayout:
+    """
+    Text layout and drawings of one page, read from PyMuPDF once.
+
+    Plain text, blocks and clipped regions are derived from the cached text
+    dictionary instead of parsing the page content again for each of them.
+    """
+
+    def __init__(self, page):
+        """
+        Wrap a page, nothing is extracted until it's needed.
+
+        Args:
+            page: PyMuPDF page object
+        """
+        self.page = page
+        self._text_dict: Optional[Dict[str, Any]] = None
+        self._text: Optional[str] = None
+        self._drawings: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def text_dict(self) -> Dict[str, Any]:
+        """Text dictionary of the page with spans and their coordinates."""
+        if self._text_dict is None:
+            self._text_dict = self.page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+        return self._text_dict
+
+    @property
+    def blocks(self) -> List[Dict[str, Any]]:
+        """Text blocks of the page."""
+        return self.text_dict.get("blocks", [])
+
+    @property
+    def text(self) -> str:
+        """Plain text of the page, the same as page.get_text("text")."""
+        if self._text is None:
+            self._text = "".join(
+                "".join(span["text"] for span in line.get("spans", [])) + "\n"
+                for block in self.blocks
+                if block.get("type", 0) == 0
+                for line in block.get("lines", [])
+            )
+        return self._text
+
+    @property
+    def drawings(self) -> List[Dict[str, Any]]:
+        """Vector drawings of the page, such as lines and rectangles."""
+        if self._drawings is None:
+            self._drawings = self.page.get_drawings()
+        return self._drawings
+
+    def clip(self, rect: Sequence[float]) -> Dict[str, Any]:
+        """
+        Text dictionary restricted to an area of the page.
+
+        Args:
+            rect: Area as (x0, y0, x1, y1)
+
+        Returns:
+            Text dictionary with the spans whose origin lies inside the area
+        """
+        x0, y0, x1, y1 = rect
+        blocks = []
+        for block in self.blocks:
+            lines = []
+            for line in block.get("lines", []):
+                spans = [
+                    span
+                    for span in line.get("spans", [])
+                    if x0 <= span["origin"][0] <= x1 and y0 <= span["origin"][1] <= y1
+                ]
+                if spans:
+                    lines.append({**line, "spans": spans})
+            if lines:
+                blocks.append({**block, "lines": lines})
+        return {"blocks": blocks}
+
+
+class PDFDocument:
+    """
+    A PDF file opened once with PyMuPDF.
+
+    Inside a document_scope the analyzer passes it on in its result under
+    DOCUMENT_KEY. Later stages reuse it instead of opening and parsing the file
+    again, and the scope closes it when it ends.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a PDF file.
+
+        Args:
+            path: Path to the PDF file
+        """
+        self.path = path
+        self.doc = fitz.open(path)
+        self._layouts: Optional[List[PageLayout]] = None
+        self._page_texts: Optional[List[str]] = None
+
+    def __enter__(self) -> "PDFDocument":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the document has been closed."""
+        return bool(self.doc.is_closed)
+
+    @property
+    def metadata(self) -> Dict[str, str]:
+        """Document metadata with the pipeline's field names."""
+        metadata = self.doc.metadata or {}
+        return {
+            "title": metadata.get("title", ""),
+            "author": metadata.get("author", ""),
+            "subject": metadata.get("subject", ""),
+            "creator": metadata.get("creator", ""),
+            "producer": metadata.get("producer", ""),
+            "creation_date": metadata.get("creationDate", ""),
+            "modification_date": metadata.get("modDate", ""),
+        }
+
+    def layouts(self) -> List[PageLayout]:
+        """Layout of every page, each page is read on first use."""
+        if self._layouts is None:
+            self._layouts = [PageLayout(page) for page in self.doc]
+        return self._layouts
+
+    def page_texts(self) -> List[str]:
+        """Plain text of every page, derived from the page layouts."""
+        if self._page_texts is None:
+            self._page_texts = [layout.text for layout in self.layouts()]
+        return self._page_texts
+
+    def close(self) -> None:
+        """Close the document, it can't be used afterwards."""
+        self._layouts = None
+        if not self.closed:
+            self.doc.close()
+
+
+@contextmanager
+def document_scope() -> Iterator[None]:
+    """
+    Share the documents opened by analyzers in the block with later stages.
+
+    The scope owns the documents handed over with share_document and closes
+    them when the block ends.
+    """
+    documents: List[PDFDocument] = []
+    token = _scope_documents.set(documents)
+    try:
+        yield
+    finally:
+        _scope_documents.reset(token)
+        for document in documents:
+            document.close()
+
+
+def share_document(document: PDFDocument) -> bool:
+    """
+    Hand a document over to the enclosing document_scope.
+
+    Args:
+        document: Document to keep open until the scope ends
+
+    Returns:
+        False outside a document scope, the caller must then close it
+    """
+    documents = _scope_documents.get()
+    if documents is None:
+        return False
+    documents.append(document)
+    return True
@@ -0,0 +1,410 @@
+"""
+Result cache for the pipeline.
+
+This module provides a content-addressed cache of pipeline outputs and of the
+outputs of the expensive stages, so that unchanged work is not done again.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import pickle
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+from utils.pipeline.core.pdf_document import DOCUMENT_KEY
+from utils.pipeline.processors.document_classifier import CLASSIFIER_CONFIG_KEYS
+from utils.pipeline.utils.logging import get_logger
+
+# Bump when a change to the strategies alters their output, it invalidates
+# every cached result
+STRATEGY_VERSION = "1"
+
+# Pipeline config keys that change the output of a document
+FINGERPRINT_KEYS = [
+    "strategies",
+    "classification",
+    "enable_classification",
+    "match_schemas",
+    "output_format",
+    "use_enhanced_markdown",
+    "markdown_options",
+    *CLASSIFIER_CONFIG_KEYS,
+]
+
+# Stages whose outputs are memoized, in pipeline order, with their strategy
+MEMOIZED_STAGES = {"analyze": "analyzer", "clean": "cleaner", "extract": "extractor"}
+
+DEFAULT_CACHE_CONFIG = {
+    "enabled": False,
+    "directory": ".pipeline_cache",
+    "max_size_mb": 1024,
+    "refresh": False,  # Recompute and overwrite existing entries
+    "stages": True,  # Also memoize the analyze, clean and extract outputs
+    "version": "",  # Appended to STRATEGY_VERSION
+}
+
+RESULT_SUFFIX = ".json"
+STAGE_SUFFIX = ".stage"
+
+# Share of max_size_mb kept after an eviction, so it doesn't run on every write
+EVICTION_TARGET = 0.9
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    SHA-256 of a file's bytes.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """
+    Hash of the pipeline config that affects the output.
+
+    Args:
+        config: Pipeline configuration
+
+    Returns:
+        Hex digest of the relevant config and the strategy version
+    """
+    relevant = {key: config.get(key) for key in FINGERPRINT_KEYS}
+    relevant["version"] = _version(config)
+    encoded = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _version(config: Dict[str, Any]) -> str:
+    return STRATEGY_VERSION + str(config.get("cache", {}).get("version", ""))
+
+
+def stage_keys(digest: str, config: Dict[str, Any], doc_type: str) -> Dict[str, str]:
+    """
+    Cache keys of the memoized stages of a document.
+
+    The key of a stage covers the file and the strategies of that stage and
+    of every stage before it, so a changed strategy invalidates its own
+    output and everything downstream.
+
+    Args:
+        digest: SHA-256 of the input file
+        config: Pipeline configuration
+        doc_type: Document type selecting the strategies
+
+    Returns:
+        Key of each stage in MEMOIZED_STAGES
+    """
+    doc_strategies = config.get("strategies", {}).get(doc_type)
+    keys = {}
+    key = f"{digest}:{doc_type}:{_version(config)}"
+    for stage, strategy in MEMOIZED_STAGES.items():
+        if isinstance(doc_strategies, dict):
+            strategy_path = doc_strategies.get(strategy)
+        else:
+            # Legacy format, all strategies come from one module
+            strategy_path = doc_strategies
+        encoded = f"{key}:{stage}:{strategy_path}".encode("utf-8")
+        key = hashlib.sha256(encoded).hexdigest()
+        keys[stage] = key
+    return keys
+
+
+class ResultCache:
+    """
+    Pipeline outputs stored as JSON files under a cache directory.
+
+    Entries are keyed by the SHA-256 of the input file and the fingerprint of
+    the pipeline config. Reading an entry marks it as recently used. When the
+    directory grows beyond max_size_mb, the least recently used entries are
+    evicted.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_size_mb: float = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory of the cache entries, created if missing
+            max_size_mb: Size limit of the cache, 0 disables eviction
+        """
+        self.directory = Path(directory)
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.logger = get_logger(__name__)
+        # Total size of the entries, computed on the first write
+        self._size: Optional[int] = None
+
+    def key(self, digest: str, fingerprint: str) -> str:
+        """
+        Cache key of a pipeline output.
+
+        Args:
+            digest: SHA-256 of the input file
+            fingerprint: Fingerprint of the pipeline config
+
+        Returns:
+            Key of the cache entry
+        """
+        return hashlib.sha256(f"{digest}:{fingerprint}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str, suffix: str = RESULT_SUFFIX) -> Path:
+        return self.directory / key[:2] / f"{key}{suffix}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached output.
+
+        Args:
+            key: Key of the cache entry
+
+        Returns:
+            The cached output, or None on a miss
+        """
+        return self._read(self._entry_path(key), json.loads)
+
+    def get_stage(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a memoized stage output.
+
+        Args:
+            key: Key of the stage, see stage_keys
+
+        Returns:
+            The stage output, or None on a miss
+        """
+        return self._read(
+            self._entry_path(key, STAGE_SUFFIX),
+            lambda raw: pickle.loads(zlib.decompress(raw)),
+        )
+
+    def _read(self, path: Path, decode: Callable[[bytes], Any]) -> Optional[Any]:
+        try:
+            with open(path, "rb") as f:
+                data = decode(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Truncated or written by an incompatible version
+            self.logger.warning(f"Discarding unreadable cache entry {path}: {str(e)}")
+            self._remove(path)
+            return None
+
+        # Mark as recently used for the LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]) -> bool:
+        """
+        Store an output.
+
+        Args:
+            key: Key of the cache entry
+            data: Output to store, must be JSON serializable
+
+        Returns:
+            True if the output was stored
+        """
+        try:
+            encoded = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            self.logger.warning(f"Output not cached, it isn't JSON serializable: {e}")
+            return False
+        return self._write(self._entry_path(key), encoded)
+
+    def put_stage(self, key: str, data: Dict[str, Any]) -> bool:
+        """
+        Store a stage output as compressed pickle.
+
+        The open document handle of the PDF stages is left out, a stage
+        resumed from the cache opens the file itself when it needs it.
+
+        Args:
+            key: Key of the stage, see stage_keys
+            data: Stage output
+
+        Returns:
+            True if the output was stored
+        """
+        if isinstance(data, dict) and DOCUMENT_KEY in data:
+            data = {k: v for k, v in data.items() if k != DOCUMENT_KEY}
+        try:
+            encoded = zlib.compress(
+                pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), 1
+            )
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Stage output not cached, it can't be pickled: {e}")
+            return False
+        return self._write(self._entry_path(key, STAGE_SUFFIX), encoded)
+
+    def _write(self, path: Path, encoded: bytes) -> bool:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous = path.stat().st_size if path.exists() else 0
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache entry {path}: {str(e)}")
+            return False
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(encoded) - previous
+        if self.max_size and self._size > self.max_size:
+            self.evict()
+        return True
+
+    def _entries(self) -> Iterator[Path]:
+        return itertools.chain(
+            self.directory.glob(f"*/*{RESULT_SUFFIX}"),
+            self.directory.glob(f"*/*{STAGE_SUFFIX}"),
+        )
+
+    def _scan_size(self) -> int:
+        size = 0
+        for path in self._entries():
+            try:
+                size += path.stat().st_size
+            except OSError:
+                pass
+        return size
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used entries until the cache fits its limit.
+
+        Returns:
+            Number of removed entries
+        """
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target = self.max_size * EVICTION_TARGET
+        removed = 0
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            self._remove(path)
+            size -= entry_size
+            removed += 1
+
+        self._size = size
+        if removed:
+            self.logger.info(f"Evicted {removed} entries from the result cache")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self._entries():
+            self._remove(path)
+        self._size = 0
+
+
+class StageMemo:
+    """
+    Memoized stage outputs of one pipeline run.
+
+    The output of the latest stage found in the cache is loaded up front. The
+    stages before it are skipped, the stages after it run and store their
+    output. Entries are keyed by content, so the resumed output gets the path
+    of the current input.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[ResultCache] = None,
+        keys: Optional[Dict[str, str]] = None,
+        refresh: bool = False,
+        path: Optional[str] = None,
+    ):
+        """
+        Look up the stage outputs of a document.
+
+        Args:
+            cache: Cache of the stage outputs, None runs every stage
+            keys: Key of each stage, see stage_keys
+            refresh: Run every stage and replace the stored outputs
+            path: Path of the input document
+        """
+        self.cache = cache
+        self.keys = keys or {}
+        self.path = path
+        self.resume_stage: Optional[str] = None
+        self._resumed: Any = None
+
+        if cache is not None and not refresh:
+            for stage in reversed(list(MEMOIZED_STAGES)):
+                data = cache.get_stage(self.keys[stage])
+                if data is not None:
+                    self.resume_stage = stage
+                    self._resumed = self._with_path(data)
+                    break
+
+    def _with_path(self, data: Any) -> Any:
+        """Give a cached output the path of the current input."""
+        if self.path is None or not isinstance(data, dict):
+            return data
+        if "path" in data:
+            data["path"] = self.path
+        setup = data.get("setup")
+        if isinstance(setup, dict) and "path" in setup:
+            setup["path"] = self.path
+        return data
+
+    def run(self, stage: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a stage unless its output is already known.
+
+        Args:
+            stage: Name of the stage in MEMOIZED_STAGES
+            func: Function computing the stage output
+            *args: Arguments of func
+
+        Returns:
+            The stage output, None for a stage skipped because a later stage
+            was resumed from the cache
+        """
+        if self.resume_stage is not None:
+            stages = list(MEMOIZED_STAGES)
+            position = stages.index(stage)
+            resume_position = stages.index(self.resume_stage)
+            if position < resume_position:
+                return None
+            if position == resume_position:
+                return self._resumed
+
+        output = func(*args)
+        if self.cache is not None:
+            self.cache.put_stage(self.keys[stage], output)
+        return output
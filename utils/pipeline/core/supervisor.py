@@ -0,0 +1,199 @@
+"""
+Supervised processing of single files.
+
+This module runs files through the pipeline in a child process that is
+replaced when a file takes too long, uses too much memory or crashes it.
+"""
+
+import copy
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.pipeline.utils.logging import get_logger
+
+# Seconds between two checks of the worker's time and memory use
+POLL_INTERVAL = 0.1
+# Seconds allowed for a new worker to import the pipeline, not part of the
+# timeout of a file
+STARTUP_TIMEOUT = 120
+
+
+def _rss_bytes(pid: int) -> Optional[int]:
+    """Resident memory of a process, None if it can't be read."""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    # Platforms without /proc
+    try:
+        import psutil
+
+        return psutil.Process(pid).memory_info().rss
+    except Exception:
+        return None
+
+
+class SupervisedWorker:
+    """
+    A child process that processes one file at a time.
+
+    The parent waits for each result with a wall-clock timeout and checks the
+    child's resident memory. A child that exceeds either limit is killed and
+    the file is reported as failed. A new child is started for the next file.
+    """
+
+    def __init__(
+        self,
+        input_dir: str,
+        output_dir: str,
+        config: Dict[str, Any],
+        timeout: float = 0,
+        max_memory_mb: float = 0,
+    ):
+        """
+        Initialize the worker, the child process starts with the first file.
+
+        Args:
+            input_dir: Input directory of the file processor
+            output_dir: Output directory of the file processor
+            config: File processor configuration
+            timeout: Seconds allowed per file, 0 disables the timeout
+            max_memory_mb: Resident memory allowed, 0 disables the limit
+        """
+        self.input_dir = input_dir
+        self.output_dir = output_dir
+        self.config = config
+        self.timeout = timeout
+        self.max_memory = int(max_memory_mb * 1024 * 1024)
+        self.logger = get_logger(__name__)
+        self._context = multiprocessing.get_context("spawn")
+        self._process: Any = None
+        self._conn: Any = None
+
+    def _start(self) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.input_dir, self.output_dir, self.config),
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+        # Wait until the worker is ready
+        try:
+            if parent_conn.poll(STARTUP_TIMEOUT) and parent_conn.recv():
+                return
+        except (EOFError, OSError):
+            pass
+        self._kill()
+        raise RuntimeError("Worker process failed to start")
+
+    def _kill(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def process(self, file: Path) -> Dict[str, Any]:
+        """
+        Process a file in the child process.
+
+        Args:
+            file: Input file path
+
+        Returns:
+            Result dictionary of the file. When the child was killed or died,
+            an error result whose `reason` is "timeout", "memory" or "crash"
+        """
+        if self._process is None or not self._process.is_alive():
+            self._kill()
+            try:
+                self._start()
+            except RuntimeError as e:
+                return self._failure(file, "crash", str(e))
+
+        start = time.monotonic()
+        self._conn.send(str(file))
+        while True:
+            try:
+                if self._conn.poll(POLL_INTERVAL):
+                    return self._conn.recv()
+            except (EOFError, OSError):
+                pass
+
+            if not self._process.is_alive():
+                exitcode = self._process.exitcode
+                self._kill()
+                return self._failure(
+                    file, "crash", f"Worker process died (exit code {exitcode})"
+                )
+
+            if self.timeout and time.monotonic() - start > self.timeout:
+                self._kill()
+                return self._failure(
+                    file, "timeout", f"Timed out after {self.timeout:g}s"
+                )
+
+            if self.max_memory:
+                rss = _rss_bytes(self._process.pid)
+                if rss is not None and rss > self.max_memory:
+                    self._kill()
+                    return self._failure(
+                        file,
+                        "memory",
+                        f"Exceeded the memory limit of "
+                        f"{self.max_memory // (1024 * 1024)} MB",
+                    )
+
+    def _failure(self, file: Path, reason: str, message: str) -> Dict[str, Any]:
+        self.logger.error(f"Error processing {file.name}: {message}")
+        return {
+            "file": str(file),
+            "status": "error",
+            "error": message,
+            "reason": reason,
+        }
+
+    def close(self) -> None:
+        """Stop the child process."""
+        if self._process is not None and self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._process.join(timeout=5)
+        self._kill()
+
+
+def _worker_main(
+    conn: Any, input_dir: str, output_dir: str, config: Dict[str, Any]
+) -> None:
+    """Process the files sent by the supervisor until it sends None."""
+    # Imported here, the file processor creates supervised workers itself
+    from utils.pipeline.core.file_processor import FileProcessor
+
+    worker_config = copy.deepcopy(config)
+    processing = worker_config["file_processing"]["processing"]
+    processing.update(parallel=False, timeout=0, max_memory_mb=0)
+    processing["error_handling"]["retry_count"] = 0
+    processor = FileProcessor(input_dir, output_dir, worker_config)
+    conn.send(True)
+
+    while True:
+        try:
+            file = conn.recv()
+        except EOFError:
+            # The supervisor is gone
+            break
+        if file is None:
+            break
+        conn.send(processor.process_file(Path(file)))
@@ -4,10 +4,21 @@ Main pipeline orchestrator module.
 This module provides the core pipeline functionality for document processing.
 """
 
+import copy
 import importlib
+import json
 import os
-from typing import Any, Dict, Optional
-
+from typing import Any, Dict, Optional, Tuple
+
+from utils.pipeline.core.pdf_document import document_scope
+from utils.pipeline.core.result_cache import (
+    DEFAULT_CACHE_CONFIG,
+    ResultCache,
+    StageMemo,
+    config_fingerprint,
+    file_digest,
+    stage_keys,
+)
 from utils.pipeline.processors.formatters.factory import FormatterFactory, OutputFormat
 from utils.pipeline.utils.logging import get_logger
 from utils.pipeline.utils.progress import PipelineProgress
@@ -40,6 +51,23 @@ class Pipeline:
         # Initialize strategy selector
         self.strategy_selector = StrategySelector(self.config)
 
+        # Document classifier reused across documents, with the config it was
+        # built from
+        self._classifier: Any = None
+        self._classifier_config: Optional[str] = None
+
+        # Initialize the result cache of unchanged documents if enabled
+        cache_config = {**DEFAULT_CACHE_CONFIG, **self.config.get("cache", {})}
+        self.cache: Optional[ResultCache] = None
+        if cache_config["enabled"]:
+            self.cache = ResultCache(
+                cache_config["directory"], cache_config["max_size_mb"]
+            )
+        self.refresh_cache = cache_config["refresh"]
+        self.memoize_stages = cache_config["stages"]
+        # Whether the output of the last run came from the cache
+        self.last_cache_hit = False
+
         # Print the classification configuration for debugging
         if "classification" in self.config:
             self.logger.info("Classification config: %s", self.config["classification"])
@@ -52,6 +80,9 @@ class Pipeline:
         """
         Run the pipeline on the input document.
 
+        With the result cache enabled, the output of a document processed
+        before with the same content and config is returned from the cache.
+
         Args:
             input_path: Path to the input document
             show_progress: Whether to display progress bars (default: True)
@@ -59,6 +90,58 @@ class Pipeline:
         Returns:
             Processed output data as a dictionary
         """
+        self.last_cache_hit = False
+        if self.cache is None:
+            return self._process(input_path, show_progress)
+
+        try:
+            digest = file_digest(input_path)
+        except OSError:
+            # Unreadable input, processing reports the error
+            return self._process(input_path, show_progress)
+        key = self.cache.key(digest, config_fingerprint(self.config))
+
+        if not self.refresh_cache:
+            output_data = self.cache.get(key)
+            if output_data is not None:
+                self.logger.info("Using cached output for: %s", input_path)
+                self.last_cache_hit = True
+                # The same content may have been processed under another path
+                document = output_data.get("document")
+                if isinstance(document, dict) and "path" in document:
+                    document["path"] = input_path
+                return output_data
+
+        output_data = self._process(input_path, show_progress, digest)
+        self.cache.put(key, output_data)
+        return output_data
+
+    def _process(
+        self, input_path: str, show_progress: bool, digest: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the pipeline stages on the input document.
+
+        With stage memoization, processing resumes after the latest of the
+        analyze, clean and extract stages whose output is cached.
+
+        Args:
+            input_path: Path to the input document
+            show_progress: Whether to display progress bars
+            digest: SHA-256 of the input file, required for stage memoization
+
+        Returns:
+            Processed output data as a dictionary
+        """
+        # The document opened by the analyzer is shared with the later stages
+        # and closed when the run ends
+        with document_scope():
+            return self._run_stages(input_path, show_progress, digest)
+
+    def _run_stages(
+        self, input_path: str, show_progress: bool, digest: Optional[str]
+    ) -> Dict[str, Any]:
+        """Run the stages for _process, inside its document scope."""
         self.logger.info("Starting pipeline processing for: %s", input_path)
         progress = PipelineProgress()
 
@@ -67,23 +150,31 @@ class Pipeline:
                 # Process without progress display
                 doc_type = self._detect_document_type(input_path)
                 strategies = self.strategy_selector.get_strategies(doc_type)
+                memo = self._stage_memo(input_path, doc_type, digest)
 
                 # Track stage outputs
                 stages_data = {}
                 stages_data["setup"] = {"path": input_path, "type": doc_type}
 
                 # 1. Analyze document structure
-                analysis_result = self._analyze_document(
-                    input_path, strategies.analyzer
+                analysis_result = memo.run(
+                    "analyze",
+                    self._analyze_document,
+                    input_path,
+                    strategies.analyzer,
                 )
                 stages_data["analyze"] = analysis_result
 
                 # 2. Clean and normalize content
-                cleaned_data = self._clean_content(analysis_result, strategies.cleaner)
+                cleaned_data = memo.run(
+                    "clean", self._clean_content, analysis_result, strategies.cleaner
+                )
                 stages_data["clean"] = cleaned_data
 
                 # 3. Extract structured data
-                extracted_data = self._extract_data(cleaned_data, strategies.extractor)
+                extracted_data = memo.run(
+                    "extract", self._extract_data, cleaned_data, strategies.extractor
+                )
                 stages_data["extract"] = extracted_data
 
                 # 4. Validate extracted data
@@ -162,6 +253,7 @@ class Pipeline:
                 doc_type = self._detect_document_type(input_path)
                 self.logger.info("Detected document type: %s", doc_type)
                 strategies = self.strategy_selector.get_strategies(doc_type)
+                memo = self._stage_memo(input_path, doc_type, digest)
 
                 # Track stage outputs
                 stages_data = {}
@@ -172,8 +264,11 @@ class Pipeline:
 
                 # 1. Analyze document structure
                 analyze_task = progress.add_task("Step 1: Analyzing document structure")
-                analysis_result = self._analyze_document(
-                    input_path, strategies.analyzer
+                analysis_result = memo.run(
+                    "analyze",
+                    self._analyze_document,
+                    input_path,
+                    strategies.analyzer,
                 )
                 stages_data["analyze"] = analysis_result
                 progress.update(analyze_task, advance=1)
@@ -184,7 +279,9 @@ class Pipeline:
                 clean_task = progress.add_task(
                     "Step 2: Cleaning and normalizing content"
                 )
-                cleaned_data = self._clean_content(analysis_result, strategies.cleaner)
+                cleaned_data = memo.run(
+                    "clean", self._clean_content, analysis_result, strategies.cleaner
+                )
                 stages_data["clean"] = cleaned_data
                 progress.update(clean_task, advance=1)
                 progress.update(overall_task, advance=1)
@@ -192,7 +289,9 @@ class Pipeline:
 
                 # 3. Extract structured data
                 extract_task = progress.add_task("Step 3: Extracting structured data")
-                extracted_data = self._extract_data(cleaned_data, strategies.extractor)
+                extracted_data = memo.run(
+                    "extract", self._extract_data, cleaned_data, strategies.extractor
+                )
                 stages_data["extract"] = extracted_data
                 progress.update(extract_task, advance=1)
                 progress.update(overall_task, advance=1)
@@ -288,6 +387,23 @@ class Pipeline:
             progress.display_error(error_msg)
             raise PipelineError(error_msg) from e
 
+    def _stage_memo(
+        self, input_path: str, doc_type: str, digest: Optional[str]
+    ) -> StageMemo:
+        """Memoized stage outputs of a run, a no-op without stage memoization."""
+        if self.cache is None or not self.memoize_stages or digest is None:
+            return StageMemo()
+
+        memo = StageMemo(
+            self.cache,
+            stage_keys(digest, self.config, doc_type),
+            self.refresh_cache,
+            input_path,
+        )
+        if memo.resume_stage:
+            self.logger.info("Resuming after the cached %s stage", memo.resume_stage)
+        return memo
+
     def _classify_document(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Classify document type and identify schema pattern.
@@ -298,14 +414,8 @@ class Pipeline:
         Returns:
             Classification result with document type, confidence, and schema pattern
         """
-        # Import the document classifier
-        from utils.pipeline.processors.document_classifier import DocumentClassifier
-
-        # Create classifier with config
-        classifier = DocumentClassifier(config=self.config)
-
         # Perform classification
-        classification = classifier.classify(validated_data)
+        classification = self._get_classifier().classify(validated_data)
 
         # Check if we should match against known schemas
         if self.config.get("match_schemas", False):
@@ -313,6 +423,29 @@ class Pipeline:
 
         return classification
 
+    def _get_classifier(self) -> Any:
+        """
+        Get the document classifier, built again only when its config changed.
+
+        Returns:
+            DocumentClassifier for the current config
+        """
+        # Import the document classifier
+        from utils.pipeline.processors.document_classifier import (
+            CLASSIFIER_CONFIG_KEYS,
+            DocumentClassifier,
+        )
+
+        classifier_config = json.dumps(
+            [self.config.get(key) for key in CLASSIFIER_CONFIG_KEYS],
+            sort_keys=True,
+            default=str,
+        )
+        if self._classifier is None or classifier_config != self._classifier_config:
+            self._classifier = DocumentClassifier(config=self.config)
+            self._classifier_config = classifier_config
+        return self._classifier
+
     def _match_schema(
         self, document_data: Dict[str, Any], classification: Dict[str, Any]
     ) -> None:
@@ -528,6 +661,9 @@ class StrategySelector:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = get_logger(__name__ + ".StrategySelector")
+        # Strategy sets by document type, with the strategy paths they were
+        # built from, reused until the paths change
+        self._strategy_sets: Dict[str, Tuple[Any, "StrategySet"]] = {}
 
     def get_strategies(self, doc_type: str) -> "StrategySet":
         """Get the set of strategies for a document type."""
@@ -544,23 +680,14 @@ class StrategySelector:
             if not doc_strategies:
                 raise ImportError(f"No strategy paths configured for {doc_type}")
 
-            # If the strategy is a string, use it as a legacy format
-            if isinstance(doc_strategies, str):
-                return self._get_legacy_strategies(doc_strategies)
+            # Reuse the strategies of an earlier document
+            cached = self._strategy_sets.get(doc_type)
+            if cached is not None and cached[0] == doc_strategies:
+                return cached[1]
 
-            # Import each strategy component
-            analyzer = self._import_strategy(doc_strategies.get("analyzer"))
-            cleaner = self._import_strategy(doc_strategies.get("cleaner"))
-            extractor = self._import_strategy(doc_strategies.get("extractor"))
-            validator = self._import_strategy(doc_strategies.get("validator"))
-
-            return StrategySet(
-                analyzer=analyzer,
-                cleaner=cleaner,
-                extractor=extractor,
-                validator=validator,
-                formatter=None,  # Formatter now handled by factory
-            )
+            strategy_set = self._create_strategies(doc_strategies)
+            self._strategy_sets[doc_type] = (copy.copy(doc_strategies), strategy_set)
+            return strategy_set
 
         except (ImportError, AttributeError) as e:
             self.logger.error(
@@ -575,6 +702,26 @@ class StrategySelector:
                 formatter=None,
             )
 
+    def _create_strategies(self, doc_strategies: Any) -> "StrategySet":
+        """Import and instantiate the strategies configured for a document type."""
+        # If the strategy is a string, use it as a legacy format
+        if isinstance(doc_strategies, str):
+            return self._get_legacy_strategies(doc_strategies)
+
+        # Import each strategy component
+        analyzer = self._import_strategy(doc_strategies.get("analyzer"))
+        cleaner = self._import_strategy(doc_strategies.get("cleaner"))
+        extractor = self._import_strategy(doc_strategies.get("extractor"))
+        validator = self._import_strategy(doc_strategies.get("validator"))
+
+        return StrategySet(
+            analyzer=analyzer,
+            cleaner=cleaner,
+            extractor=extractor,
+            validator=validator,
+            formatter=None,  # Formatter now handled by factory
+        )
+
     def _import_strategy(self, strategy_path: Optional[str]) -> Any:
         """Import a strategy class and create an instance."""
         if not strategy_path:
@@ -5,7 +5,7 @@ This module provides advanced keyword and phrase analysis for document classific
 """
 
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 from utils.pipeline.strategies.classifier_strategy import BaseClassifier
 
@@ -44,6 +44,58 @@ class KeywordAnalyzerClassifier(BaseClassifier):
         # Configure contextual rules
         self.contextual_rules = self.keyword_config.get("contextual_rules", {})
 
+        # Compiled once, every document is scanned with the same patterns
+        self._keyword_scanner, self._keyword_prefixes = self._compile_keywords()
+        self._phrase_regexes = {
+            pattern_type: [re.compile(pattern) for pattern in patterns]
+            for pattern_type, patterns in self.phrase_patterns.items()
+        }
+
+    def _compile_keywords(self) -> Tuple[Optional[Pattern[str]], Dict[str, List[str]]]:
+        """
+        Compile all keywords into a single scanner.
+
+        The keywords are compiled as a trie, so the scanner reads each
+        character once per position instead of once per keyword, and matches
+        at each word boundary the longest keyword that starts there. The
+        shorter keywords it starts with are listed for each keyword, so every
+        keyword is counted in one pass over the text.
+
+        Returns:
+            Tuple of (scanner, keywords matched by each scanner match), the
+            scanner is None without keywords
+        """
+        keywords = {
+            keyword.lower()
+            for keywords in self.keyword_groups.values()
+            for keyword in keywords
+            if keyword
+        }
+        if not keywords:
+            return None, {}
+
+        trie: Dict[str, Any] = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        scanner = re.compile(r"\b(?=(" + _trie_pattern(trie) + r")\b)")
+
+        # Keywords ending on the path of each keyword, at a word boundary
+        prefixes: Dict[str, List[str]] = {}
+        for keyword in keywords:
+            node = trie
+            prefixes[keyword] = []
+            for end, char in enumerate(keyword, start=1):
+                node = node[char]
+                if "" in node and (
+                    end == len(keyword)
+                    or re.match(re.escape(keyword[:end]) + r"\b", keyword)
+                ):
+                    prefixes[keyword].append(keyword[:end])
+        return scanner, prefixes
+
     def classify(
         self, document_data: Dict[str, Any], features: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -149,14 +201,22 @@ class KeywordAnalyzerClassifier(BaseClassifier):
         """
         results = {}
 
+        # Count the non-overlapping occurrences of every keyword in one pass
+        counts: Dict[str, int] = {}
+        if self._keyword_scanner is not None:
+            ends: Dict[str, int] = {}
+            for match in self._keyword_scanner.finditer(text):
+                start = match.start()
+                for keyword in self._keyword_prefixes[match.group(1)]:
+                    if start >= ends.get(keyword, 0):
+                        counts[keyword] = counts.get(keyword, 0) + 1
+                        ends[keyword] = start + len(keyword)
+
         # Check each keyword group
         for group_name, keywords in self.keyword_groups.items():
             group_counts = {}
             for keyword in keywords:
-                # Count occurrences of the keyword
-                count = len(
-                    re.findall(r"\b" + re.escape(keyword.lower()) + r"\b", text)
-                )
+                count = counts.get(keyword.lower(), 0)
                 if count > 0:
                     group_counts[keyword] = count
 
@@ -178,12 +238,11 @@ class KeywordAnalyzerClassifier(BaseClassifier):
         results = {}
 
         # Check each phrase pattern
-        for pattern_type, patterns in self.phrase_patterns.items():
+        for pattern_type in self.phrase_patterns:
             matches = []
-            for pattern in patterns:
+            for regex in self._phrase_regexes[pattern_type]:
                 # Find all matches for the pattern
-                found = re.findall(pattern, text)
-                matches.extend(found)
+                matches.extend(regex.findall(text))
 
             if matches:
                 results[pattern_type] = matches
@@ -316,3 +375,27 @@ class KeywordAnalyzerClassifier(BaseClassifier):
         best_type = max(type_scores.items(), key=lambda x: x[1][0])
 
         return (best_type[0], best_type[1][0], best_type[1][1])
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """
+    Regex matching the words of a character trie.
+
+    Args:
+        node: Trie node, mapping each next character to its node, with an
+            empty key where a word ends
+
+    Returns:
+        Pattern that prefers the longest word
+    """
+    branches = [
+        re.escape(char) + _trie_pattern(child) for char, child in node.items() if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+
+    # Optional where a word ends, tried greedily so longer words come first
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if "" in node else pattern
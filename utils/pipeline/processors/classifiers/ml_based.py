@@ -12,6 +12,49 @@ import numpy as np
 
 from utils.pipeline.strategies.classifier_strategy import BaseClassifier
 
+# ML features, in the column order of the feature matrix
+ML_FEATURES = [
+    "section_density",
+    "table_density",
+    "avg_section_length",
+    "metadata_completeness",
+    "has_payment_terms",
+    "has_delivery_terms",
+    "has_dollar_amounts",
+    "has_quantities",
+]
+
+# Example scoring weights of each document type (in a real implementation,
+# these would come from a trained model)
+TYPE_WEIGHTS = {
+    "PROPOSAL": {
+        "has_payment_terms": 0.3,
+        "has_delivery_terms": 0.3,
+        "section_density": 0.2,
+        "metadata_completeness": 0.2,
+    },
+    "QUOTATION": {
+        "has_dollar_amounts": 0.4,
+        "has_quantities": 0.3,
+        "table_density": 0.3,
+    },
+    "SPECIFICATION": {
+        "section_density": 0.4,
+        "avg_section_length": 0.3,
+        "metadata_completeness": 0.3,
+    },
+    "INVOICE": {
+        "has_dollar_amounts": 0.5,
+        "table_density": 0.3,
+        "metadata_completeness": 0.2,
+    },
+    "TERMS_AND_CONDITIONS": {
+        "section_density": 0.3,
+        "avg_section_length": 0.4,
+        "metadata_completeness": 0.3,
+    },
+}
+
 
 class MLBasedClassifier(BaseClassifier):
     """
@@ -48,6 +91,14 @@ class MLBasedClassifier(BaseClassifier):
             "TERMS_AND_CONDITIONS",
         ]
 
+        # Weight matrix, one row per document type and one column per feature
+        self.weights = np.array(
+            [
+                [TYPE_WEIGHTS[doc_type].get(name, 0.0) for name in ML_FEATURES]
+                for doc_type in self.document_types
+            ]
+        )
+
     def classify(
         self, document_data: Dict[str, Any], features: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -61,47 +112,85 @@ class MLBasedClassifier(BaseClassifier):
         Returns:
             Classification result with document type, confidence, and schema pattern
         """
-        try:
-            # Extract ML features
-            ml_features = self._extract_ml_features(document_data, features)
+        return self.classify_batch([document_data], [features])[0]
 
-            # In a real implementation, you would use your model to predict
-            # prediction = self.model.predict(ml_features)
+    def classify_batch(
+        self, documents: List[Dict[str, Any]], features: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify many documents, scoring their feature matrix at once.
 
-            # For this example, we'll use a simple scoring mechanism
-            scores = self._calculate_scores(ml_features)
+        Args:
+            documents: Processed data of each document
+            features: Extracted features of each document
 
-            # Normalize scores to [0,1] range
-            scores = scores / np.sum(scores) if np.sum(scores) > 0 else scores
+        Returns:
+            Classification result of each document, in order
+        """
+        # Extract ML features, one row per document
+        matrix = np.zeros((len(documents), len(ML_FEATURES)))
+        failed = set()
+        for row, (document_data, document_features) in enumerate(
+            zip(documents, features)
+        ):
+            try:
+                ml_features = self._extract_ml_features(
+                    document_data, document_features
+                )
+                matrix[row] = [ml_features[name] for name in ML_FEATURES]
+            except Exception as e:
+                self.logger.error(
+                    f"Error in ML classification: {str(e)}", exc_info=True
+                )
+                failed.add(row)
 
-            # Get best matching type
-            best_type_idx = np.argmax(scores)
-            confidence = float(scores[best_type_idx])  # Convert from numpy float
-            doc_type = self.document_types[best_type_idx]
+        # In a real implementation, you would use your model to predict
+        # predictions = self.model.predict(matrix)
+
+        # For this example, we'll use a simple scoring mechanism
+        scores = matrix @ self.weights.T
+        totals = scores.sum(axis=1, keepdims=True)
+
+        # Normalize scores to [0,1] range
+        scores = np.divide(scores, totals, out=scores, where=totals > 0)
+
+        # Get best matching type
+        best = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(documents)), best]
 
-            if confidence < self.confidence_threshold or np.sum(scores) == 0:
-                return {
-                    "document_type": "UNKNOWN",
-                    "confidence": confidence,
-                    "schema_pattern": "unknown",
-                    "key_features": list(ml_features.keys()),
-                }
-
-            return {
-                "document_type": doc_type,
-                "confidence": confidence,
-                "schema_pattern": f"ml_{doc_type.lower()}",
-                "key_features": list(ml_features.keys()),
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error in ML classification: {str(e)}", exc_info=True)
-            return {
-                "document_type": "UNKNOWN",
-                "confidence": 0.0,
-                "schema_pattern": "unknown",
-                "key_features": [],
-            }
+        results = []
+        for row, (best_type_idx, confidence, total) in enumerate(
+            zip(best.tolist(), confidences.tolist(), totals[:, 0].tolist())
+        ):
+            doc_type = self.document_types[best_type_idx]
+            if row in failed:
+                results.append(
+                    {
+                        "document_type": "UNKNOWN",
+                        "confidence": 0.0,
+                        "schema_pattern": "unknown",
+                        "key_features": [],
+                    }
+                )
+            elif confidence < self.confidence_threshold or total == 0:
+                results.append(
+                    {
+                        "document_type": "UNKNOWN",
+                        "confidence": confidence,
+                        "schema_pattern": "unknown",
+                        "key_features": list(ML_FEATURES),
+                    }
+                )
+            else:
+                results.append(
+                    {
+                        "document_type": doc_type,
+                        "confidence": confidence,
+                        "schema_pattern": f"ml_{doc_type.lower()}",
+                        "key_features": list(ML_FEATURES),
+                    }
+                )
+        return results
 
     def get_supported_types(self) -> List[str]:
         """
@@ -127,24 +216,21 @@ class MLBasedClassifier(BaseClassifier):
         """
         ml_features = {}
 
+        # Length of the section contents joined with spaces
+        sections = document_data.get("content", [])
+        content_length = sum(len(s.get("content", "")) for s in sections)
+        content_length += max(len(sections) - 1, 0)
+
         # Structure features
         ml_features["section_density"] = features["section_count"] / max(
-            len(
-                " ".join(
-                    [s.get("content", "") for s in document_data.get("content", [])]
-                )
-            ),
-            1,
+            content_length, 1
         )
         ml_features["table_density"] = features["table_count"] / max(
             features["section_count"], 1
         )
 
         # Content features
-        all_content = " ".join(
-            [s.get("content", "") for s in document_data.get("content", [])]
-        )
-        ml_features["avg_section_length"] = len(all_content) / max(
+        ml_features["avg_section_length"] = content_length / max(
             features["section_count"], 1
         )
 
@@ -167,51 +253,3 @@ class MLBasedClassifier(BaseClassifier):
         ml_features["has_quantities"] = float(features.get("has_quantities", False))
 
         return ml_features
-
-    def _calculate_scores(self, features: Dict[str, float]) -> np.ndarray:
-        """
-        Calculate classification scores for each document type.
-
-        Args:
-            features: Extracted ML features
-
-        Returns:
-            Array of scores for each document type
-        """
-        scores = np.zeros(len(self.document_types))
-
-        # Example scoring logic (in a real implementation, this would use a trained model)
-        for i, doc_type in enumerate(self.document_types):
-            if doc_type == "PROPOSAL":
-                scores[i] = (
-                    features["has_payment_terms"] * 0.3
-                    + features["has_delivery_terms"] * 0.3
-                    + features["section_density"] * 0.2
-                    + features["metadata_completeness"] * 0.2
-                )
-            elif doc_type == "QUOTATION":
-                scores[i] = (
-                    features["has_dollar_amounts"] * 0.4
-                    + features["has_quantities"] * 0.3
-                    + features["table_density"] * 0.3
-                )
-            elif doc_type == "SPECIFICATION":
-                scores[i] = (
-                    features["section_density"] * 0.4
-                    + features["avg_section_length"] * 0.3
-                    + features["metadata_completeness"] * 0.3
-                )
-            elif doc_type == "INVOICE":
-                scores[i] = (
-                    features["has_dollar_amounts"] * 0.5
-                    + features["table_density"] * 0.3
-                    + features["metadata_completeness"] * 0.2
-                )
-            elif doc_type == "TERMS_AND_CONDITIONS":
-                scores[i] = (
-                    features["section_density"] * 0.3
-                    + features["avg_section_length"] * 0.4
-                    + features["metadata_completeness"] * 0.3
-                )
-
-        return scores
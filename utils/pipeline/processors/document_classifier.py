@@ -4,12 +4,21 @@ Document classifier module.
 This module provides functionality for classifying documents based on their structure and content.
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from utils.pipeline.strategies.classifier_factory import ClassifierFactory
 from utils.pipeline.strategies.ensemble_manager import EnsembleManager
 from utils.pipeline.utils.logging import get_logger
 
+# Weight of the latest latency in the running cost of a classifier
+COST_SMOOTHING = 0.2
+
+# Pipeline config keys the classifier reads, a change to any of them changes
+# its output
+CLASSIFIER_CONFIG_KEYS = ["classifiers", "ensemble"]
+
 
 class DocumentClassifier:
     """
@@ -34,7 +43,23 @@ class DocumentClassifier:
 
         # Initialize factory and ensemble manager
         self.factory = ClassifierFactory()
-        self.ensemble_manager = EnsembleManager(self.config.get("ensemble", {}))
+        ensemble_config = self.config.get("ensemble", {})
+        self.ensemble_manager = EnsembleManager(ensemble_config)
+
+        # Classifiers run one after another, concurrently with a time budget
+        # in seconds per classifier (0 waits for every classifier), or as a
+        # cascade, cheapest first, until the vote is settled
+        self.execution = ensemble_config.get("execution", "sequential")
+        self.classifier_timeout = ensemble_config.get("classifier_timeout", 0)
+        self.classifier_timeouts = ensemble_config.get("classifier_timeouts", {})
+        self.cascade_confidence = ensemble_config.get("cascade_confidence", 0.8)
+        self.cascade_margin = ensemble_config.get("cascade_margin", 0.3)
+
+        # Running average latency of each classifier, in seconds
+        self.classifier_costs: Dict[str, float] = {}
+
+        # Latest thread of each classifier in concurrent execution
+        self._classifier_threads: Dict[str, threading.Thread] = {}
 
         # Register default classifiers
         self._register_default_classifiers()
@@ -82,11 +107,19 @@ class DocumentClassifier:
         """
         Classify the document based on its structure and content.
 
+        In concurrent execution, a classifier that exceeds its time budget is
+        left out of the ensemble and listed in `timed_out_classifiers`. In
+        cascade execution, the classifiers not needed to settle the vote are
+        listed in `skipped_classifiers`. The document type then matches
+        sequential execution, but the confidence is combined over the
+        classifiers that ran only, so it can differ.
+
         Args:
             document_data: Processed document data
 
         Returns:
-            Classification result with document type, confidence, and schema pattern
+            Classification result with document type, confidence, and schema
+            pattern, and the latency of each classifier in seconds
         """
         self.logger.info("Classifying document")
 
@@ -94,32 +127,38 @@ class DocumentClassifier:
             # Extract common features
             features = self._extract_features(document_data)
 
-            # Get all registered classifiers
-            classifier_info = self.factory.get_available_classifiers()
+            # Collect results from all registered classifiers
+            names = self.factory.get_classifier_names()
+            if self.execution == "concurrent":
+                outcomes = self._run_concurrent(names, document_data, features)
+            elif self.execution == "cascade":
+                outcomes = self._run_cascade(names, document_data, features)
+            else:
+                outcomes = {
+                    name: (*self._run_classifier(name, document_data, features), False)
+                    for name in names
+                }
 
-            # Collect results from all classifiers
             classification_results = []
-            for info in classifier_info:
-                try:
-                    classifier = self.factory.create_classifier(info["name"])
-                    result = classifier.classify(document_data, features)
-
-                    # Add classifier name to result
-                    result["classifier_name"] = info["name"]
+            latency = {}
+            timed_out = []
+            skipped = []
+            for name in names:
+                if name not in outcomes:
+                    skipped.append(name)
+                    continue
+                result, elapsed, late = outcomes[name]
+                latency[name] = round(elapsed, 6)
+                if late:
+                    timed_out.append(name)
+                elif result is not None:
                     classification_results.append(result)
 
-                    self.logger.info(
-                        f"Classifier {info['name']} result: {result['document_type']} "
-                        f"(confidence: {result['confidence']})"
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        f"Error using classifier {info['name']}: {str(e)}",
-                        exc_info=True,
-                    )
-
             # Combine results using ensemble manager
             final_result = self.ensemble_manager.combine_results(classification_results)
+            final_result["classifier_latency"] = latency
+            final_result["timed_out_classifiers"] = timed_out
+            final_result["skipped_classifiers"] = skipped
 
             self.logger.info(
                 f"Final classification: {final_result['document_type']} "
@@ -130,14 +169,285 @@ class DocumentClassifier:
         except Exception as e:
             self.logger.error(f"Error classifying document: {str(e)}", exc_info=True)
             # Return unknown classification on error
-            return {
-                "document_type": "UNKNOWN",
-                "confidence": 0.0,
-                "schema_pattern": "unknown",
-                "key_features": [],
-                "classifiers": [],
-                "error": str(e),
-            }
+            return self._error_result(e)
+
+    def classify_batch(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Classify many documents, passing them to each classifier at once.
+
+        Classifiers that override `classify_batch`, like the ML classifier,
+        score all the documents together. Every classifier runs on every
+        document, whatever the execution setting, and the latency reported
+        for a classifier is its share of the batch time per document.
+
+        Args:
+            documents: Processed data of each document
+
+        Returns:
+            Classification result of each document, in order, as returned by
+            `classify`
+        """
+        self.logger.info(f"Classifying {len(documents)} documents")
+
+        # Extract common features, a document that fails gets an error result
+        results: List[Optional[Dict[str, Any]]] = [None] * len(documents)
+        valid = []
+        features = []
+        for index, document_data in enumerate(documents):
+            try:
+                features.append(self._extract_features(document_data))
+                valid.append(index)
+            except Exception as e:
+                self.logger.error(
+                    f"Error classifying document: {str(e)}", exc_info=True
+                )
+                results[index] = self._error_result(e)
+        batch = [documents[index] for index in valid]
+
+        # Collect the results of each classifier for all the documents
+        names = self.factory.get_classifier_names()
+        classification_results: List[List[Dict[str, Any]]] = [[] for _ in batch]
+        latency = {}
+        for name in names:
+            start = time.perf_counter()
+            try:
+                classifier = self.factory.get_classifier(name)
+                name_results = classifier.classify_batch(batch, features)
+            except Exception as e:
+                self.logger.error(
+                    f"Error using classifier {name} on the batch: {str(e)}",
+                    exc_info=True,
+                )
+                # One document at a time, so that only the failing ones are lost
+                name_results = [
+                    self._run_classifier(name, document_data, document_features)[0]
+                    for document_data, document_features in zip(batch, features)
+                ]
+            elapsed = (time.perf_counter() - start) / max(len(batch), 1)
+            self._record_cost(name, elapsed)
+            latency[name] = round(elapsed, 6)
+
+            for document_results, result in zip(classification_results, name_results):
+                if result is not None:
+                    result["classifier_name"] = name
+                    document_results.append(result)
+
+        # Combine the results of each document using ensemble manager
+        for index, document_results in zip(valid, classification_results):
+            try:
+                final_result = self.ensemble_manager.combine_results(document_results)
+            except Exception as e:
+                self.logger.error(
+                    f"Error classifying document: {str(e)}", exc_info=True
+                )
+                final_result = self._error_result(e)
+            else:
+                final_result["classifier_latency"] = dict(latency)
+                final_result["timed_out_classifiers"] = []
+                final_result["skipped_classifiers"] = []
+            results[index] = final_result
+
+        return results
+
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """Unknown classification of a document that could not be classified."""
+        return {
+            "document_type": "UNKNOWN",
+            "confidence": 0.0,
+            "schema_pattern": "unknown",
+            "key_features": [],
+            "classifiers": [],
+            "error": str(error),
+        }
+
+    def _run_classifier(
+        self, name: str, document_data: Dict[str, Any], features: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Run one classifier, without raising.
+
+        Args:
+            name: Name of the registered classifier
+            document_data: Processed document data
+            features: Extracted features
+
+        Returns:
+            Tuple of (result, or None on error, latency in seconds)
+        """
+        start = time.perf_counter()
+        try:
+            classifier = self.factory.get_classifier(name)
+            result = classifier.classify(document_data, features)
+
+            # Add classifier name to result
+            result["classifier_name"] = name
+            elapsed = time.perf_counter() - start
+            self._record_cost(name, elapsed)
+
+            self.logger.info(
+                f"Classifier {name} result: {result['document_type']} "
+                f"(confidence: {result['confidence']}, {elapsed * 1000:.1f}ms)"
+            )
+            return result, elapsed
+        except Exception as e:
+            self.logger.error(
+                f"Error using classifier {name}: {str(e)}",
+                exc_info=True,
+            )
+            return None, time.perf_counter() - start
+
+    def _record_cost(self, name: str, elapsed: float) -> None:
+        """Update the running average latency of a classifier."""
+        cost = self.classifier_costs.get(name)
+        self.classifier_costs[name] = (
+            elapsed if cost is None else cost + COST_SMOOTHING * (elapsed - cost)
+        )
+
+    def _run_cascade(
+        self, names: List[str], document_data: Dict[str, Any], features: Dict[str, Any]
+    ) -> Dict[str, Tuple[Optional[Dict[str, Any]], float, bool]]:
+        """
+        Run the classifiers cheapest first, until the vote is settled.
+
+        The vote is settled when the classifiers that ran reach
+        `cascade_confidence` together, and the classifiers left can't change
+        the outcome of the full ensemble, see `_is_settled`. Classifiers
+        without a measured cost run first, in registration order, so that
+        they get one.
+
+        Args:
+            names: Names of the classifiers to run
+            document_data: Processed document data
+            features: Extracted features
+
+        Returns:
+            Tuple of (result, latency in seconds, False) for each classifier
+            that ran
+        """
+        order = sorted(names, key=lambda name: self.classifier_costs.get(name, 0.0))
+        outcomes = {}
+        results = []
+        for name in order:
+            result, elapsed = self._run_classifier(name, document_data, features)
+            outcomes[name] = (result, elapsed, False)
+            if result is None:
+                continue
+            results.append(result)
+            remaining = order[len(outcomes) :]
+            if remaining and self._is_settled(results, remaining):
+                self.logger.info(
+                    f"Classification settled by {', '.join(outcomes)}, skipping "
+                    f"{len(order) - len(outcomes)} classifiers"
+                )
+                break
+        return outcomes
+
+    def _is_settled(self, results: List[Dict[str, Any]], remaining: List[str]) -> bool:
+        """
+        Whether the remaining classifiers can be skipped after these results.
+
+        Scores are normalized by the weight of every classifier, as in the
+        full ensemble. Whatever the remaining classifiers vote, the leading
+        type must keep its lead and stay above the ensemble's minimum
+        confidence, so the cascade picks the same document type as running
+        all the classifiers. Only weighted average voting gives that
+        guarantee, and it doesn't extend to the confidence.
+
+        Args:
+            results: Results of the classifiers that ran
+            remaining: Names of the classifiers not run yet
+
+        Returns:
+            True if the vote is settled
+        """
+        ensemble = self.ensemble_manager
+        if ensemble.voting_method != "weighted_average":
+            return False
+
+        combined = ensemble.combine_results(results)
+        doc_type = combined["document_type"]
+        if doc_type == "UNKNOWN" or combined["confidence"] < self.cascade_confidence:
+            return False
+
+        ran_weight = sum(
+            ensemble.classifier_weight(result["classifier_name"]) for result in results
+        )
+        remaining_weight = sum(ensemble.classifier_weight(name) for name in remaining)
+        total_weight = ran_weight + remaining_weight
+        scores = ensemble.type_scores(results, total_weight)
+        leader = scores.get(doc_type, 0.0)
+        runner_up = max(
+            (score for other, score in scores.items() if other != doc_type),
+            default=0.0,
+        )
+        lead = leader - runner_up
+        return (
+            leader >= ensemble.minimum_confidence
+            and lead > remaining_weight / total_weight
+            and lead >= self.cascade_margin
+        )
+
+    def _run_concurrent(
+        self, names: List[str], document_data: Dict[str, Any], features: Dict[str, Any]
+    ) -> Dict[str, Tuple[Optional[Dict[str, Any]], float, bool]]:
+        """
+        Run the classifiers in threads, each within its time budget.
+
+        A thread can't be stopped, so a late classifier keeps running in the
+        background and its result is discarded. Until that thread finishes,
+        the classifier isn't started again and counts as timed out, so at most
+        one thread per classifier is left behind. The threads are daemons and
+        don't keep the process alive.
+
+        Args:
+            names: Names of the classifiers to run
+            document_data: Processed document data
+            features: Extracted features
+
+        Returns:
+            Tuple of (result, latency in seconds, whether it timed out) for
+            each classifier
+        """
+        outcomes: Dict[str, Tuple[Optional[Dict[str, Any]], float]] = {}
+
+        def run(name: str) -> None:
+            outcomes[name] = self._run_classifier(name, document_data, features)
+
+        start = time.perf_counter()
+        results = {}
+        threads = {}
+        for name in names:
+            previous = self._classifier_threads.get(name)
+            if previous is not None and previous.is_alive():
+                self.logger.warning(
+                    f"Classifier {name} is still running on an earlier document, "
+                    f"leaving it out of the ensemble"
+                )
+                results[name] = (None, 0.0, True)
+                continue
+            thread = threading.Thread(
+                target=run, args=(name,), name=f"classifier-{name}", daemon=True
+            )
+            thread.start()
+            threads[name] = thread
+            self._classifier_threads[name] = thread
+
+        for name, thread in threads.items():
+            timeout = self.classifier_timeouts.get(name, self.classifier_timeout)
+            if timeout:
+                thread.join(max(0.0, start + timeout - time.perf_counter()))
+            else:
+                thread.join()
+
+            if name in outcomes:
+                results[name] = (*outcomes[name], False)
+            else:
+                self.logger.warning(
+                    f"Classifier {name} exceeded its time budget of {timeout:g}s, "
+                    f"leaving it out of the ensemble"
+                )
+                results[name] = (None, time.perf_counter() - start, True)
+        return results
 
     def _extract_features(self, document_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -197,7 +507,7 @@ class DocumentClassifier:
                         break
 
         features["has_dollar_amounts"] = has_dollar_in_content or has_dollar_in_tables
-        features["has_quantities"] = any(word.isdigit() for word in all_content.split())
+        features["has_quantities"] = any(map(str.isdigit, all_content.split()))
 
         # Check for tables
         tables = document_data.get("tables", [])
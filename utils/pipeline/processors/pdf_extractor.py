@@ -5,10 +5,9 @@ This module provides functionality for extracting structured data from PDF conte
 """
 
 import re
-from typing import Any, Dict, List, Tuple
-
-import fitz  # PyMuPDF
+from typing import Any, Dict, List, Optional, Tuple
 
+from utils.pipeline.core.pdf_document import DOCUMENT_KEY, PageLayout, PDFDocument
 from utils.pipeline.strategies.base import ExtractorStrategy
 from utils.pipeline.utils.logging import get_logger
 
@@ -33,21 +32,27 @@ class PDFExtractor(ExtractorStrategy):
             f"Extracting data from PDF: {cleaned_data.get('path', 'unknown')}"
         )
 
+        # Reuse the document opened by the analyzer, its document scope closes it
+        document = cleaned_data.get(DOCUMENT_KEY)
+        owns_document = document is None or document.closed
+
         try:
-            # Extract sections and content
-            doc = fitz.open(cleaned_data["path"])
+            if owns_document:
+                document = PDFDocument(cleaned_data["path"])
 
-            # Extract text by sections
-            sections = self._extract_sections(doc)
+            try:
+                # Extract text by sections
+                sections = self._extract_sections(document.doc, document.page_texts())
 
-            # Extract tables if present
-            tables = self._extract_tables(doc)
+                # Extract tables if present
+                tables = self._extract_tables(document.doc, document.layouts())
+            finally:
+                if owns_document:
+                    document.close()
 
             # Extract schema structure
             schema = self._extract_schema(sections)
 
-            doc.close()
-
             # Return extracted data
             return {
                 "metadata": cleaned_data["metadata"],
@@ -114,12 +119,15 @@ class PDFExtractor(ExtractorStrategy):
 
         return schema
 
-    def _extract_sections(self, doc) -> List[Dict[str, Any]]:
+    def _extract_sections(
+        self, doc, page_texts: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extract sections from the PDF document.
 
         Args:
             doc: PyMuPDF document
+            page_texts: Text of each page if already extracted
 
         Returns:
             List of sections with titles and content
@@ -127,9 +135,10 @@ class PDFExtractor(ExtractorStrategy):
         sections = []
         current_section = {"title": "Introduction", "content": ""}
 
-        for page in doc:
-            text = page.get_text("text")
+        if page_texts is None:
+            page_texts = [page.get_text("text") for page in doc]
 
+        for text in page_texts:
             # Split text into lines
             lines = text.split("\n")
 
@@ -353,12 +362,12 @@ class PDFExtractor(ExtractorStrategy):
                 return i
         return -1
 
-    def _detect_table_borders(self, page) -> List[Dict[str, Any]]:
+    def _detect_table_borders(self, layout: PageLayout) -> List[Dict[str, Any]]:
         """
         Detect table borders in a page.
 
         Args:
-            page: PyMuPDF page object
+            layout: Layout of the page
 
         Returns:
             List of dictionaries containing border information
@@ -366,7 +375,7 @@ class PDFExtractor(ExtractorStrategy):
         border_info = []
 
         # Get the page's drawing commands which include lines and rectangles
-        dl = page.get_drawings()
+        dl = layout.drawings
 
         # Filter for horizontal and vertical lines that might be table borders
         horizontal_lines = []
@@ -531,12 +540,14 @@ class PDFExtractor(ExtractorStrategy):
 
         return groups
 
-    def _extract_labeled_tables(self, page, page_num) -> List[Dict[str, Any]]:
+    def _extract_labeled_tables(
+        self, layout: PageLayout, page_num
+    ) -> List[Dict[str, Any]]:
         """
         Extract tables that are explicitly labeled in the text.
 
         Args:
-            page: PyMuPDF page object
+            layout: Layout of the page
             page_num: Page number
 
         Returns:
@@ -546,7 +557,7 @@ class PDFExtractor(ExtractorStrategy):
 
         try:
             # Get page text
-            text = page.get_text("text")
+            text = layout.text
 
             # Find table labels
             table_matches = re.finditer(
@@ -644,27 +655,36 @@ class PDFExtractor(ExtractorStrategy):
 
         return labeled_tables
 
-    def _extract_tables(self, doc) -> List[Dict[str, Any]]:
+    def _extract_tables(
+        self, doc, layouts: Optional[List[PageLayout]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extract tables from the PDF document with improved structure detection.
         Uses a prioritized approach to reduce false positives.
 
+        Each page is read once into a PageLayout, all detection steps work on
+        its cached text and drawings.
+
         Args:
             doc: PyMuPDF document
+            layouts: Layout of each page if already created
 
         Returns:
             List of extracted tables with structure
         """
         tables = []
 
+        if layouts is None:
+            layouts = [PageLayout(page) for page in doc]
+
         try:
             # Use a prioritized approach to table detection
-            for page_num, page in enumerate(doc):
+            for page_num, layout in enumerate(layouts):
                 page_tables = []
 
                 # STEP 1: First try to detect tables using border detection (most reliable)
                 try:
-                    border_info = self._detect_table_borders(page)
+                    border_info = self._detect_table_borders(layout)
 
                     if border_info:
                         self.logger.info(
@@ -672,17 +692,16 @@ class PDFExtractor(ExtractorStrategy):
                         )
 
                         for table_border in border_info:
-                            # Extract text within the table borders
-                            table_rect = fitz.Rect(
-                                table_border["x0"],
-                                table_border["y0"],
-                                table_border["x1"],
-                                table_border["y1"],
+                            # Get text within the table borders
+                            table_text = layout.clip(
+                                (
+                                    table_border["x0"],
+                                    table_border["y0"],
+                                    table_border["x1"],
+                                    table_border["y1"],
+                                )
                             )
 
-                            # Get text within the table area
-                            table_text = page.get_text("dict", clip=table_rect)
-
                             # Process text blocks within the table
                             table_data = []
                             headers = []
@@ -806,7 +825,7 @@ class PDFExtractor(ExtractorStrategy):
                 # STEP 2: Look for explicitly labeled tables if no tables found via borders
                 if not page_tables:
                     try:
-                        labeled_tables = self._extract_labeled_tables(page, page_num)
+                        labeled_tables = self._extract_labeled_tables(layout, page_num)
                         if labeled_tables:
                             self.logger.info(
                                 f"Found {len(labeled_tables)} labeled tables on page {page_num + 1}"
@@ -821,7 +840,7 @@ class PDFExtractor(ExtractorStrategy):
                 if not page_tables:
                     try:
                         # Get blocks that might be tables
-                        blocks = page.get_text("dict")["blocks"]
+                        blocks = layout.blocks
 
                         # Track how many potential tables we find
                         potential_tables = 0
@@ -872,7 +891,7 @@ class PDFExtractor(ExtractorStrategy):
                 # STEP 4: Fallback to text-based table detection only if all other methods failed
                 if not page_tables:
                     try:
-                        text = page.get_text("text")
+                        text = layout.text
 
                         # Look for common table indicators
                         if any(
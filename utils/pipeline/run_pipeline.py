@@ -120,6 +120,18 @@ Examples:
 
   # Specify output formats
   python -m utils.pipeline.run_pipeline --input data/input --formats json,markdown
+
+  # Process files in parallel with 8 worker processes
+  python -m utils.pipeline.run_pipeline --input data/input --output data/output --parallel --workers 8
+
+  # Process every file again, updating the result cache
+  python -m utils.pipeline.run_pipeline --input data/input --output data/output --refresh
+
+  # Kill files running longer than 2 minutes or above 2 GB, retrying them twice
+  python -m utils.pipeline.run_pipeline --input data/input --output data/output --timeout 120 --max-memory 2048 --retries 2
+
+  # Continue an interrupted batch run, skipping the files it completed
+  python -m utils.pipeline.run_pipeline --input data/input --output data/output --resume
   
   # Analyze schemas
   python -m utils.pipeline.run_pipeline --analyze-schemas
@@ -181,6 +193,47 @@ Examples:
         "--pattern",
         help="File pattern to match (e.g., '*.pdf', defaults to all PDFs)",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Process files in parallel worker processes",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes with --parallel (defaults to all CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the result cache",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Process every file again and replace its cached result",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Seconds allowed per file before its worker process is killed",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=float,
+        metavar="MB",
+        help="Resident memory allowed per file before its worker process is killed",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        help="Times a failed file is retried, with exponential backoff",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip files the processing manifest records as completed and unchanged",
+    )
     parser.add_argument(
         "--report",
         type=Path,
@@ -211,6 +264,31 @@ def update_config_from_args(config: Dict, args: argparse.Namespace) -> Dict:
         config["file_processing"]["input"]["patterns"] = [args.pattern]
     config["file_processing"]["input"]["recursive"] = args.recursive
 
+    # Update parallel processing settings
+    processing = config["file_processing"].setdefault("processing", {})
+    if args.parallel:
+        processing["parallel"] = True
+    if args.workers is not None:
+        processing["workers"] = args.workers
+    if args.resume:
+        processing["resume"] = True
+
+    # Update per-file limits and retries
+    if args.timeout is not None:
+        processing["timeout"] = args.timeout
+    if args.max_memory is not None:
+        processing["max_memory_mb"] = args.max_memory
+    if args.retries is not None:
+        processing.setdefault("error_handling", {})["retry_count"] = args.retries
+
+    # Update result cache settings, the command line reuses the outputs of
+    # unchanged files unless disabled
+    cache = dict(config.get("cache", {}))
+    cache["enabled"] = cache.get("enabled", True) and not args.no_cache
+    if args.refresh:
+        cache["refresh"] = True
+    config["cache"] = cache
+
     # Update report path if specified
     if args.report:
         config["file_processing"]["reporting"]["save_path"] = str(args.report)
@@ -0,0 +1,228 @@
+"""
+Benchmark of sequential, cascading and batch document classification.
+
+Generates a corpus of proposals and invoices, most of them with clear
+signals and the rest mixing both types, then classifies it with every
+classifier, with the cascade and in one batch, and compares time and
+agreement:
+
+    python utils/pipeline/scripts/benchmark_classification.py --documents 200
+
+Small documents, as when re-classifying a large extracted corpus, are
+generated with fewer filler sections:
+
+    python utils/pipeline/scripts/benchmark_classification.py \\
+        --documents 100000 --sections 2 --no-cascade
+"""
+
+import argparse
+import copy
+import logging
+import os
+import random
+import sys
+import time
+
+# Add the repository root to the path to allow imports
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from utils.pipeline.processors.document_classifier import (  # noqa: E402
+    DocumentClassifier,
+)
+
+SIGNALS = {
+    "PROPOSAL": {
+        "titles": ["Proposal", "Payment Terms", "Delivery Schedule"],
+        "keywords": ["proposed", "scope of work", "deliverables", "pricing"],
+        "groups": {
+            "proposal_terms": ["proposal", "proposed", "scope of work", "offer"],
+            "delivery_terms": ["delivery", "deliverables", "schedule", "timeline"],
+        },
+    },
+    "INVOICE": {
+        "titles": ["Invoice", "Amount Due", "Payment"],
+        "keywords": ["invoice no", "bill to", "due date", "subtotal"],
+        "groups": {
+            "invoice_terms": ["invoice", "invoice no", "bill to", "amount due"],
+            "billing_terms": ["due date", "subtotal", "remit", "balance"],
+        },
+    },
+}
+
+FILLER = (
+    "the contractor shall furnish all labor materials and equipment required "
+    "for the complete installation as indicated on the drawings"
+).split()
+
+
+def create_config() -> dict:
+    """
+    Build a classification config for proposals and invoices.
+
+    Returns:
+        Pipeline configuration with rules, keyword groups and ensemble weights
+    """
+    rules = {
+        doc_type: {
+            "title_keywords": [doc_type.lower()],
+            "content_keywords": signals["keywords"],
+            "weights": {"title_match": 0.5, "content_match": 0.5},
+            "threshold": 0.4,
+            "schema_pattern": f"standard_{doc_type.lower()}",
+        }
+        for doc_type, signals in SIGNALS.items()
+    }
+    keyword_groups = {
+        group: keywords
+        for signals in SIGNALS.values()
+        for group, keywords in signals["groups"].items()
+    }
+    document_types = {
+        doc_type: {
+            "schema_pattern": f"standard_{doc_type.lower()}",
+            "keyword_groups": list(signals["groups"]),
+            "weights": {"keywords": 0.4},
+        }
+        for doc_type, signals in SIGNALS.items()
+    }
+    return {
+        "ensemble": {
+            "voting_method": "weighted_average",
+            "minimum_confidence": 0.45,
+            "classifier_weights": {
+                "rule_based": 0.25,
+                "pattern_matcher": 0.25,
+                "ml_based": 0.1,
+                "keyword_analyzer": 0.4,
+            },
+        },
+        "classifiers": {
+            "rule_based": {"classification": {"rules": rules}},
+            "keyword_analyzer": {
+                "keyword_analysis": {
+                    "threshold": 0.4,
+                    "keyword_groups": keyword_groups,
+                    "document_types": document_types,
+                }
+            },
+        },
+    }
+
+
+def create_document(
+    doc_type: str, easy: bool, rng: random.Random, filler_sections: int = 50
+) -> dict:
+    """
+    Build the data of one document.
+
+    Args:
+        doc_type: PROPOSAL or INVOICE
+        easy: Whether the document only has signals of its own type
+        rng: Random generator
+        filler_sections: Number of filler sections, of about 1.6 KB each
+
+    Returns:
+        Document data with signal sections and filler
+    """
+    types = [doc_type] if easy else list(SIGNALS)
+    sections = []
+    for signal_type in types:
+        signals = SIGNALS[signal_type]
+        for title in signals["titles"]:
+            content = " ".join(signals["keywords"]) + f" total ${rng.randint(1, 9999)}"
+            sections.append({"title": title, "content": content})
+    for number in range(filler_sections):
+        words = " ".join(rng.choice(FILLER) for _ in range(250))
+        sections.append({"title": f"Section {number + 1}", "content": words})
+    title = doc_type.title() if easy else "Document"
+    return {"metadata": {"title": title}, "content": sections, "tables": []}
+
+
+def classify_all(config: dict, documents: list) -> tuple:
+    """Classify the documents, returning the results and the elapsed time."""
+    classifier = DocumentClassifier(config=config)
+    start = time.perf_counter()
+    results = [classifier.classify(document) for document in documents]
+    return results, time.perf_counter() - start
+
+
+def classify_batch(config: dict, documents: list) -> tuple:
+    """Classify the documents in one batch, returning the results and the time."""
+    classifier = DocumentClassifier(config=config)
+    start = time.perf_counter()
+    results = classifier.classify_batch(documents)
+    return results, time.perf_counter() - start
+
+
+def agreement(first: list, second: list) -> float:
+    """Share of documents given the same type in both results."""
+    agreed = sum(
+        a["document_type"] == b["document_type"] for a, b in zip(first, second)
+    )
+    return agreed / len(first)
+
+
+def classifier_time(results: list) -> float:
+    """Total time spent in the classifiers themselves."""
+    return sum(sum(result["classifier_latency"].values()) for result in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--documents", type=int, default=200, help="corpus size")
+    parser.add_argument("--easy", type=float, default=0.8, help="share of easy docs")
+    parser.add_argument(
+        "--sections", type=int, default=50, help="filler sections per document"
+    )
+    parser.add_argument(
+        "--no-cascade", action="store_true", help="skip the cascade run"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(0)
+    documents = [
+        create_document(
+            rng.choice(list(SIGNALS)), rng.random() < args.easy, rng, args.sections
+        )
+        for _ in range(args.documents)
+    ]
+
+    config = create_config()
+    sequential, sequential_time = classify_all(config, documents)
+    print(f"{args.documents} documents, {args.easy:.0%} easy")
+    print(f"sequential {sequential_time:.2f}s")
+
+    if not args.no_cascade:
+        cascade_config = copy.deepcopy(config)
+        cascade_config["ensemble"]["execution"] = "cascade"
+        cascade, cascade_time = classify_all(cascade_config, documents)
+        skipped = sum(len(result["skipped_classifiers"]) for result in cascade)
+        sequential_classifiers = classifier_time(sequential)
+        cascade_classifiers = classifier_time(cascade)
+        print(
+            f"cascade {cascade_time:.2f}s, "
+            f"time saved {1 - cascade_time / sequential_time:.0%}"
+        )
+        print(
+            f"  in classifiers: sequential {sequential_classifiers:.2f}s, "
+            f"cascade {cascade_classifiers:.2f}s, "
+            f"saved {1 - cascade_classifiers / sequential_classifiers:.0%}"
+        )
+        print(f"  same document type for {agreement(sequential, cascade):.0%}")
+        print(f"  classifiers skipped per document {skipped / len(documents):.2f}")
+
+    batch, batch_time = classify_batch(config, documents)
+    print(f"batch {batch_time:.2f}s, time saved {1 - batch_time / sequential_time:.0%}")
+    latency = batch[0]["classifier_latency"]
+    print(
+        "  per document: "
+        + ", ".join(f"{name} {value * 1e6:.1f}us" for name, value in latency.items())
+    )
+    print(f"  same document type for {agreement(sequential, batch):.0%}")
+
+
+if __name__ == "__main__":
+    main()
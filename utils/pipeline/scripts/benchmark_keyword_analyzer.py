@@ -0,0 +1,135 @@
+"""
+Benchmark of the keyword analyzer classifier on a large document.
+
+Generates keyword groups of single words and two-word phrases, some sharing
+a prefix, and a document of random words containing them, then times the
+classifier on it:
+
+    python utils/pipeline/scripts/benchmark_keyword_analyzer.py --keywords 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the repository root to the path to allow imports
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from utils.pipeline.processors.classifiers.keyword_analyzer import (  # noqa: E402
+    KeywordAnalyzerClassifier,
+)
+
+GROUP_SIZE = 25
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(7))
+
+
+def create_config(keywords: int, rng: random.Random) -> dict:
+    """
+    Build a keyword analysis config.
+
+    Args:
+        keywords: Total number of keywords
+        rng: Random generator
+
+    Returns:
+        Classifier configuration
+    """
+    words = [_word(rng) for _ in range(keywords)]
+    groups = {}
+    for start in range(0, keywords, GROUP_SIZE):
+        group = []
+        for i, word in enumerate(words[start : start + GROUP_SIZE]):
+            # Every third keyword is a phrase starting with the one before it
+            group.append(f"{group[-1]} {word}" if i % 3 == 2 else word)
+        groups[f"group_{start // GROUP_SIZE}"] = group
+
+    names = list(groups)
+    return {
+        "keyword_analysis": {
+            "threshold": 0.1,
+            "keyword_groups": groups,
+            "phrase_patterns": {
+                "amounts": [r"\$[\d,]+\.\d{2}", r"total:?\s+\$[\d,]+"],
+                "dates": [r"\d{1,2}/\d{1,2}/\d{4}"],
+            },
+            "document_types": {
+                f"TYPE_{i}": {"keyword_groups": names[i::4], "phrase_patterns": []}
+                for i in range(4)
+            },
+        }
+    }
+
+
+def create_document(size: int, config: dict, rng: random.Random) -> dict:
+    """
+    Build document data with about `size` characters of text.
+
+    Args:
+        size: Approximate text size in characters
+        config: Classifier configuration with the keywords to include
+        rng: Random generator
+
+    Returns:
+        Document data with one section per 2000 characters
+    """
+    keywords = [
+        keyword
+        for group in config["keyword_analysis"]["keyword_groups"].values()
+        for keyword in group
+    ]
+    sections = []
+    length = 0
+    while length < size:
+        words = []
+        while sum(len(word) + 1 for word in words) < 2000:
+            roll = rng.random()
+            if roll < 0.05:
+                words.append(rng.choice(keywords))
+            elif roll < 0.06:
+                words.append(f"total: ${rng.randint(1, 99999):,}.00")
+            else:
+                words.append(_word(rng))
+        content = " ".join(words)
+        sections.append({"title": f"Section {len(sections) + 1}", "content": content})
+        length += len(content)
+    return {"metadata": {"title": "Benchmark"}, "content": sections, "tables": []}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--keywords", type=int, default=500, help="keyword count")
+    parser.add_argument("--size-mb", type=float, default=2, help="document size")
+    parser.add_argument("--runs", type=int, default=3, help="timed runs")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    config = create_config(args.keywords, rng)
+    document = create_document(int(args.size_mb * 1024 * 1024), config, rng)
+
+    start = time.perf_counter()
+    classifier = KeywordAnalyzerClassifier(config=config)
+    setup = time.perf_counter() - start
+
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        result = classifier.classify(document, {})
+        timings.append(time.perf_counter() - start)
+
+    print(
+        f"{args.keywords} keywords, {args.size_mb:g} MB, "
+        f"{result['document_type']} ({result['confidence']:.3f})"
+    )
+    print(f"setup {setup * 1000:.1f}ms")
+    print(f"best {min(timings):.2f}s, mean {sum(timings) / len(timings):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
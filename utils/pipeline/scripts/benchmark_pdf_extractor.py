@@ -0,0 +1,103 @@
+"""
+Benchmark of the PDF extractor on a large specification document.
+
+Generates a synthetic spec with numbered sections, ruled tables and labeled
+tables, then times the analyze, clean and extract stages on it:
+
+    python utils/pipeline/scripts/benchmark_pdf_extractor.py --pages 500
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import fitz  # PyMuPDF
+
+# Add the repository root to the path to allow imports
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+from utils.pipeline.analyzer.pdf import PDFAnalyzer  # noqa: E402
+from utils.pipeline.cleaner.pdf import PDFCleaner  # noqa: E402
+from utils.pipeline.core.pdf_document import document_scope  # noqa: E402
+from utils.pipeline.processors.pdf_extractor import PDFExtractor  # noqa: E402
+
+PARAGRAPH = (
+    "The contractor shall furnish all labor, materials and equipment required "
+    "for the complete installation as indicated on the drawings."
+)
+
+
+def _write_ruled_table(page, top: float) -> None:
+    """Draw a 4x3 grid and fill its cells."""
+    columns = [72, 222, 372, 522]
+    rows = [top + 20 * i for i in range(5)]
+    for y in rows:
+        page.draw_line((columns[0], y), (columns[-1], y))
+    for x in columns:
+        page.draw_line((x, rows[0]), (x, rows[-1]))
+    for r in range(4):
+        for c in range(3):
+            text = ["ITEM", "SIZE", "RATING"][c] if r == 0 else f"Value {r}.{c}"
+            page.insert_text((columns[c] + 4, rows[r] + 14), text, fontsize=9)
+
+
+def create_spec(path: str, pages: int) -> None:
+    """
+    Write a synthetic specification document.
+
+    Args:
+        path: Output path of the PDF
+        pages: Number of pages
+    """
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        lines = [f"{number + 1}.1 SECTION {number + 1} REQUIREMENTS"]
+        lines += [PARAGRAPH] * 20
+        if number % 3 == 1:
+            lines += [
+                "",
+                f"TABLE {number + 1}: Fixture Schedule",
+                "Type\tWattage\tMounting",
+                "A\t40\tRecessed",
+                "B\t60\tPendant",
+            ]
+        page.insert_text((72, 72), "\n".join(lines), fontsize=9)
+        if number % 3 == 0:
+            _write_ruled_table(page, 560)
+    doc.save(path)
+    doc.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500, help="pages of the spec")
+    parser.add_argument("--runs", type=int, default=3, help="timed runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "spec.pdf")
+        create_spec(path, args.pages)
+
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            with document_scope():
+                analysis = PDFAnalyzer().analyze(path)
+                cleaned = PDFCleaner().clean(analysis)
+                result = PDFExtractor().extract(cleaned)
+            timings.append(time.perf_counter() - start)
+
+    print(
+        f"{args.pages} pages, {len(result['sections'])} sections, "
+        f"{len(result['tables'])} tables"
+    )
+    print(f"best {min(timings):.2f}s, mean {sum(timings) / len(timings):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,7 @@ class ClassifierFactory:
 
     This factory:
     - Maintains registry of available classifiers
-    - Handles classifier instantiation
+    - Handles classifier instantiation, keeping one instance per classifier
     - Manages classifier configurations
     - Provides discovery of available classifiers
     """
@@ -26,6 +26,8 @@ class ClassifierFactory:
         """Initialize the classifier factory."""
         self._registered_classifiers: Dict[str, Type[ClassifierStrategy]] = {}
         self._classifier_configs: Dict[str, Dict[str, Any]] = {}
+        # Instances with the registered config, until it changes
+        self._instances: Dict[str, ClassifierStrategy] = {}
         self.logger = get_logger(__name__)
 
     def register_classifier(
@@ -46,6 +48,7 @@ class ClassifierFactory:
             self.logger.warning(f"Overwriting existing classifier registration: {name}")
 
         self._registered_classifiers[name] = classifier_class
+        self._instances.pop(name, None)
         if config:
             self._classifier_configs[name] = config
 
@@ -79,6 +82,37 @@ class ClassifierFactory:
         classifier_class = self._registered_classifiers[name]
         return classifier_class(config=classifier_config)
 
+    def get_classifier(self, name: str) -> ClassifierStrategy:
+        """
+        Get the shared instance of a registered classifier.
+
+        The instance is created on first use with the registered config and
+        reused until the classifier is registered again or its config changes.
+
+        Args:
+            name: Name of the classifier
+
+        Returns:
+            Instance of the requested classifier
+
+        Raises:
+            ValueError: If classifier name is not registered
+        """
+        classifier = self._instances.get(name)
+        if classifier is None:
+            classifier = self.create_classifier(name)
+            self._instances[name] = classifier
+        return classifier
+
+    def get_classifier_names(self) -> List[str]:
+        """
+        Get the names of all registered classifiers, in registration order.
+
+        Returns:
+            List of classifier names
+        """
+        return list(self._registered_classifiers)
+
     def get_available_classifiers(self) -> List[Dict[str, Any]]:
         """
         Get information about all registered classifiers.
@@ -87,13 +121,9 @@ class ClassifierFactory:
             List of classifier information dictionaries
         """
         classifiers = []
-        for name, classifier_class in self._registered_classifiers.items():
+        for name in self._registered_classifiers:
             try:
-                # Get base config for this classifier
-                config = self._classifier_configs.get(name, {})
-
-                # Create classifier instance using the class
-                classifier = self.create_classifier(name, config)
+                classifier = self.get_classifier(name)
 
                 # Get classifier metadata
                 classifiers.append(
@@ -128,6 +158,7 @@ class ClassifierFactory:
         if name in self._registered_classifiers:
             del self._registered_classifiers[name]
             self._classifier_configs.pop(name, None)
+            self._instances.pop(name, None)
             self.logger.info(f"Removed classifier registration: {name}")
         else:
             self.logger.warning(f"Attempted to remove unregistered classifier: {name}")
@@ -147,4 +178,5 @@ class ClassifierFactory:
             raise ValueError(f"No classifier registered with name: {name}")
 
         self._classifier_configs[name] = config
+        self._instances.pop(name, None)
         self.logger.info(f"Updated configuration for classifier: {name}")
@@ -40,6 +40,27 @@ class ClassifierStrategy(ABC):
         """
         pass
 
+    def classify_batch(
+        self, documents: List[Dict[str, Any]], features: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify many documents.
+
+        Classifies the documents one at a time, classifiers that can score
+        several documents at once override this.
+
+        Args:
+            documents: The data of each document to classify
+            features: Extracted features of each document
+
+        Returns:
+            Classification result of each document, in order
+        """
+        return [
+            self.classify(document_data, document_features)
+            for document_data, document_features in zip(documents, features)
+        ]
+
     @abstractmethod
     def get_supported_types(self) -> List[str]:
         """
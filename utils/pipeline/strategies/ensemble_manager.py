@@ -70,6 +70,49 @@ class EnsembleManager:
             )
             return self._weighted_average_vote(classifications)
 
+    def classifier_weight(self, name: str) -> float:
+        """
+        Get the voting weight of a classifier.
+
+        Args:
+            name: Name of the classifier
+
+        Returns:
+            Weight of the classifier's votes
+        """
+        return self.classifier_weights.get(name, self.default_weight)
+
+    def type_scores(
+        self,
+        classifications: List[Dict[str, Any]],
+        total_weight: Optional[float] = None,
+    ) -> Dict[str, float]:
+        """
+        Score each document type by the weighted confidence of its votes.
+
+        Args:
+            classifications: List of classification results
+            total_weight: Weight to normalize by, defaults to the weight of
+                the classifiers in classifications
+
+        Returns:
+            Dictionary mapping document types to scores between 0 and 1
+        """
+        type_votes: Dict[str, float] = defaultdict(float)
+        voted_weight = 0.0
+        for result in classifications:
+            weight = self.classifier_weight(result.get("classifier_name", "unknown"))
+            voted_weight += weight
+            type_votes[result["document_type"]] += result["confidence"] * weight
+
+        if total_weight is None:
+            total_weight = voted_weight
+        if not total_weight:
+            return {}
+        return {
+            doc_type: votes / total_weight for doc_type, votes in type_votes.items()
+        }
+
     def _weighted_average_vote(
         self, classifications: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -35,34 +35,50 @@ def test_pdf_analyzer_initialization():
 def test_pdf_analyzer_with_sample_pdf(sample_pdf_path, monkeypatch):
     """Test PDF analyzer with a sample PDF file."""
 
-    # Mock the open function to avoid actually opening a file
-    class MockPdfReader:
+    # Mock PyMuPDF to avoid actually parsing a file
+    class MockDocument:
         def __init__(self, *args, **kwargs):
             self.metadata = {
-                "/Title": "Sample PDF",
-                "/Author": "Test Author",
-                "/Subject": "Test Subject",
-                "/Creator": "Test Creator",
-                "/Producer": "Test Producer",
-                "/CreationDate": "D:20250315000000",
-                "/ModDate": "D:20250315000000",
+                "title": "Sample PDF",
+                "author": "Test Author",
+                "subject": "Test Subject",
+                "creator": "Test Creator",
+                "producer": "Test Producer",
+                "creationDate": "D:20250315000000",
+                "modDate": "D:20250315000000",
             }
             self.pages = [MockPage(), MockPage()]
+            self.is_closed = False
+
+        def __iter__(self):
+            return iter(self.pages)
+
+        def close(self):
+            self.is_closed = True
 
     class MockPage:
         def __init__(self):
             self.mediabox = [0, 0, 612, 792]
-
-        def get(self, key, default=None):
-            if key == "/Rotate":
-                return 0
-            return default
-
-        def extract_text(self):
-            return "SECTION 1\nThis is sample content for section 1.\n\nSECTION 2\nThis is sample content for section 2."
+            self.rotation = 0
+
+        def get_text(self, option="text", **kwargs):
+            lines = [
+                "SECTION 1",
+                "This is sample content for section 1.",
+                "SECTION 2",
+                "This is sample content for section 2.",
+            ]
+            return {
+                "blocks": [
+                    {
+                        "type": 0,
+                        "lines": [{"spans": [{"text": line}]} for line in lines],
+                    }
+                ]
+            }
 
     # Apply the monkeypatch
-    monkeypatch.setattr("pypdf.PdfReader", MockPdfReader)
+    monkeypatch.setattr("fitz.open", MockDocument)
 
     # Create a mock file to avoid FileNotFoundError
     if not os.path.exists(sample_pdf_path):
@@ -99,12 +115,12 @@ def test_pdf_analyzer_with_sample_pdf(sample_pdf_path, monkeypatch):
 def test_pdf_analyzer_error_handling(sample_pdf_path, monkeypatch):
     """Test PDF analyzer error handling."""
 
-    # Mock the open function to raise an exception
+    # Mock PyMuPDF to raise an exception
     def mock_open(*args, **kwargs):
         raise Exception("Test exception")
 
     # Apply the monkeypatch
-    monkeypatch.setattr("builtins.open", mock_open)
+    monkeypatch.setattr("fitz.open", mock_open)
 
     # Test the analyzer
     analyzer = PDFAnalyzer()
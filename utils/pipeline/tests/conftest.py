@@ -4,14 +4,19 @@ Pytest configuration file for the pipeline package.
 This file contains fixtures that can be used across multiple test files.
 """
 
+import copy
 import os
 import shutil
 import tempfile
-from typing import Any, Callable, Dict, Generator, List
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, List, Optional
 from unittest.mock import MagicMock
 
+import fitz
 import pytest
 
+from utils.pipeline.run_pipeline import DEFAULT_CONFIG
+
 # Define test data directory
 TEST_DATA_DIR = os.path.join(
     os.path.dirname(os.path.dirname(__file__)), "data", "tests"
@@ -64,6 +69,24 @@ def create_temp_file() -> Callable[[str, str], str]:
     return _create_temp_file
 
 
+@pytest.fixture
+def input_dir(request, tmp_path) -> Path:
+    """Create a directory of small one page PDFs, doc0.pdf, doc1.pdf and so on.
+
+    There are two unless the test parametrizes this fixture indirectly with
+    another number of files.
+    """
+    directory = tmp_path / "input"
+    directory.mkdir()
+    for i in range(getattr(request, "param", 2)):
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((72, 72), f"PROPOSAL {i}\n\nScope of work\nTotal $1,200.00")
+        doc.save(str(directory / f"doc{i}.pdf"))
+        doc.close()
+    return directory
+
+
 # ---- Sample Document Fixtures ----
 
 
@@ -91,6 +114,34 @@ def sample_text_path() -> str:
     return os.path.join(TEST_DATA_DIR, "text", "sample.txt")
 
 
+# ---- Configuration Factories ----
+
+
+@pytest.fixture
+def make_config() -> Callable[..., Dict[str, Any]]:
+    """Return a function that builds a copy of DEFAULT_CONFIG for batch runs.
+
+    Keyword arguments become the file processing options. `cache` enables the
+    result cache with the given options and `extractor` names a PDF extractor
+    from tests/core/slow_strategies.py.
+    """
+
+    def _make_config(
+        cache: Optional[Dict[str, Any]] = None,
+        extractor: Optional[str] = None,
+        **processing: Any,
+    ) -> Dict[str, Any]:
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config["file_processing"]["processing"] = processing
+        if cache is not None:
+            config["cache"] = {"enabled": True, **cache}
+        if extractor:
+            config["strategies"]["pdf"]["extractor"] = f"slow_strategies.{extractor}"
+        return config
+
+    return _make_config
+
+
 # ---- Mock Strategy Fixtures ----
 
 
@@ -0,0 +1,35 @@
+"""
+Extractors that misbehave, for the supervised processing tests.
+
+They are loaded by module path in a spawned child process.
+"""
+
+import os
+import time
+
+from utils.pipeline.processors.pdf_extractor import PDFExtractor
+
+
+class SlowExtractor(PDFExtractor):
+    """Never finishes."""
+
+    def extract(self, cleaned_data):
+        time.sleep(60)
+
+
+class HungryExtractor(PDFExtractor):
+    """Keeps allocating memory."""
+
+    def extract(self, cleaned_data):
+        chunks = []
+        for _ in range(64):
+            chunks.append(bytearray(32 * 1024 * 1024))
+            time.sleep(0.05)
+        time.sleep(60)
+
+
+class CrashingExtractor(PDFExtractor):
+    """Kills its process."""
+
+    def extract(self, cleaned_data):
+        os._exit(1)
@@ -0,0 +1,56 @@
+"""
+Tests for batch processing with the FileProcessor.
+"""
+
+import pytest
+from utils.pipeline.core.file_processor import FileProcessor
+
+
+@pytest.fixture
+def broken_file(input_dir):
+    """Replace doc2.pdf in the input directory by a file that isn't a PDF."""
+    (input_dir / "doc2.pdf").write_text("not a pdf")
+
+
+pytestmark = [
+    pytest.mark.parametrize("input_dir", [5], indirect=True),
+    pytest.mark.usefixtures("broken_file"),
+]
+
+
+def summarize(results):
+    return [(result["file"], result["status"]) for result in results]
+
+
+def test_parallel_matches_sequential(input_dir, tmp_path, make_config):
+    sequential = FileProcessor(input_dir, tmp_path / "sequential", make_config())
+    parallel = FileProcessor(
+        input_dir,
+        tmp_path / "parallel",
+        make_config(parallel=True, workers=2, batch_size=2),
+    )
+
+    expected = summarize(sequential.process_all_files())
+    results = parallel.process_all_files()
+
+    assert summarize(results) == expected
+    assert [status for _, status in expected].count("error") == 1
+    for result in results:
+        for output in result.get("outputs", []):
+            assert output.startswith(str(tmp_path / "parallel"))
+
+
+def test_parallel_stops_on_error(input_dir, tmp_path, make_config):
+    processor = FileProcessor(
+        input_dir,
+        tmp_path / "output",
+        make_config(parallel=True, workers=1, batch_size=1, continue_on_error=False),
+    )
+
+    results = processor.process_all_files()
+
+    assert summarize(results) == [
+        (str(input_dir / "doc0.pdf"), "success"),
+        (str(input_dir / "doc1.pdf"), "success"),
+        (str(input_dir / "doc2.pdf"), "error"),
+    ]
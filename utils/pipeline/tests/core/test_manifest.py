@@ -0,0 +1,98 @@
+"""
+Tests for the processing manifest and resumable batch runs.
+"""
+
+import json
+
+import pytest
+from utils.pipeline.core.file_processor import FileProcessor
+from utils.pipeline.core.manifest import ProcessingManifest
+
+
+def test_manifest_skips_torn_lines(tmp_path):
+    manifest = ProcessingManifest(tmp_path / "manifest.jsonl")
+    manifest.append({"file": "a.pdf", "status": "success", "input_hash": "1"})
+    with open(manifest.path, "a") as f:
+        f.write('{"file": "b.pdf", "sta')
+
+    resumed = ProcessingManifest(tmp_path / "manifest.jsonl")
+    resumed.append({"file": "c.pdf", "status": "error", "input_hash": "3"})
+    resumed.append({"file": "a.pdf", "status": "success", "input_hash": "4"})
+
+    assert [entry["file"] for entry in resumed.entries()] == [
+        "a.pdf",
+        "c.pdf",
+        "a.pdf",
+    ]
+    assert resumed.completed() == {"a.pdf": "4"}
+
+
+@pytest.mark.parametrize("input_dir", [4], indirect=True)
+def test_manifest_written_per_file(input_dir, tmp_path, make_config):
+    output_dir = tmp_path / "output"
+    processor = FileProcessor(input_dir, output_dir, make_config())
+    results = processor.process_all_files()
+
+    entries = list(processor.manifest.entries())
+    assert [entry["file"] for entry in entries] == [r["file"] for r in results]
+    for entry in entries:
+        assert entry["status"] == "success"
+        assert len(entry["input_hash"]) == 64
+        assert entry["duration"] >= 0
+        assert entry["outputs"]
+
+    with open(output_dir / "processing_report.json") as f:
+        report = json.load(f)
+    assert report["summary"]["total_files"] == 4
+    assert report["summary"]["successful"] == 4
+    assert len(report["details"]) == 4
+
+
+@pytest.mark.parametrize("input_dir", [4], indirect=True)
+def test_resume_after_crash(input_dir, tmp_path, monkeypatch, make_config):
+    output_dir = tmp_path / "output"
+    process_file = FileProcessor.process_file
+    processed = []
+
+    def crash_on_third_file(self, file):
+        if len(processed) == 2:
+            raise KeyboardInterrupt
+        processed.append(file.name)
+        return process_file(self, file)
+
+    monkeypatch.setattr(FileProcessor, "process_file", crash_on_third_file)
+    with pytest.raises(KeyboardInterrupt):
+        FileProcessor(input_dir, output_dir, make_config()).process_all_files()
+    monkeypatch.setattr(FileProcessor, "process_file", process_file)
+
+    # A completed file that changed since is processed again
+    (input_dir / "doc0.pdf").write_bytes((input_dir / "doc0.pdf").read_bytes() + b"\n")
+    processor = FileProcessor(input_dir, output_dir, make_config(resume=True))
+    results = processor.process_all_files()
+
+    assert [result["file"] for result in results] == [
+        str(input_dir / "doc0.pdf"),
+        str(input_dir / "doc2.pdf"),
+        str(input_dir / "doc3.pdf"),
+    ]
+    with open(output_dir / "processing_report.json") as f:
+        report = json.load(f)
+    assert report["summary"]["total_files"] == 4
+    assert report["summary"]["successful"] == 4
+    assert len(report["details"]) == 5
+
+    # Nothing left to do
+    assert processor.process_all_files() == []
+
+
+@pytest.mark.parametrize("input_dir", [4], indirect=True)
+def test_parallel_run_writes_manifest(input_dir, tmp_path, make_config):
+    processor = FileProcessor(
+        input_dir,
+        tmp_path / "output",
+        make_config(parallel=True, workers=2, batch_size=1),
+    )
+    results = processor.process_all_files()
+
+    files = sorted(entry["file"] for entry in processor.manifest.entries())
+    assert files == [result["file"] for result in results]
@@ -0,0 +1,134 @@
+"""
+Tests for the PDF document shared by the pipeline stages.
+"""
+
+import json
+from unittest.mock import patch
+
+import fitz
+import pytest
+from utils.pipeline.analyzer.pdf import PDFAnalyzer
+from utils.pipeline.cleaner.pdf import PDFCleaner
+from utils.pipeline.core.pdf_document import (
+    DOCUMENT_KEY,
+    PageLayout,
+    PDFDocument,
+    document_scope,
+)
+from utils.pipeline.pipeline import Pipeline
+from utils.pipeline.processors.pdf_extractor import PDFExtractor
+from utils.pipeline.run_pipeline import DEFAULT_CONFIG
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """A small two page PDF."""
+    path = tmp_path / "proposal.pdf"
+    doc = fitz.open()
+    doc.set_metadata({"title": "Proposal", "author": "Test Author"})
+    for number in range(2):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"SECTION {number}\nScope of work {number}")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_pdf_document(pdf_path):
+    with PDFDocument(pdf_path) as document:
+        assert document.metadata["title"] == "Proposal"
+        assert document.metadata["author"] == "Test Author"
+        texts = document.page_texts()
+        assert len(texts) == 2
+        assert "Scope of work 1" in texts[1]
+        assert document.page_texts() is texts
+    assert document.closed
+
+
+def test_page_layout(tmp_path):
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "TABLE 1: Schedule\nType\tSize")
+    page.insert_text((300, 400), "Inside")
+    page.draw_rect(fitz.Rect(290, 380, 400, 420))
+
+    layout = PageLayout(page)
+    assert layout.text == page.get_text("text")
+    assert layout.drawings is layout.drawings
+    assert len(layout.drawings) == 1
+    clipped = layout.clip((290, 380, 400, 420))
+    texts = [
+        span["text"]
+        for block in clipped["blocks"]
+        for line in block["lines"]
+        for span in line["spans"]
+    ]
+    assert texts == ["Inside"]
+    doc.close()
+
+
+def test_stages_read_each_page_once(pdf_path):
+    get_text = fitz.Page.get_text
+    calls = []
+
+    def counting_get_text(page, *args, **kwargs):
+        calls.append(page.number)
+        return get_text(page, *args, **kwargs)
+
+    with patch.object(fitz.Page, "get_text", counting_get_text), document_scope():
+        analysis = PDFAnalyzer().analyze(pdf_path)
+        extracted = PDFExtractor().extract(PDFCleaner().clean(analysis))
+
+    assert sorted(calls) == [0, 1]
+    assert extracted["sections"]
+
+
+def test_stages_share_one_document(pdf_path):
+    with patch("fitz.open", wraps=fitz.open) as fitz_open, document_scope():
+        analysis = PDFAnalyzer().analyze(pdf_path)
+        cleaned = PDFCleaner().clean(analysis)
+        extracted = PDFExtractor().extract(cleaned)
+        document = analysis[DOCUMENT_KEY]
+        assert not document.closed
+
+    assert fitz_open.call_count == 1
+    assert cleaned[DOCUMENT_KEY] is document
+    assert DOCUMENT_KEY not in extracted
+    assert document.closed
+    assert analysis["metadata"]["title"] == "Proposal"
+    assert len(analysis["pages"]) == 2
+    assert any("Scope of work 0" in s["content"] for s in extracted["sections"])
+
+
+def test_analyzer_closes_document_outside_scope(pdf_path):
+    close_document = PDFDocument.close
+    with patch.object(
+        PDFDocument, "close", autospec=True, side_effect=close_document
+    ) as close:
+        analysis = PDFAnalyzer().analyze(pdf_path)
+
+    close.assert_called_once()
+    assert DOCUMENT_KEY not in analysis
+    assert json.loads(json.dumps(analysis))["pages"]
+
+
+def test_extractor_opens_document_without_analyzer(pdf_path):
+    extracted = PDFExtractor().extract(
+        {"path": pdf_path, "metadata": {}, "sections": []}
+    )
+    assert extracted["sections"]
+
+
+def test_pipeline_closes_document(pdf_path):
+    opened = []
+
+    class TrackedDocument(PDFDocument):
+        def __init__(self, path):
+            super().__init__(path)
+            opened.append(self)
+
+    with patch("utils.pipeline.analyzer.pdf.PDFDocument", TrackedDocument):
+        Pipeline(dict(DEFAULT_CONFIG)).run(pdf_path, show_progress=False)
+
+    assert len(opened) == 1
+    assert opened[0].closed
@@ -0,0 +1,254 @@
+"""
+Tests for the pipeline result cache.
+"""
+
+import copy
+import json
+import os
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+from utils.pipeline.analyzer.pdf import PDFAnalyzer
+from utils.pipeline.core.file_processor import FileProcessor
+from utils.pipeline.core.pdf_document import DOCUMENT_KEY
+from utils.pipeline.core.result_cache import (
+    ResultCache,
+    StageMemo,
+    config_fingerprint,
+    file_digest,
+    stage_keys,
+)
+from utils.pipeline.pipeline import Pipeline
+from utils.pipeline.processors.pdf_extractor import PDFExtractor
+from utils.pipeline.run_pipeline import DEFAULT_CONFIG
+
+
+def test_key_depends_on_content_and_config(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    path = tmp_path / "doc.txt"
+    path.write_text("content")
+    digest = file_digest(path)
+    fingerprint = config_fingerprint(DEFAULT_CONFIG)
+    key = cache.key(digest, fingerprint)
+
+    assert cache.key(digest, config_fingerprint(copy.deepcopy(DEFAULT_CONFIG))) == key
+    assert cache.key(digest, config_fingerprint({"output_format": "markdown"})) != key
+    assert cache.key(digest, config_fingerprint({"cache": {"version": "2"}})) != (
+        cache.key(digest, config_fingerprint({}))
+    )
+    path.write_text("changed")
+    assert cache.key(file_digest(path), fingerprint) != key
+
+
+def test_get_and_put(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    assert cache.get("ab12") is None
+    assert cache.put("ab12", {"content": ["é"]})
+    assert cache.get("ab12") == {"content": ["é"]}
+    assert not cache.put("cd34", {"value": object()})
+    assert cache.get("cd34") is None
+
+
+def test_unreadable_entry_is_discarded(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    cache.put("ab12", {"content": []})
+    entry = tmp_path / "cache" / "ab" / "ab12.json"
+    entry.write_text("{truncated")
+    assert cache.get("ab12") is None
+    assert not entry.exists()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    entry_size = len(json.dumps({"data": "x" * 1000}))
+    cache = ResultCache(tmp_path / "cache", max_size_mb=3.5 * entry_size / 2**20)
+    for i, key in enumerate(["aa", "bb", "cc"]):
+        cache.put(key, {"data": "x" * 1000})
+        entry = tmp_path / "cache" / key[:2] / f"{key}.json"
+        os.utime(entry, (1000 + i, 1000 + i))
+    # Reading "aa" makes "bb" the least recently used entry
+    cache.get("aa")
+
+    cache.put("dd", {"data": "x" * 1000})
+
+    assert cache.get("bb") is None
+    assert cache.get("aa") is not None
+    assert cache.get("dd") is not None
+
+
+def test_pipeline_returns_cached_output(input_dir, tmp_path, make_config):
+    config = make_config(cache={"directory": str(tmp_path / "cache")})
+    path = str(input_dir / "doc0.pdf")
+    first = Pipeline(config).run(path, show_progress=False)
+
+    pipeline = Pipeline(config)
+    with patch.object(Pipeline, "_process") as process:
+        second = pipeline.run(path, show_progress=False)
+    process.assert_not_called()
+    assert pipeline.last_cache_hit
+    assert second == json.loads(json.dumps(first))
+
+    # Same content under another name
+    copied = tmp_path / "copy.pdf"
+    copied.write_bytes((input_dir / "doc0.pdf").read_bytes())
+    assert pipeline.run(str(copied), show_progress=False)["document"]["path"] == (
+        str(copied)
+    )
+
+
+def test_pipeline_refresh_recomputes(input_dir, tmp_path, make_config):
+    path = str(input_dir / "doc0.pdf")
+    Pipeline(make_config(cache={"directory": str(tmp_path / "cache")})).run(
+        path, show_progress=False
+    )
+
+    pipeline = Pipeline(
+        make_config(cache={"directory": str(tmp_path / "cache"), "refresh": True})
+    )
+    with patch.object(Pipeline, "_process", return_value={"content": []}) as process:
+        pipeline.run(path, show_progress=False)
+    process.assert_called_once()
+    assert not pipeline.last_cache_hit
+
+
+def test_ensemble_change_misses_cache(input_dir, tmp_path, make_config):
+    path = str(input_dir / "doc0.pdf")
+    config = make_config(cache={"directory": str(tmp_path / "cache")})
+    config["ensemble"] = {"classifier_weights": {"rule_based": 0.5}}
+    Pipeline(config).run(path, show_progress=False)
+
+    config["ensemble"]["classifier_weights"]["rule_based"] = 0.9
+    pipeline = Pipeline(config)
+    with patch.object(Pipeline, "_process", return_value={"content": []}) as process:
+        pipeline.run(path, show_progress=False)
+    process.assert_called_once()
+    assert not pipeline.last_cache_hit
+
+
+def test_file_processor_reuses_cached_outputs(input_dir, tmp_path, make_config):
+    output_dir = tmp_path / "output"
+    first = FileProcessor(
+        input_dir, output_dir, make_config(cache={})
+    ).process_all_files()
+    assert [result["cached"] for result in first] == [False, False]
+    assert (output_dir / ".pipeline_cache").is_dir()
+
+    (input_dir / "doc1.pdf").write_bytes((input_dir / "doc0.pdf").read_bytes() + b"\n")
+    second = FileProcessor(
+        input_dir, output_dir, make_config(cache={})
+    ).process_all_files()
+    assert [result["cached"] for result in second] == [True, False]
+    assert all(os.path.exists(output) for output in second[0]["outputs"])
+
+    with open(output_dir / "processing_report.json") as f:
+        assert json.load(f)["summary"]["cached"] == 1
+
+
+def test_stage_keys_chain_upstream_strategies():
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    keys = stage_keys("digest", config, "pdf")
+    config["strategies"]["pdf"]["extractor"] = "other.Extractor"
+    changed = stage_keys("digest", config, "pdf")
+    assert changed["analyze"] == keys["analyze"]
+    assert changed["clean"] == keys["clean"]
+    assert changed["extract"] != keys["extract"]
+
+    config["strategies"]["pdf"]["analyzer"] = "other.Analyzer"
+    assert stage_keys("digest", config, "pdf")["clean"] != keys["clean"]
+    assert stage_keys("other", config, "pdf")["analyze"] != changed["analyze"]
+
+
+def test_stage_memo_resumes_after_latest_cached_stage(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    keys = {"analyze": "aa", "clean": "bb", "extract": "cc"}
+    memo = StageMemo(cache, keys)
+    assert memo.resume_stage is None
+    document = object()
+    analysis = memo.run("analyze", lambda: {"pages": [], DOCUMENT_KEY: document})
+    assert analysis[DOCUMENT_KEY] is document
+    memo.run("clean", lambda: {"pages": ["clean"]})
+
+    resumed = StageMemo(cache, keys)
+    assert resumed.resume_stage == "clean"
+    assert resumed.run("analyze", pytest.fail) is None
+    assert resumed.run("clean", pytest.fail) == {"pages": ["clean"]}
+    assert resumed.run("extract", lambda: {"sections": []}) == {"sections": []}
+    assert cache.get_stage("aa") == {"pages": []}
+    assert StageMemo(cache, keys).resume_stage == "extract"
+    assert StageMemo(cache, keys, refresh=True).resume_stage is None
+
+
+def test_reclassification_skips_pdf_parsing(input_dir, tmp_path, make_config):
+    path = str(input_dir / "doc0.pdf")
+    config = make_config(cache={"directory": str(tmp_path / "cache")})
+    first = Pipeline(config).run(path, show_progress=False)
+
+    # A classification change misses the result cache but not the stage cache
+    config["enable_classification"] = False
+    with (
+        patch.object(PDFAnalyzer, "analyze") as analyze,
+        patch.object(PDFExtractor, "extract") as extract,
+    ):
+        second = Pipeline(config).run(path, show_progress=False)
+    analyze.assert_not_called()
+    extract.assert_not_called()
+    assert "document_type" not in second
+    assert second["content"] == first["content"]
+
+
+def test_extractor_change_reruns_extraction_only(
+    input_dir, tmp_path, monkeypatch, make_config
+):
+    path = str(input_dir / "doc0.pdf")
+    config = make_config(cache={"directory": str(tmp_path / "cache")})
+    first = Pipeline(config).run(path, show_progress=False)
+
+    class CustomExtractor(PDFExtractor):
+        calls = 0
+
+        def extract(self, cleaned_data):
+            CustomExtractor.calls += 1
+            return super().extract(cleaned_data)
+
+    module = types.ModuleType("custom_strategies")
+    module.CustomExtractor = CustomExtractor
+    monkeypatch.setitem(sys.modules, "custom_strategies", module)
+    config["strategies"]["pdf"]["extractor"] = "custom_strategies.CustomExtractor"
+    with patch.object(PDFAnalyzer, "analyze") as analyze:
+        second = Pipeline(config).run(path, show_progress=False)
+    analyze.assert_not_called()
+    assert CustomExtractor.calls == 1
+    assert second["content"] == first["content"]
+
+
+def test_resumed_stages_use_the_current_path(
+    input_dir, tmp_path, monkeypatch, make_config
+):
+    path = input_dir / "doc0.pdf"
+    config = make_config(cache={"directory": str(tmp_path / "cache")})
+    first = Pipeline(config).run(str(path), show_progress=False)
+
+    # Same content under a new name, other content under the old one
+    renamed = input_dir / "renamed.pdf"
+    os.replace(path, renamed)
+    os.replace(input_dir / "doc1.pdf", path)
+
+    # Resumes from the cached extract stage
+    config["enable_classification"] = False
+    output = Pipeline(config).run(str(renamed), show_progress=False)
+    assert output["document"]["path"] == str(renamed)
+
+    # Resumes from the cached clean stage, the extractor opens the file again
+    class CustomExtractor(PDFExtractor):
+        pass
+
+    module = types.ModuleType("custom_strategies")
+    module.CustomExtractor = CustomExtractor
+    monkeypatch.setitem(sys.modules, "custom_strategies", module)
+    config["strategies"]["pdf"]["extractor"] = "custom_strategies.CustomExtractor"
+    with patch.object(PDFAnalyzer, "analyze") as analyze:
+        output = Pipeline(config).run(str(renamed), show_progress=False)
+    analyze.assert_not_called()
+    assert output["document"]["path"] == str(renamed)
+    assert output["content"] == first["content"]
@@ -0,0 +1,79 @@
+"""
+Tests for per-file timeouts, memory limits and retries.
+"""
+
+import json
+import time
+
+from utils.pipeline.core.file_processor import FileProcessor
+from utils.pipeline.run_pipeline import DEFAULT_CONFIG
+
+
+def test_failed_file_is_retried(input_dir, tmp_path, monkeypatch, make_config):
+    config = make_config(error_handling={"retry_count": 2, "retry_delay": 0.01})
+    processor = FileProcessor(input_dir, tmp_path / "output", config)
+    process_file_once = FileProcessor._process_file_once
+    calls = []
+
+    def fail_once(self, file):
+        calls.append(file.name)
+        if len(calls) == 1:
+            return {"file": str(file), "status": "error", "error": "flaky"}
+        return process_file_once(self, file)
+
+    monkeypatch.setattr(FileProcessor, "_process_file_once", fail_once)
+    result = processor.process_file(input_dir / "doc0.pdf")
+
+    assert result["status"] == "success"
+    assert result["attempts"] == 2
+    assert calls == ["doc0.pdf", "doc0.pdf"]
+
+
+def test_hanging_file_times_out(input_dir, tmp_path, make_config):
+    output_dir = tmp_path / "output"
+    config = make_config(extractor="SlowExtractor", timeout=2)
+    processor = FileProcessor(input_dir, output_dir, config)
+
+    start = time.monotonic()
+    results = processor.process_all_files()
+
+    assert time.monotonic() - start < 30
+    assert [result["reason"] for result in results] == ["timeout", "timeout"]
+    with open(output_dir / "processing_report.json") as f:
+        summary = json.load(f)["summary"]
+    assert summary["failed"] == 2
+    assert summary["timed_out"] == 2
+
+
+def test_memory_limit_kills_worker(input_dir, tmp_path, make_config):
+    config = make_config(extractor="HungryExtractor", max_memory_mb=600)
+    processor = FileProcessor(input_dir, tmp_path / "output", config)
+    try:
+        result = processor.process_file(input_dir / "doc0.pdf")
+    finally:
+        processor.close()
+    assert result["status"] == "error"
+    assert result["reason"] == "memory"
+
+
+def test_crashed_worker_is_replaced(input_dir, tmp_path, make_config):
+    config = make_config(
+        extractor="CrashingExtractor",
+        timeout=30,
+        error_handling={"retry_count": 1, "retry_delay": 0.01},
+    )
+    processor = FileProcessor(input_dir, tmp_path / "output", config)
+    try:
+        result = processor.process_file(input_dir / "doc0.pdf")
+
+        assert result["reason"] == "crash"
+        assert result["attempts"] == 2
+
+        # A healthy worker processes the next file
+        processor.config["strategies"]["pdf"]["extractor"] = DEFAULT_CONFIG[
+            "strategies"
+        ]["pdf"]["extractor"]
+        processor.close()
+        assert processor.process_file(input_dir / "doc1.pdf")["status"] == "success"
+    finally:
+        processor.close()
@@ -0,0 +1,277 @@
+"""
+Tests for the document classifier execution modes.
+"""
+
+import threading
+import time
+
+import pytest
+from utils.pipeline.processors.document_classifier import DocumentClassifier
+from utils.pipeline.strategies.classifier_strategy import BaseClassifier
+
+DOCUMENT = {
+    "metadata": {"title": "Proposal"},
+    "content": [{"title": "Payment Terms", "content": "Total $1,200.00"}],
+    "tables": [],
+}
+
+
+class SlowClassifier(BaseClassifier):
+    """Takes longer than any budget in these tests."""
+
+    def classify(self, document_data, features):
+        time.sleep(self.config.get("delay", 2))
+        return {"document_type": "INVOICE", "confidence": 1.0}
+
+    def get_supported_types(self):
+        return ["INVOICE"]
+
+
+class FixedClassifier(BaseClassifier):
+    """Returns the type and confidence of its config, counting its calls."""
+
+    def classify(self, document_data, features):
+        self.calls = getattr(self, "calls", 0) + 1
+        return {
+            "document_type": self.config["document_type"],
+            "confidence": self.config["confidence"],
+        }
+
+    def get_supported_types(self):
+        return [self.config["document_type"]]
+
+
+def make_cascade(results, **ensemble):
+    """Classifier running the cascade over fixed (type, confidence) results."""
+    classifier = DocumentClassifier(
+        config={"ensemble": {"execution": "cascade", **ensemble}}
+    )
+    for name in classifier.factory.get_classifier_names():
+        classifier.remove_classifier(name)
+    for name, (doc_type, confidence) in results.items():
+        classifier.add_classifier(
+            name,
+            FixedClassifier,
+            {"document_type": doc_type, "confidence": confidence},
+        )
+    return classifier
+
+
+def make_classifier(**ensemble):
+    classifier = DocumentClassifier(config={"ensemble": ensemble})
+    classifier.add_classifier("slow", SlowClassifier, {"delay": 2})
+    return classifier
+
+
+def test_sequential_reports_latency():
+    classifier = DocumentClassifier()
+    result = classifier.classify(DOCUMENT)
+
+    assert set(result["classifier_latency"]) == {
+        "rule_based",
+        "pattern_matcher",
+        "ml_based",
+        "keyword_analyzer",
+    }
+    assert all(latency >= 0 for latency in result["classifier_latency"].values())
+    assert result["timed_out_classifiers"] == []
+
+
+def test_concurrent_drops_late_classifier():
+    classifier = make_classifier(execution="concurrent", classifier_timeout=0.5)
+
+    start = time.perf_counter()
+    result = classifier.classify(DOCUMENT)
+
+    assert time.perf_counter() - start < 1.5
+    assert result["timed_out_classifiers"] == ["slow"]
+    assert result["classifier_latency"]["slow"] >= 0.5
+    assert "slow" not in result["classifiers"]
+    assert result["document_type"] != "INVOICE"
+
+
+def test_concurrent_skips_classifier_still_running():
+    classifier = make_classifier(execution="concurrent", classifier_timeout=0.2)
+    earlier = set(threading.enumerate())
+
+    for _ in range(5):
+        result = classifier.classify(DOCUMENT)
+        assert result["timed_out_classifiers"] == ["slow"]
+
+    # Only the first document started the slow classifier
+    started = set(threading.enumerate()) - earlier
+    assert [thread.name for thread in started] == ["classifier-slow"]
+    assert result["classifier_latency"]["slow"] == 0
+
+
+def test_concurrent_matches_sequential():
+    sequential = DocumentClassifier().classify(DOCUMENT)
+    concurrent = DocumentClassifier(
+        config={"ensemble": {"execution": "concurrent"}}
+    ).classify(DOCUMENT)
+
+    for result in (sequential, concurrent):
+        result.pop("classifier_latency")
+    assert concurrent == sequential
+
+
+def test_per_classifier_budget():
+    classifier = make_classifier(
+        execution="concurrent",
+        classifier_timeout=0.2,
+        classifier_timeouts={"slow": 5},
+    )
+    result = classifier.classify(DOCUMENT)
+
+    assert result["timed_out_classifiers"] == []
+    assert "slow" in result["classifiers"]
+
+
+CASCADE_WEIGHTS = {"cheap": 0.9, "expensive": 0.3}
+
+
+def test_cascade_stops_when_settled():
+    classifier = make_cascade(
+        {"cheap": ("INVOICE", 0.95), "expensive": ("PROPOSAL", 0.9)},
+        classifier_weights=CASCADE_WEIGHTS,
+    )
+    classifier.classifier_costs = {"cheap": 0.001, "expensive": 1.0}
+
+    result = classifier.classify(DOCUMENT)
+
+    assert result["document_type"] == "INVOICE"
+    assert result["skipped_classifiers"] == ["expensive"]
+    assert list(result["classifier_latency"]) == ["cheap"]
+    assert not hasattr(classifier.factory.get_classifier("expensive"), "calls")
+
+
+def test_cascade_runs_cheapest_first():
+    classifier = make_cascade(
+        {"expensive": ("PROPOSAL", 0.95), "cheap": ("INVOICE", 0.95)},
+        classifier_weights=CASCADE_WEIGHTS,
+    )
+    classifier.classifier_costs = {"expensive": 1.0, "cheap": 0.001}
+
+    result = classifier.classify(DOCUMENT)
+
+    assert result["document_type"] == "INVOICE"
+    assert result["skipped_classifiers"] == ["expensive"]
+    # The measured latency replaces part of the running cost
+    assert classifier.classifier_costs["cheap"] < 0.001
+
+
+def test_cascade_continues_while_outcome_can_change():
+    classifier = make_cascade(
+        {
+            "first": ("INVOICE", 0.9),
+            "second": ("INVOICE", 0.9),
+            "third": ("PROPOSAL", 0.9),
+        },
+        classifier_weights={"first": 0.3, "second": 0.3, "third": 0.2},
+    )
+
+    result = classifier.classify(DOCUMENT)
+
+    # "first" is confident alone, but "second" and "third" could outvote it
+    assert list(result["classifier_latency"]) == ["first", "second"]
+    assert result["skipped_classifiers"] == ["third"]
+    assert result["document_type"] == "INVOICE"
+
+
+def test_cascade_continues_without_margin():
+    classifier = make_cascade(
+        {
+            "first": ("INVOICE", 0.9),
+            "second": ("INVOICE", 0.9),
+            "third": ("PROPOSAL", 0.9),
+        },
+        classifier_weights={"first": 0.3, "second": 0.3, "third": 0.2},
+        cascade_margin=0.7,
+    )
+
+    result = classifier.classify(DOCUMENT)
+
+    assert result["skipped_classifiers"] == []
+
+
+@pytest.mark.parametrize(
+    "results, weights",
+    [
+        ({"cheap": ("INVOICE", 0.95), "expensive": ("PROPOSAL", 0.9)}, {}),
+        (
+            {"cheap": ("INVOICE", 0.95), "expensive": ("PROPOSAL", 0.9)},
+            CASCADE_WEIGHTS,
+        ),
+        (
+            {
+                "first": ("INVOICE", 0.9),
+                "second": ("INVOICE", 0.9),
+                "third": ("INVOICE", 0.9),
+                "fourth": ("PROPOSAL", 0.9),
+            },
+            {},
+        ),
+        (
+            {
+                "first": ("INVOICE", 0.9),
+                "second": ("PROPOSAL", 0.6),
+                "third": ("PROPOSAL", 0.9),
+            },
+            {"first": 0.6},
+        ),
+    ],
+)
+def test_cascade_matches_sequential(results, weights):
+    sequential = make_cascade(
+        results, execution="sequential", classifier_weights=weights
+    ).classify(DOCUMENT)
+    cascade = make_cascade(results, classifier_weights=weights).classify(DOCUMENT)
+
+    assert cascade["document_type"] == sequential["document_type"]
+
+
+class BrokenClassifier(BaseClassifier):
+    """Fails on documents without a title."""
+
+    def classify(self, document_data, features):
+        return {
+            "document_type": document_data["metadata"]["title"].upper(),
+            "confidence": 1.0,
+        }
+
+    def get_supported_types(self):
+        return ["PROPOSAL"]
+
+
+def test_batch_matches_single():
+    documents = [
+        DOCUMENT,
+        {
+            "metadata": {"title": "Invoice"},
+            "content": [{"title": "Amount Due", "content": "Invoice no 42, 3 units"}],
+            "tables": [{"rows": [["Total", "$300.00"]]}],
+        },
+        {"metadata": {}, "content": [], "tables": []},
+    ]
+    classifier = DocumentClassifier()
+
+    single = [classifier.classify(document) for document in documents]
+    batch = classifier.classify_batch(documents)
+
+    for result in single + batch:
+        result.pop("classifier_latency")
+    assert batch == single
+
+
+def test_batch_isolates_failing_documents():
+    classifier = DocumentClassifier()
+    classifier.add_classifier("broken", BrokenClassifier)
+    documents = [DOCUMENT, {"metadata": {}, "content": [], "tables": []}, None]
+
+    results = classifier.classify_batch(documents)
+
+    assert "broken" in results[0]["classifiers"]
+    assert "broken" not in results[1]["classifiers"]
+    assert "rule_based" in results[1]["classifiers"]
+    assert results[2]["document_type"] == "UNKNOWN"
+    assert "error" in results[2]
@@ -0,0 +1,68 @@
+"""
+Tests for the keyword analyzer classifier.
+"""
+
+import re
+
+from utils.pipeline.processors.classifiers.keyword_analyzer import (
+    KeywordAnalyzerClassifier,
+)
+
+KEYWORD_GROUPS = {
+    "payment": ["Payment", "payment terms", "terms", "net 30", "30 days"],
+    "repeated": ["a a", "terms"],
+    "symbols": ["$", "c++", "x_y"],
+}
+
+TEXT = (
+    "net 30 days a a a $5 c++ code payment terms apply; terms. "
+    "payments x_y x_yz 30days netnet 30 "
+) * 3
+
+
+def make_classifier():
+    return KeywordAnalyzerClassifier(
+        config={
+            "keyword_analysis": {
+                "keyword_groups": KEYWORD_GROUPS,
+                "phrase_patterns": {"amounts": [r"\$\d+", r"net \d+"]},
+            }
+        }
+    )
+
+
+def test_keyword_counts_match_per_keyword_search():
+    frequencies = make_classifier()._analyze_keyword_frequencies(TEXT)
+
+    expected = {}
+    for group, keywords in KEYWORD_GROUPS.items():
+        counts = {
+            keyword: len(re.findall(r"\b" + re.escape(keyword.lower()) + r"\b", TEXT))
+            for keyword in keywords
+        }
+        counts = {keyword: count for keyword, count in counts.items() if count}
+        if counts:
+            expected[group] = counts
+    assert frequencies == expected
+    assert frequencies["payment"]["net 30"] == 3
+    assert frequencies["payment"]["30 days"] == 3
+    assert frequencies["payment"]["terms"] == 6
+    assert frequencies["repeated"]["a a"] == 3
+
+
+def test_phrase_patterns_are_precompiled():
+    classifier = make_classifier()
+    assert classifier._match_phrase_patterns(TEXT) == {
+        "amounts": ["$5"] * 3 + ["net 30"] * 6
+    }
+
+
+def test_no_keywords():
+    classifier = KeywordAnalyzerClassifier(config={})
+    assert classifier._analyze_keyword_frequencies(TEXT) == {}
+    assert classifier.classify({"content": [{"content": TEXT}]}, {}) == {
+        "document_type": "UNKNOWN",
+        "confidence": 0.0,
+        "schema_pattern": "unknown",
+        "key_features": [],
+    }
@@ -0,0 +1,56 @@
+"""
+Tests for the ML-based classifier.
+"""
+
+import pytest
+from utils.pipeline.processors.classifiers.ml_based import MLBasedClassifier
+
+
+def make_document(sections, tables=0, **features):
+    document = {
+        "metadata": {"title": "Document", "author": "Author"},
+        "content": [{"title": f"Section {i}", "content": ""} for i in range(sections)],
+        "tables": [{"rows": []}] * tables,
+    }
+    return document, {"section_count": sections, "table_count": tables, **features}
+
+
+def test_batch_matches_single():
+    pairs = [
+        make_document(0, has_payment_terms=True, has_delivery_terms=True),
+        make_document(2, tables=2, has_dollar_amounts=True, has_quantities=True),
+        make_document(1, tables=1, has_dollar_amounts=True),
+        make_document(3),
+    ]
+    classifier = MLBasedClassifier()
+
+    batch = classifier.classify_batch(
+        [document for document, _ in pairs], [features for _, features in pairs]
+    )
+
+    assert len(batch) == len(pairs)
+    for (document, features), result in zip(pairs, batch):
+        single = classifier.classify(document, features)
+        assert result["document_type"] == single["document_type"]
+        assert result["confidence"] == pytest.approx(single["confidence"])
+        assert isinstance(result["confidence"], float)
+    assert batch[0]["document_type"] == "PROPOSAL"
+    assert batch[0]["schema_pattern"] == "ml_proposal"
+    assert batch[3]["document_type"] == "UNKNOWN"
+
+
+def test_batch_isolates_failing_documents():
+    document, features = make_document(
+        0, has_payment_terms=True, has_delivery_terms=True
+    )
+    classifier = MLBasedClassifier()
+
+    results = classifier.classify_batch([document, document], [features, {}])
+
+    assert results[0]["document_type"] == "PROPOSAL"
+    assert results[1] == {
+        "document_type": "UNKNOWN",
+        "confidence": 0.0,
+        "schema_pattern": "unknown",
+        "key_features": [],
+    }
@@ -84,19 +84,33 @@ def test_pdf_extractor_with_sample_data(mock_fitz_open, sample_cleaned_data):
     mock_doc.__iter__.return_value = [mock_page, mock_page]
 
     # Configure mock page to return blocks for table detection
+    # Three rows of three columns, aligned on the span origins
+    rows = [
+        ["ITEM", "QUANTITY", "PRICE"],
+        ["Copper pipe", "2", "10.00"],
+        ["Ball valve", "1", "25.00"],
+    ]
     mock_blocks = {
         "blocks": [
             {
+                "type": 0,
                 "lines": [
-                    {"spans": [{"text": "Header 1"}, {"text": "Header 2"}]},
-                    {"spans": [{"text": "Data 1"}, {"text": "Data 2"}]},
-                    {"spans": [{"text": "Data 3"}, {"text": "Data 4"}]},
-                ]
+                    {
+                        "spans": [
+                            {
+                                "text": text,
+                                "origin": (72 + 100 * column, 100 + 12 * row),
+                            }
+                            for column, text in enumerate(cells)
+                        ]
+                    }
+                    for row, cells in enumerate(rows)
+                ],
             }
         ]
     }
-    mock_page.get_text.side_effect = (
-        lambda format_type: mock_blocks if format_type == "dict" else "Sample text"
+    mock_page.get_text.side_effect = lambda format_type, **kwargs: (
+        mock_blocks if format_type == "dict" else "Sample text"
     )
 
     # Configure mock fitz.open to return mock document
@@ -170,31 +184,20 @@ def test_pdf_extractor_table_extraction(mock_fitz_open, sample_cleaned_data):
     mock_doc = MagicMock()
     mock_page = MagicMock()
 
-    # Configure mock page to return text with table indicators
-    mock_page.get_text.return_value = (
-        "TABLE 1: Sample Table\nHeader 1\tHeader 2\nData 1\tData 2\nData 3\tData 4\n\n"
-    )
-
     # Configure mock document to return pages
     mock_doc.__iter__.return_value = [mock_page]
 
-    # Configure mock page to return blocks for table detection
-    mock_blocks = {
-        "blocks": [
-            {
-                "lines": [
-                    {"spans": [{"text": "Header 1"}, {"text": "Header 2"}]},
-                    {"spans": [{"text": "Data 1"}, {"text": "Data 2"}]},
-                    {"spans": [{"text": "Data 3"}, {"text": "Data 4"}]},
-                ]
-            }
-        ]
+    # Configure mock page to return the text layout with table indicators, the
+    # plain text is derived from it
+    lines = [
+        "TABLE 1: Sample Table",
+        "Header 1\tHeader 2",
+        "Data 1\tData 2",
+        "Data 3\tData 4",
+    ]
+    mock_page.get_text.return_value = {
+        "blocks": [{"lines": [{"spans": [{"text": line}]} for line in lines]}]
     }
-    mock_page.get_text.side_effect = (
-        lambda format_type: mock_blocks
-        if format_type == "dict"
-        else "TABLE 1: Sample Table\nHeader 1\tHeader 2\nData 1\tData 2\nData 3\tData 4\n\n"
-    )
 
     # Test the extractor
     extractor = PDFExtractor()
@@ -206,6 +206,58 @@ def test_strategy_selector_import_error():
     assert isinstance(strategy_set.formatter, MockStrategy)
 
 
+def test_strategy_selector_reuses_strategies():
+    """Test that strategies are created once per document type and config."""
+    config = {
+        "strategies": {
+            "pdf": {
+                "analyzer": "utils.pipeline.analyzer.pdf.PDFAnalyzer",
+                "cleaner": "utils.pipeline.cleaner.pdf.PDFCleaner",
+                "extractor": "utils.pipeline.processors.pdf_extractor.PDFExtractor",
+                "validator": "utils.pipeline.processors.pdf_validator.PDFValidator",
+            }
+        }
+    }
+    selector = StrategySelector(config)
+    strategy_set = selector.get_strategies("pdf")
+    assert selector.get_strategies("pdf") is strategy_set
+
+    # A changed strategy path creates new strategies
+    config["strategies"]["pdf"]["extractor"] = "nonexistent.Extractor"
+    changed = selector.get_strategies("pdf")
+    assert changed is not strategy_set
+    assert isinstance(changed.extractor, MockStrategy)
+
+
+def test_pipeline_reuses_classifier():
+    """Test that the document classifier is rebuilt only on config change."""
+    pipeline = Pipeline({"classifiers": {}})
+    document = {"metadata": {}, "content": [], "tables": []}
+    classifier = pipeline._get_classifier()
+    pipeline._classify_document(document)
+    assert pipeline._get_classifier() is classifier
+
+    pipeline.config["ensemble"] = {"voting_method": "majority"}
+    assert pipeline._get_classifier() is not classifier
+    assert pipeline._get_classifier().ensemble_manager.voting_method == "majority"
+
+
+def test_classifier_factory_shares_instances():
+    """Test that classifier instances are shared until their config changes."""
+    from utils.pipeline.processors.classifiers.rule_based import RuleBasedClassifier
+    from utils.pipeline.strategies.classifier_factory import ClassifierFactory
+
+    factory = ClassifierFactory()
+    factory.register_classifier("rule_based", RuleBasedClassifier)
+    classifier = factory.get_classifier("rule_based")
+    factory.get_available_classifiers()
+    assert factory.get_classifier("rule_based") is classifier
+    assert factory.create_classifier("rule_based") is not classifier
+
+    factory.update_classifier_config("rule_based", {"classification": {}})
+    assert factory.get_classifier("rule_based") is not classifier
+
+
 def test_mock_strategy_methods(tmp_path):
     """Test all methods of the MockStrategy class."""
     strategy = MockStrategy()